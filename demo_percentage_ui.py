@@ -220,9 +220,8 @@ class ResponsiveUIDemo:
                 element.render(text_renderer)
         
         # Render children
-        if hasattr(element, 'children'):
-            for child in element.children:
-                self._render_element(child, ui_renderer, text_renderer)
+        for child in element.children:
+            self._render_element(child, ui_renderer, text_renderer)
 
 
 def main():
@@ -3,7 +3,12 @@ Game Engine
 Import from engine.src for all engine components.
 """
 
-from .src import *
+from .src import __all__
 
 __version__ = '2.0.0'
 
+
+def __getattr__(name):
+    """Forward engine.X to engine.src.X, importing it on first access."""
+    from . import src
+    return getattr(src, name)
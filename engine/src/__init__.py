@@ -2,52 +2,103 @@
 Game Engine
 A modular OpenGL game engine with comprehensive features.
 Organized by functional categories.
-"""
-
-# Core
-from .core import Application, Window, Input, Keyboard, Mouse
 
-# Rendering
-from .rendering import OpenGLRenderer, ShadowMap, RenderPipeline
+Names are imported lazily (PEP 562): `from engine.src import GameScript`
+only loads the scene package, not PyOpenGL, FreeType or the audio stack.
+"""
 
-# Graphics
-from .graphics import (
-    Material, Texture, Mesh, Vertex, Model, ModelLoader,
-    Light, DirectionalLight, PointLight, SpotLight
-)
+import importlib
 
-# Audio
-from .audio import (
-    AudioManager, AudioClip, AudioSource, AudioListener,
-    Audio2D, Audio3D
-)
+# Public name -> subpackage that defines it
+_LAZY_IMPORTS = {
+    # Core
+    'Application': '.core',
+    'Window': '.core',
+    'Input': '.core',
+    'Keyboard': '.core',
+    'Mouse': '.core',
+    
+    # Rendering
+    'OpenGLRenderer': '.rendering',
+    'ShadowMap': '.rendering',
+    'RenderPipeline': '.rendering',
+    
+    # Graphics
+    'Material': '.graphics',
+    'Texture': '.graphics',
+    'Mesh': '.graphics',
+    'Vertex': '.graphics',
+    'Model': '.graphics',
+    'ModelLoader': '.graphics',
+    'Light': '.graphics',
+    'DirectionalLight': '.graphics',
+    'PointLight': '.graphics',
+    'SpotLight': '.graphics',
+    
+    # Audio
+    'AudioManager': '.audio',
+    'AudioClip': '.audio',
+    'AudioSource': '.audio',
+    'AudioListener': '.audio',
+    'Audio2D': '.audio',
+    'Audio3D': '.audio',
+    
+    # UI
+    'TextRenderer': '.ui',
+    'Text2D': '.ui',
+    'Text3DRenderer': '.ui',
+    'Text3D': '.ui',
+    'Font': '.ui',
+    'Glyph': '.ui',
+    'FontLoader': '.ui',
+    'UIElement': '.ui',
+    'Anchor': '.ui',
+    'UIManager': '.ui',
+    'UIButton': '.ui',
+    'UILabel': '.ui',
+    'UISlider': '.ui',
+    'UICheckbox': '.ui',
+    'UIDropdown': '.ui',
+    'UIPanel': '.ui',
+    
+    # Scene
+    'Scene': '.scene',
+    'SplashScene': '.scene',
+    'Entity': '.scene',
+    'GameObject': '.scene',
+    'Transform': '.scene',
+    'GameScript': '.scene',
+    'Camera': '.scene',
+    
+    # Systems
+    'SettingsManager': '.systems',
+    'SettingsPresets': '.systems',
+    'ThreadingManager': '.systems',
+    'TaskPriority': '.systems',
+    'AssetLoader': '.systems',
+    'AssetCache': '.systems',
+    
+    # Effects
+    'Particle': '.effects',
+    'ParticleEmitter': '.effects',
+    'ParticleRenderer': '.effects',
+    'ParticleSystem': '.effects',
+    'ParticlePresets': '.effects',
+}
 
-# UI
-from .ui import (
-    TextRenderer, Text2D, Text3DRenderer, Text3D,
-    Font, Glyph, FontLoader,
-    UIElement, Anchor, UIManager, UIButton, UILabel,
-    UISlider, UICheckbox, UIDropdown, UIPanel
-)
 
-# Scene
-from .scene import (
-    Scene, SplashScene, Entity, GameObject, Transform,
-    GameScript, Camera
-)
+def __getattr__(name):
+    """Import a public name from its subpackage on first access."""
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_LAZY_IMPORTS[name], __name__), name)
+    globals()[name] = value
+    return value
 
-# Systems
-from .systems import (
-    SettingsManager, SettingsPresets,
-    ThreadingManager, TaskPriority,
-    AssetLoader, AssetCache
-)
 
-# Effects
-from .effects import (
-    Particle, ParticleEmitter, ParticleRenderer,
-    ParticleSystem, ParticlePresets
-)
+def __dir__():
+    """Include lazily imported names."""
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
 
 __all__ = [
     # Core
@@ -6,6 +6,7 @@ Main application class that coordinates window and renderer.
 import sys
 import glfw
 import time
+from OpenGL.GL import glDisable, glIsEnabled, GL_CULL_FACE
 from .window import Window
 from .input import Input
 from ..rendering.renderer import OpenGLRenderer
@@ -19,6 +20,29 @@ from ..systems.settings_manager import SettingsManager
 from ..systems.threading_manager import ThreadingManager
 from ..systems.asset_loader import AssetLoader
 
+# Longest frame time handed to scripts, particles and audio; longer stalls
+# (texture uploads, window drags, breakpoints) are treated as one slow frame
+# instead of teleporting everything forward
+_MAX_FRAME_DT = 0.1
+
+# Frames between FPS log lines; the FPS shown is their average
+_FPS_REPORT_FRAMES = 120
+
+# Longest wait for events while the window is minimized, so the loop still
+# notices is_running turning False
+_ICONIFIED_WAIT = 0.1
+
+# Deferred texture slots a GameObject can carry until the OpenGL context
+# exists: (path attribute, log label, Material setter or None for the
+# diffuse texture, which goes on the model's meshes, channels to keep or
+# None for all; normal maps keep RG and the shader rebuilds Z)
+_DEFERRED_TEXTURES = (
+    ('_texture_path', 'diffuse texture', None, None),
+    ('_normal_map_path', 'normal map', 'set_normal_map', 2),
+    ('_roughness_map_path', 'roughness map', 'set_roughness_map', None),
+    ('_ao_map_path', 'AO map', 'set_ao_map', None),
+)
+
 
 class Application:
     """Main application class that manages the window and renderer."""
@@ -29,7 +53,8 @@ class Application:
         height: int = None,  # None = use settings
         title: str = None,  # None = use settings
         enable_validation: bool = False,
-        app_name: str = "game_engine"
+        app_name: str = "game_engine",
+        vsync: bool = None  # None = use settings
     ):
         """
         Initialize the Application.
@@ -40,6 +65,7 @@ class Application:
             title: Window title (None = use settings)
             enable_validation: Enable OpenGL debug output
             app_name: Application name for settings
+            vsync: Sync buffer swaps to the display refresh (None = use settings)
         """
         # Initialize settings FIRST
         self.settings = SettingsManager(app_name=app_name)
@@ -49,6 +75,7 @@ class Application:
         self.height = height or self.settings.get('window.height')
         self.title = title or self.settings.get('window.title')
         self.enable_validation = enable_validation or self.settings.get('engine.debug_mode')
+        self.vsync = self.settings.get('window.vsync') if vsync is None else vsync
         
         # Initialize threading system
         num_workers = self.settings.get('performance.worker_threads')
@@ -75,6 +102,7 @@ class Application:
         self.is_running = False
         self.framebuffer_resized = False
         self._ui_text_callback = None
+        self._frame_interval = 0.0  # Seconds per frame when sleep-limited, 0 = unlimited
         
         print(f"[Application] Using settings from: {self.settings.user_file}")
         print(f"[Application] Multithreading: {threading_enabled} ({num_workers} workers)")
@@ -97,13 +125,13 @@ class Application:
             return False
         
         # Apply window settings
-        vsync = self.settings.get('window.vsync')
-        if vsync:
+        if self.vsync:
             glfw.swap_interval(1)  # Enable VSync
             print("[OK] VSync enabled")
         else:
             glfw.swap_interval(0)  # Disable VSync
             print("[OK] VSync disabled")
+        self._update_frame_limit()
         
         # Create input manager
         self.input = Input(self.window.window)
@@ -113,6 +141,7 @@ class Application:
         self.window.set_mouse_callback(self._on_mouse_move)
         self.window.set_scroll_callback(self._on_mouse_scroll)
         self.window.set_mouse_button_callback(self._on_mouse_button)
+        self.window.set_key_callback(self.input.update_key)
         
         # Apply fullscreen setting (after callbacks are set up)
         fullscreen = self.settings.get('window.fullscreen', False)
@@ -138,6 +167,8 @@ class Application:
         if not self.text_renderer.init(self.window.width, self.window.height):
             print("ERROR: Failed to initialize TextRenderer")
             return False
+        # Text flushes read depth from the renderer's tracked state
+        self.text_renderer.gl_state = self.renderer.gl_state
         
         # Initialize UI Renderer - use window dimensions
         from ..ui.ui_renderer import UIRenderer
@@ -187,6 +218,20 @@ class Application:
         
         return True
     
+    def _update_frame_limit(self):
+        """
+        Work out how long each frame should take from the frame-rate settings.
+        
+        With VSync on, swap_buffers() already waits for the display, so the
+        loop is only sleep-limited (to graphics.target_fps) when VSync is off
+        and graphics.fps_limit is on.
+        """
+        target_fps = self.settings.get('graphics.target_fps') or 0
+        if self.vsync or not self.settings.get('graphics.fps_limit') or target_fps <= 0:
+            self._frame_interval = 0.0
+        else:
+            self._frame_interval = 1.0 / target_fps
+    
     def _register_settings_callbacks(self):
         """Register callbacks for settings changes."""
         if not self.settings:
@@ -196,10 +241,19 @@ class Application:
         def on_vsync_change(new_value, old_value):
             import glfw
             glfw.swap_interval(1 if new_value else 0)
+            self.vsync = new_value
+            self._update_frame_limit()
             print(f"[Settings] VSync changed: {old_value} -> {new_value}")
         
         self.settings.register_callback('window.vsync', on_vsync_change)
         
+        # Frame limit callbacks
+        def on_frame_limit_change(new_value, old_value):
+            self._update_frame_limit()
+        
+        self.settings.register_callback('graphics.fps_limit', on_frame_limit_change)
+        self.settings.register_callback('graphics.target_fps', on_frame_limit_change)
+        
         # Fullscreen callback
         def on_fullscreen_change(new_value, old_value):
             if self.window:
@@ -227,97 +281,73 @@ class Application:
         
         print("[Application] Settings callbacks registered (live updates enabled)")
     
+    def preload_textures(self, scene: Scene):
+        """
+        Start decoding a scene's deferred textures on worker threads.
+        
+        Image decoding needs no OpenGL context, so it can overlap with
+        init() and the splash screen. _load_deferred_textures() then only
+        uploads the decoded pixels.
+        
+        Args:
+            scene: Scene whose game objects carry deferred texture paths
+        """
+        if not self.threading_manager.enabled:
+            return
+        
+        from ..graphics.texture import Texture
+        
+        for game_object in scene.game_objects:
+            for attr, label, _, channels in _DEFERRED_TEXTURES:
+                path = getattr(game_object, attr)
+                if path is None:
+                    continue
+                if game_object._pending_textures is None:
+                    game_object._pending_textures = {}
+                game_object._pending_textures[attr] = self.threading_manager.load_asset_async(
+                    Texture.decode, path, channels
+                )
+                print(f"[TEXTURE LOADING] Decoding {label} for '{game_object.name}' in background: {path}")
+    
     def _load_deferred_textures(self):
-        """Load textures for objects after OpenGL context is created."""
+        """
+        Attach deferred textures to objects once the OpenGL context exists.
+        
+        Textures are attached as LazyTextures: each one is uploaded the
+        first frame its object survives frustum culling, using the
+        background decode from preload_textures() when there is one.
+        """
         if not self.renderer or not self.renderer.scene:
             return
         
         from ..graphics.texture import Texture
-        print("\n[TEXTURE LOADING] Loading deferred textures...")
+        print("\n[TEXTURE LOADING] Attaching deferred textures...")
         
         for game_object in self.renderer.scene.game_objects:
-            # Load diffuse texture
-            if hasattr(game_object, '_texture_path') and game_object._texture_path:
-                texture_path = game_object._texture_path
-                print(f"[TEXTURE LOADING] Loading diffuse texture for '{game_object.name}': {texture_path}")
+            pending = game_object._pending_textures or {}
+            
+            for attr, label, material_setter, channels in _DEFERRED_TEXTURES:
+                path = getattr(game_object, attr)
+                if path is None:
+                    continue
                 
-                try:
-                    texture = Texture(texture_path)
-                    print(f"[TEXTURE LOADING] [OK] Loaded: ID={texture.texture_id}, Size={texture.width}x{texture.height}")
-                    
-                    # Apply texture to all meshes in the object's model
+                texture = Texture.from_path_lazy(path, pending.pop(attr, None), channels)
+                print(f"[TEXTURE LOADING] {label} for '{game_object.name}' loads on first view: {path}")
+                
+                if material_setter is None:
+                    # Diffuse texture goes on every mesh of the object's model
                     if game_object.model:
                         for mesh in game_object.model.meshes:
                             mesh.texture = texture
                         print(f"[TEXTURE LOADING] Applied texture to {len(game_object.model.meshes)} mesh(es)")
-                    
-                    # Clear the deferred texture path
-                    del game_object._texture_path
-                    
-                except Exception as e:
-                    print(f"[TEXTURE LOADING] [ERROR] Failed to load texture: {e}")
-            
-            # Load normal map
-            if hasattr(game_object, '_normal_map_path') and game_object._normal_map_path:
-                normal_map_path = game_object._normal_map_path
-                print(f"[TEXTURE LOADING] Loading normal map for '{game_object.name}': {normal_map_path}")
-                
-                try:
-                    normal_map = Texture(normal_map_path)
-                    print(f"[TEXTURE LOADING] [OK] Loaded normal map: ID={normal_map.texture_id}")
-                    
-                    # Apply normal map to material
-                    if game_object.material:
-                        game_object.material.set_normal_map(normal_map)
-                        print(f"[TEXTURE LOADING] Applied normal map to material")
-                    
-                    # Clear the deferred normal map path
-                    del game_object._normal_map_path
-                    
-                except Exception as e:
-                    print(f"[TEXTURE LOADING] [ERROR] Failed to load normal map: {e}")
-            
-            # Load roughness map
-            if hasattr(game_object, '_roughness_map_path') and game_object._roughness_map_path:
-                roughness_map_path = game_object._roughness_map_path
-                print(f"[TEXTURE LOADING] Loading roughness map for '{game_object.name}': {roughness_map_path}")
+                elif game_object.material:
+                    getattr(game_object.material, material_setter)(texture)
+                    print(f"[TEXTURE LOADING] Applied {label} to material")
                 
-                try:
-                    roughness_map = Texture(roughness_map_path)
-                    print(f"[TEXTURE LOADING] [OK] Loaded roughness map: ID={roughness_map.texture_id}")
-                    
-                    # Apply roughness map to material
-                    if game_object.material:
-                        game_object.material.set_roughness_map(roughness_map)
-                        print(f"[TEXTURE LOADING] Applied roughness map to material")
-                    
-                    # Clear the deferred roughness map path
-                    del game_object._roughness_map_path
-                    
-                except Exception as e:
-                    print(f"[TEXTURE LOADING] [ERROR] Failed to load roughness map: {e}")
-            
-            # Load AO map
-            if hasattr(game_object, '_ao_map_path') and game_object._ao_map_path:
-                ao_map_path = game_object._ao_map_path
-                print(f"[TEXTURE LOADING] Loading AO map for '{game_object.name}': {ao_map_path}")
-                
-                try:
-                    ao_map = Texture(ao_map_path)
-                    print(f"[TEXTURE LOADING] [OK] Loaded AO map: ID={ao_map.texture_id}")
-                    
-                    # Apply AO map to material
-                    if game_object.material:
-                        game_object.material.set_ao_map(ao_map)
-                        print(f"[TEXTURE LOADING] Applied AO map to material")
-                    
-                    # Clear the deferred AO map path
-                    del game_object._ao_map_path
-                    
-                except Exception as e:
-                    print(f"[TEXTURE LOADING] [ERROR] Failed to load AO map: {e}")
+                # Clear the deferred path
+                setattr(game_object, attr, None)
         
-        print("[TEXTURE LOADING] Texture loading complete\n")
+        print("[TEXTURE LOADING] Deferred textures attached\n")
     
     def set_scene(self, scene: Scene):
         """
@@ -329,6 +359,8 @@ class Application:
         if self.renderer:
             self.renderer.set_scene(scene)
         
+        scene.on_enter()
+        
         # Update screen size for splash scenes
         if hasattr(scene, 'set_screen_size'):
             scene.set_screen_size(self.width, self.height)
@@ -343,8 +375,7 @@ class Application:
                     # Pre-spawn some particles for immediate visibility
                     for emitter in scene.particle_system.emitters.values():
                         emitter.is_emitting = True
-                        for _ in range(20):
-                            emitter._spawn_particle()
+                        emitter.spawn_burst(20)
                     print(f"[OK] Pre-spawned particles in {len(scene.particle_system.emitters)} emitters")
                 else:
                     print("[ERROR] Failed to initialize particle system!")
@@ -436,8 +467,7 @@ class Application:
                 # Pre-spawn some particles for immediate visibility
                 for emitter in scene.particle_system.emitters.values():
                     emitter.is_emitting = True
-                    for _ in range(20):
-                        emitter._spawn_particle()
+                    emitter.spawn_burst(20)
                 print(f"[OK] Pre-spawned particles in {len(scene.particle_system.emitters)} emitters")
             else:
                 print("[ERROR] Failed to initialize particle system!")
@@ -474,46 +504,72 @@ class Application:
         print("-" * 60)
         
         frame_count = 0
-        last_time = time.time()
-        tab_pressed = False
-        c_pressed = False
-        p_pressed = False
+        last_time = time.perf_counter()
+        report_time = last_time  # Start of the current FPS averaging window
+        report_frames = 0  # Frames rendered since report_time
+        
+        # Components don't change while the loop runs, so look them up once;
+        # the scene can (P key, splash transition) and is re-read every frame
+        window = self.window
+        input_manager = self.input
+        renderer = self.renderer
+        audio_listener = self.audio_listener
+        audio_manager = self.audio_manager if self.audio_manager and self.audio_manager.initialized else None
+        should_close = window.should_close
+        poll_events = window.poll_events
+        reset_input = input_manager.reset_per_frame
+        keyboard = input_manager.keyboard
+        update_key_edges = keyboard.update_edges
+        keys_down = keyboard.keys
+        keys_pressed = keyboard.pressed  # Updated in place each frame
+        mouse = input_manager.mouse
         
         try:
-            while self.is_running and not self.window.should_close():
+            while self.is_running and not should_close():
+                # Minimized: nothing is visible, so skip scripts and rendering
+                # and sleep until the window is restored
+                if window.is_iconified:
+                    window.wait_events(_ICONIFIED_WAIT)
+                    # Restart frame timing and the FPS window so neither the
+                    # first frame back nor the next FPS report counts the
+                    # whole minimized time
+                    last_time = time.perf_counter()
+                    report_time = last_time
+                    report_frames = 0
+                    continue
+                
                 # Calculate delta time
-                current_time = time.time()
-                delta_time = current_time - last_time
+                current_time = time.perf_counter()
+                frame_time = current_time - last_time
+                delta_time = min(frame_time, _MAX_FRAME_DT)
                 last_time = current_time
                 
                 # Reset per-frame input
-                self.input.reset_per_frame()
+                reset_input()
                 
                 # Poll events
-                self.window.poll_events()
+                poll_events()
+                update_key_edges()
                 
                 # === INPUT HANDLING ===
                 
                 # Check for ESC key
-                if self.input.keyboard.is_key_pressed(glfw.KEY_ESCAPE):
+                if keys_down[glfw.KEY_ESCAPE]:
                     print("\nESC pressed - exiting...")
                     self.is_running = False
                     break
                 
                 # Toggle mouse capture with TAB
-                tab_current = self.input.keyboard.is_key_pressed(glfw.KEY_TAB)
-                if tab_current and not tab_pressed:
-                    self.input.mouse.captured = not self.input.mouse.captured
-                    self.window.capture_mouse(self.input.mouse.captured)
-                    status = "enabled" if self.input.mouse.captured else "disabled"
+                if keys_pressed[glfw.KEY_TAB]:
+                    mouse.captured = not mouse.captured
+                    window.capture_mouse(mouse.captured)
+                    status = "enabled" if mouse.captured else "disabled"
                     print(f"Mouse look {status}")
-                tab_pressed = tab_current
                 
                 # Switch camera with C key
-                c_current = self.input.keyboard.is_key_pressed(glfw.KEY_C)
-                if c_current and not c_pressed:
-                    if self.renderer and self.renderer.scene:
-                        scene = self.renderer.scene
+                if keys_pressed[glfw.KEY_C]:
+                    scene = renderer.scene if renderer else None
+                    if scene:
                         if scene.camera_count > 1:
                             # Switch to next camera
                             next_index = (scene.active_camera_index + 1) % scene.camera_count
@@ -521,67 +577,67 @@ class Application:
                             active_cam = scene.get_active_camera()
                             cam_name = active_cam.name if active_cam else "Unknown"
                             print(f"Switched to camera {next_index}: '{cam_name}'")
-                c_pressed = c_current
                 
                 # Toggle settings menu with P key
-                p_current = self.input.keyboard.is_key_pressed(glfw.KEY_P)
-                if p_current and not p_pressed:
+                if keys_pressed[glfw.KEY_P]:
                     if hasattr(self, '_settings_menu_scene') and hasattr(self, '_main_scene'):
-                        current_scene = self.renderer.scene if self.renderer else None
+                        current_scene = renderer.scene if renderer else None
                         if current_scene == self._settings_menu_scene:
                             # Return to main scene
                             print("Closing settings menu...")
-                            self.renderer.set_scene(self._main_scene)
+                            self.set_scene(self._main_scene)
                         else:
-                            # Open settings menu
+                            # Open settings menu (its on_enter builds the UI)
                             print("Opening settings menu...")
-                            # Initialize UI if not already done
-                            if not self._settings_menu_scene._initialized:
-                                self._settings_menu_scene.initialize_ui(self.width, self.height)
-                                self._settings_menu_scene._initialized = True
-                            self.renderer.set_scene(self._settings_menu_scene)
-                p_pressed = p_current
+                            self.set_scene(self._settings_menu_scene)
                 
                 # === UPDATE SCRIPTS ===
                 # Pass input reference to all scripts and update them
-                if self.renderer and self.renderer.scene:
-                    # Set input reference for all entity scripts
-                    for entity in self.renderer.scene.get_all_entities():
-                        for script in entity.scripts:
-                            if hasattr(script, 'input'):
-                                script.input = self.input
-                    
-                    # Set input reference for global scripts
-                    for script in self.renderer.scene.scripts:
-                        if hasattr(script, 'input'):
-                            script.input = self.input
+                scene = renderer.scene if renderer else None
+                if scene:
+                    # Set input reference for all scripts (only does work when
+                    # the input or the scene's scripts changed)
+                    scene.set_script_input(input_manager)
                     
                     # Update all scripts (handles camera movement via CameraMovementScript)
-                    self.renderer.scene.update_scripts(delta_time)
+                    scene.update_scripts(delta_time)
                     
                     # Update particle system if scene has one
-                    if hasattr(self.renderer.scene, 'particle_system') and self.renderer.scene.particle_system:
-                        self.renderer.scene.particle_system.update(delta_time)
+                    particle_system = getattr(scene, 'particle_system', None)
+                    if particle_system:
+                        particle_system.update(delta_time)
                     
                     # Update audio listener to match active camera
-                    active_camera = self.renderer.scene.get_active_camera()
-                    if active_camera and self.audio_listener:
-                        self.audio_listener.attach_to_camera(active_camera)
+                    active_camera = scene.get_active_camera()
+                    if active_camera and audio_listener:
+                        audio_listener.attach_to_camera(active_camera)
                     
                     # Update all audio sources
-                    if self.audio_manager and self.audio_manager.initialized:
-                        audio_sources = self.renderer.scene.get_active_audio_sources()
-                        self.audio_manager.update_audio_sources(audio_sources, delta_time)
+                    if audio_manager:
+                        audio_sources = scene.get_active_audio_sources()
+                        audio_manager.update_audio_sources(audio_sources, delta_time)
                 
                 # Render frame
                 self._render_frame()
                 
                 frame_count += 1
+                report_frames += 1
                 
-                # Debug: print progress and FPS
-                if frame_count % 120 == 0:
-                    fps = 1.0 / delta_time if delta_time > 0 else 0
+                # Debug: print progress and FPS, averaged over the last
+                # _FPS_REPORT_FRAMES frames rather than the latest one
+                if report_frames == _FPS_REPORT_FRAMES:
+                    elapsed = current_time - report_time
+                    fps = report_frames / elapsed if elapsed > 0 else 0
+                    report_time = current_time
+                    report_frames = 0
                     print(f"[INFO] Frames: {frame_count}, FPS: {fps:.1f}")
+                
+                # Without VSync, sleep off the rest of the frame instead of
+                # spinning through frames nobody sees
+                if self._frame_interval:
+                    remaining = self._frame_interval - (time.perf_counter() - current_time)
+                    if remaining > 0:
+                        time.sleep(remaining)
                     
         except Exception as e:
             import traceback
@@ -640,7 +696,6 @@ class Application:
             
             # CRITICAL: Disable culling before UI rendering
             # 3D rendering may have enabled it, but UI should never be culled
-            from OpenGL.GL import glDisable, glIsEnabled, GL_CULL_FACE
             cull_state_before = glIsEnabled(GL_CULL_FACE)
             glDisable(GL_CULL_FACE)
             if cull_state_before:
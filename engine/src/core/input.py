@@ -4,7 +4,8 @@ Handles keyboard and mouse input management.
 """
 
 import glfw
-from typing import Optional
+import numpy as np
+from typing import Optional, Sequence
 
 
 class Keyboard:
@@ -18,6 +19,44 @@ class Keyboard:
             window: GLFW window handle
         """
         self.window = window
+        
+        # One byte per GLFW key, indexed by key constant. Filled from key
+        # events once the window delivers them (see update_key); until
+        # then key queries poll GLFW instead
+        self.keys = np.zeros(glfw.KEY_LAST + 1, dtype=np.uint8)
+        self.pressed = np.zeros_like(self.keys)  # Went down since the last update_edges()
+        self._prev_keys = np.zeros_like(self.keys)
+        self._tapped = np.zeros_like(self.keys)  # Pressed since the last update_edges(), even if released again
+        self._from_events = False
+    
+    def update_key(self, key: int, action: int):
+        """
+        Record a key event.
+        
+        Args:
+            key: GLFW key constant (glfw.KEY_UNKNOWN is ignored)
+            action: glfw.PRESS, glfw.REPEAT or glfw.RELEASE
+        """
+        if key < 0 or key > glfw.KEY_LAST:
+            return
+        self._from_events = True
+        if action == glfw.RELEASE:
+            self.keys[key] = 0
+        else:
+            self.keys[key] = 1
+            self._tapped[key] = 1
+    
+    def update_edges(self):
+        """
+        Work out which keys went down since the last call (call once per
+        frame, after polling events); the result is in self.pressed.
+        """
+        # A key counts as pressed if it is down now or was tapped during the
+        # poll, and was not down last frame
+        np.bitwise_or(self.keys, self._tapped, out=self.pressed)
+        np.bitwise_and(self.pressed, ~self._prev_keys, out=self.pressed)
+        self._prev_keys[:] = self.keys
+        self._tapped.fill(0)
     
     def is_key_pressed(self, key: int) -> bool:
         """
@@ -29,11 +68,39 @@ class Keyboard:
         Returns:
             True if key is pressed, False otherwise
         """
+        if self._from_events:
+            return bool(self.keys[key])
         return glfw.get_key(self.window, key) == glfw.PRESS
     
     def is_key_released(self, key: int) -> bool:
         """Check if a key is currently released."""
-        return glfw.get_key(self.window, key) == glfw.RELEASE
+        return not self.is_key_pressed(key)
+    
+    def was_key_pressed(self, key: int) -> bool:
+        """Check if a key went down since the previous frame."""
+        return bool(self.pressed[key])
+    
+    def get_keys_down(self, keys: Sequence[int]) -> np.ndarray:
+        """
+        Look up several keys at once.
+        
+        Args:
+            keys: GLFW key constants
+            
+        Returns:
+            uint8 array, 1 where the matching key is pressed
+        """
+        if self._from_events:
+            return np.take(self.keys, keys)
+        
+        get_key = glfw.get_key
+        window = self.window
+        press = glfw.PRESS
+        return np.fromiter(
+            (get_key(window, key) == press for key in keys),
+            dtype=np.uint8,
+            count=len(keys)
+        )
 
 
 class Mouse:
@@ -129,12 +196,19 @@ class Input:
         """Update mouse position."""
         self.mouse.update_position(xpos, ypos)
     
+    def update_key(self, key: int, action: int, mods: int = 0):
+        """Record a key event."""
+        self.keyboard.update_key(key, action)
+    
     def update_scroll(self, xoffset: float, yoffset: float):
-        """Update scroll offset."""
-        self.scroll_offset = yoffset
+        """Add scroll ticks to this frame's scroll offset."""
+        self.scroll_offset += yoffset
     
     def reset_per_frame(self):
         """Reset per-frame input state (call at start of each frame)."""
         self.scroll_offset = 0.0
-        # Don't reset mouse offset here - it's managed by the mouse movement callback
+        # The window delivers at most one (coalesced) mouse move per frame,
+        # so the offset it sets is the whole frame's motion; without one
+        # the mouse did not move
+        self.mouse.reset_offset()
 
@@ -27,7 +27,14 @@ class Window:
         self._mouse_callback: Optional[Callable] = None
         self._scroll_callback: Optional[Callable] = None
         self._mouse_button_callback: Optional[Callable] = None
+        self._key_callback: Optional[Callable] = None
         self.mouse_captured = False
+        self.is_iconified = False  # Minimized; kept current by GLFW's iconify callback
+        
+        # Cursor and scroll events arriving during poll_events(), coalesced
+        # into one callback each: latest position, summed scroll
+        self._pending_cursor: Optional[tuple] = None
+        self._pending_scroll: Optional[tuple] = None
         
     def init(self) -> bool:
         """
@@ -73,6 +80,8 @@ class Window:
         glfw.set_cursor_pos_callback(self.window, Window._mouse_callback_internal)
         glfw.set_scroll_callback(self.window, Window._scroll_callback_internal)
         glfw.set_mouse_button_callback(self.window, Window._mouse_button_callback_internal)
+        glfw.set_key_callback(self.window, Window._key_callback_internal)
+        glfw.set_window_iconify_callback(self.window, Window._iconify_callback_internal)
         
         print(f"[OK] Window created: {self.width}x{self.height}")
         return True
@@ -86,29 +95,53 @@ class Window:
     
     @staticmethod
     def _mouse_callback_internal(window, xpos: float, ypos: float):
-        """Internal callback for mouse movement."""
+        """
+        Internal callback for mouse movement.
+        
+        High-rate mice report thousands of moves per second; only the
+        latest position is kept and delivered once by poll_events().
+        """
         window_obj = glfw.get_window_user_pointer(window)
-        if window_obj and window_obj._mouse_callback:
-            # Always send mouse move events (not just when captured)
-            # This is needed for UI interaction (sliders, hover, etc.)
-            window_obj._mouse_callback(xpos, ypos)
+        if window_obj:
+            window_obj._pending_cursor = (xpos, ypos)
     
     @staticmethod
     def _scroll_callback_internal(window, xoffset: float, yoffset: float):
-        """Internal callback for mouse scroll."""
+        """Internal callback for mouse scroll (summed until poll_events() ends)."""
         window_obj = glfw.get_window_user_pointer(window)
-        if window_obj and window_obj._scroll_callback:
-            window_obj._scroll_callback(xoffset, yoffset)
+        if window_obj:
+            pending = window_obj._pending_scroll
+            if pending is not None:
+                xoffset += pending[0]
+                yoffset += pending[1]
+            window_obj._pending_scroll = (xoffset, yoffset)
     
     @staticmethod
     def _mouse_button_callback_internal(window, button: int, action: int, mods: int):
         """Internal callback for mouse button events."""
         window_obj = glfw.get_window_user_pointer(window)
         if window_obj and window_obj._mouse_button_callback:
+            # Deliver the move that led up to the click first, so UI sees
+            # events in order
+            window_obj._flush_pending_input()
             # Get current mouse position
             xpos, ypos = glfw.get_cursor_pos(window)
             window_obj._mouse_button_callback(button, action, mods, xpos, ypos)
     
+    @staticmethod
+    def _key_callback_internal(window, key: int, scancode: int, action: int, mods: int):
+        """Internal callback for keyboard events."""
+        window_obj = glfw.get_window_user_pointer(window)
+        if window_obj and window_obj._key_callback:
+            window_obj._key_callback(key, action, mods)
+    
+    @staticmethod
+    def _iconify_callback_internal(window, iconified: int):
+        """Internal callback for the window being minimized or restored."""
+        window_obj = glfw.get_window_user_pointer(window)
+        if window_obj:
+            window_obj.is_iconified = bool(iconified)
+    
     def set_resize_callback(self, callback: Callable[[int, int], None]):
         """
         Set a callback for window resize events.
@@ -145,6 +178,15 @@ class Window:
         """
         self._mouse_button_callback = callback
     
+    def set_key_callback(self, callback: Callable[[int, int, int], None]):
+        """
+        Set a callback for keyboard events.
+        
+        Args:
+            callback: Function that takes (key, action, mods) as parameters
+        """
+        self._key_callback = callback
+    
     def capture_mouse(self, capture: bool = True):
         """
         Capture or release the mouse cursor.
@@ -163,8 +205,36 @@ class Window:
         return glfw.window_should_close(self.window)
     
     def poll_events(self):
-        """Poll for window events."""
+        """Poll for window events, then deliver coalesced mouse input."""
         glfw.poll_events()
+        self._flush_pending_input()
+    
+    def wait_events(self, timeout: float):
+        """
+        Sleep until events arrive or the timeout passes, then deliver
+        coalesced mouse input like poll_events().
+        
+        Args:
+            timeout: Longest time to wait (seconds)
+        """
+        glfw.wait_events_timeout(timeout)
+        self._flush_pending_input()
+    
+    def _flush_pending_input(self):
+        """Send pending cursor and scroll events to their callbacks once."""
+        cursor = self._pending_cursor
+        if cursor is not None:
+            self._pending_cursor = None
+            # Always send mouse move events (not just when captured)
+            # This is needed for UI interaction (sliders, hover, etc.)
+            if self._mouse_callback:
+                self._mouse_callback(*cursor)
+        
+        scroll = self._pending_scroll
+        if scroll is not None:
+            self._pending_scroll = None
+            if self._scroll_callback:
+                self._scroll_callback(*scroll)
     
     def get_key(self, key: int) -> int:
         """
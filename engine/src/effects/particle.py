@@ -5,7 +5,42 @@ Individual particle and particle emitter classes.
 
 import numpy as np
 from typing import Optional, Tuple, Callable
-import random
+
+
+def _integrate(
+    positions: np.ndarray,
+    velocities: np.ndarray,
+    rotations: np.ndarray,
+    rotation_speeds: np.ndarray,
+    lifetimes: np.ndarray,
+    gravity: Optional[np.ndarray],
+    delta_time: float
+):
+    """
+    Integrate particle physics in place for a contiguous block of particles.
+    Same steps as Particle.update, applied to whole arrays at once.
+    
+    Args:
+        positions: (N, 3) positions
+        velocities: (N, 3) velocities
+        rotations: (N,) rotations (radians)
+        rotation_speeds: (N,) rotation speeds (radians/sec)
+        lifetimes: (N,) remaining lifetimes (seconds)
+        gravity: Gravity vector (None to disable)
+        delta_time: Time step (seconds)
+    """
+    # Apply velocity
+    positions += velocities * delta_time
+    
+    # Apply gravity
+    if gravity is not None:
+        velocities += gravity * delta_time
+    
+    # Update rotation
+    rotations += rotation_speeds * delta_time
+    
+    # Decrease lifetime
+    lifetimes -= delta_time
 
 
 class Particle:
@@ -83,8 +118,32 @@ class Particle:
 class ParticleEmitter:
     """
     Emits and manages a collection of particles.
+    Particles are stored as a structure of arrays (contiguous float32
+    storage per attribute) so physics runs as whole-array NumPy operations.
+    Render attributes are column views into one interleaved buffer laid out
+    exactly like the renderer's instance VBO, so it can be uploaded as-is.
     """
     
+    # Floats per particle in the instance buffer: position (3), color (4), size, rotation
+    INSTANCE_STRIDE = 9
+    
+    # Render attributes: (attribute name, column(s) in the instance buffer)
+    _INSTANCE_VIEWS = (
+        ('positions', slice(0, 3)),
+        ('colors', slice(3, 7)),
+        ('sizes', 7),
+        ('rotations', 8),
+    )
+    
+    # Simulation-only arrays: (attribute name, components per particle)
+    _FIELDS = (
+        ('velocities', 3),
+        ('initial_sizes', 1),
+        ('rotation_speeds', 1),
+        ('lifetimes', 1),
+        ('max_lifetimes', 1),
+    )
+    
     def __init__(
         self,
         position: Tuple[float, float, float] = (0.0, 0.0, 0.0),
@@ -124,8 +183,10 @@ class ParticleEmitter:
         self.gravity = np.array(gravity, dtype=np.float32) if gravity else None
         self.emitter_type = emitter_type
         
-        # Particles
-        self.particles: list[Particle] = []
+        # Particles (structure of arrays - rows [0, count) are alive)
+        self.count = 0
+        self._allocate(max_particles)
+        self._rng = np.random.default_rng()
         
         # Emission control
         self.is_emitting = True
@@ -154,85 +215,123 @@ class ParticleEmitter:
     
     def clear(self):
         """Clear all particles."""
-        self.particles.clear()
+        self.count = 0
+    
+    def _allocate(self, capacity: int):
+        """
+        Allocate (or grow) particle storage, preserving live particles.
+        
+        Args:
+            capacity: Number of particle slots
+        """
+        count = self.count
+        
+        instance_buffer = np.zeros((capacity, self.INSTANCE_STRIDE), dtype=np.float32)
+        if count:
+            instance_buffer[:count] = self.instance_buffer[:count]
+        self.instance_buffer = instance_buffer
+        for name, columns in self._INSTANCE_VIEWS:
+            setattr(self, name, instance_buffer[:, columns])
+        
+        for name, components in self._FIELDS:
+            shape = (capacity, components) if components > 1 else (capacity,)
+            array = np.zeros(shape, dtype=np.float32)
+            if count:
+                array[:count] = getattr(self, name)[:count]
+            setattr(self, name, array)
+        self.capacity = capacity
     
     def _spawn_particle(self):
         """Spawn a single particle based on emitter type."""
-        # Generate spawn position
-        if self.emitter_type == "point":
-            spawn_pos = self.position.copy()
+        self.spawn_burst(1)
+    
+    def spawn_burst(self, count: int) -> int:
+        """
+        Spawn several particles at once.
+        Random spawn data for the whole burst is generated with vectorized
+        NumPy calls instead of one Python-level RNG round per particle.
+        
+        Args:
+            count: Number of particles to spawn (clamped to max_particles)
+            
+        Returns:
+            Number of particles actually spawned
+        """
+        count = min(count, self.max_particles - self.count)
+        if count <= 0:
+            return 0
+        
+        if self.max_particles > self.capacity:
+            self._allocate(self.max_particles)
+        
+        positions, velocities, rotations, rotation_speeds = self._generate_spawn_data(count)
+        
+        start = self.count
+        end = start + count
+        self.positions[start:end] = positions
+        self.velocities[start:end] = velocities
+        self.colors[start:end] = self.color
+        self.sizes[start:end] = self.particle_size
+        self.initial_sizes[start:end] = self.particle_size
+        self.rotations[start:end] = rotations
+        self.rotation_speeds[start:end] = rotation_speeds
+        self.lifetimes[start:end] = self.particle_lifetime
+        self.max_lifetimes[start:end] = self.particle_lifetime
+        self.count = end
         
-        elif self.emitter_type == "sphere":
-            # Random point on sphere surface
-            theta = random.uniform(0, 2 * np.pi)
-            phi = random.uniform(0, np.pi)
+        return count
+    
+    def _generate_spawn_data(self, count: int):
+        """
+        Generate spawn positions, velocities and rotations for a burst.
+        
+        Args:
+            count: Number of particles
+            
+        Returns:
+            Tuple of (positions (N,3), velocities (N,3), rotations (N,), rotation_speeds (N,))
+        """
+        rng = self._rng
+        positions = np.empty((count, 3), dtype=np.float32)
+        positions[:] = self.position
+        
+        # Generate spawn position
+        if self.emitter_type == "sphere":
+            # Random points on sphere surface
+            theta = rng.uniform(0, 2 * np.pi, count)
+            phi = rng.uniform(0, np.pi, count)
             r = self.sphere_radius
-            offset = np.array([
-                r * np.sin(phi) * np.cos(theta),
-                r * np.sin(phi) * np.sin(theta),
-                r * np.cos(phi)
-            ], dtype=np.float32)
-            spawn_pos = self.position + offset
+            positions[:, 0] += r * np.sin(phi) * np.cos(theta)
+            positions[:, 1] += r * np.sin(phi) * np.sin(theta)
+            positions[:, 2] += r * np.cos(phi)
         
         elif self.emitter_type == "box":
-            # Random point in box
-            offset = np.array([
-                random.uniform(-self.box_size[0]/2, self.box_size[0]/2),
-                random.uniform(-self.box_size[1]/2, self.box_size[1]/2),
-                random.uniform(-self.box_size[2]/2, self.box_size[2]/2)
-            ], dtype=np.float32)
-            spawn_pos = self.position + offset
-        
-        elif self.emitter_type == "cone":
-            # Random direction in cone
-            angle_rad = np.radians(self.cone_angle)
-            theta = random.uniform(0, 2 * np.pi)
-            phi = random.uniform(0, angle_rad)
-            
-            # Base direction (up)
-            direction = np.array([
-                np.sin(phi) * np.cos(theta),
-                np.cos(phi),
-                np.sin(phi) * np.sin(theta)
-            ], dtype=np.float32)
-            
-            spawn_pos = self.position.copy()
-            velocity_dir = direction
-        else:
-            spawn_pos = self.position.copy()
-            velocity_dir = None
+            # Random points in box
+            half_size = np.array(self.box_size, dtype=np.float32) / 2
+            positions += rng.uniform(-half_size, half_size, (count, 3))
         
         # Generate velocity
         if self.emitter_type == "cone":
-            base_vel = self.emit_velocity
+            # Random directions in cone (base direction is up)
+            angle_rad = np.radians(self.cone_angle)
+            theta = rng.uniform(0, 2 * np.pi, count)
+            phi = rng.uniform(0, angle_rad, count)
+            speed = np.linalg.norm(self.emit_velocity)
+            
+            velocities = np.empty((count, 3), dtype=np.float32)
+            velocities[:, 0] = np.sin(phi) * np.cos(theta) * speed
+            velocities[:, 1] = np.cos(phi) * speed
+            velocities[:, 2] = np.sin(phi) * np.sin(theta) * speed
         else:
-            velocity_dir = self.emit_velocity / (np.linalg.norm(self.emit_velocity) + 0.001)
+            # Add randomness to velocity
+            random_vel = rng.uniform(-1, 1, (count, 3))
+            random_vel /= np.linalg.norm(random_vel, axis=1, keepdims=True) + 0.001
+            velocities = (self.emit_velocity + random_vel * self.velocity_randomness).astype(np.float32)
         
-        # Add randomness to velocity
-        random_vel = np.array([
-            random.uniform(-1, 1),
-            random.uniform(-1, 1),
-            random.uniform(-1, 1)
-        ], dtype=np.float32)
-        random_vel = random_vel / (np.linalg.norm(random_vel) + 0.001)
+        rotations = rng.uniform(0, 2 * np.pi, count)
+        rotation_speeds = rng.uniform(-2, 2, count)
         
-        if self.emitter_type == "cone":
-            velocity = velocity_dir * np.linalg.norm(self.emit_velocity)
-        else:
-            velocity = self.emit_velocity + random_vel * self.velocity_randomness
-        
-        # Create particle
-        particle = Particle(
-            position=spawn_pos,
-            velocity=velocity,
-            color=self.color,
-            size=self.particle_size,
-            lifetime=self.particle_lifetime,
-            rotation=random.uniform(0, 2 * np.pi),
-            rotation_speed=random.uniform(-2, 2)
-        )
-        
-        self.particles.append(particle)
+        return positions, velocities, rotations, rotation_speeds
     
     def update(self, delta_time: float):
         """
@@ -242,39 +341,101 @@ class ParticleEmitter:
             delta_time: Time since last frame (seconds)
         """
         # Update existing particles
-        for particle in self.particles[:]:  # Copy list for safe removal
-            particle.update(delta_time, self.gravity)
+        count = self.count
+        if count:
+            _integrate(
+                self.positions[:count],
+                self.velocities[:count],
+                self.rotations[:count],
+                self.rotation_speeds[:count],
+                self.lifetimes[:count],
+                self.gravity,
+                delta_time
+            )
+            
+            # Remove dead particles
+            alive = self.lifetimes[:count] > 0
+            if not alive.all():
+                self._compact(alive)
+                count = self.count
+        
+        if count and (self.color_over_lifetime or self.size_over_lifetime):
+            max_lifetimes = self.max_lifetimes[:count]
+            life_pcts = np.divide(
+                self.lifetimes[:count], max_lifetimes,
+                out=np.zeros(count, dtype=np.float32), where=max_lifetimes > 0
+            ).tolist()
             
             # Apply color over lifetime if defined
             if self.color_over_lifetime:
-                life_pct = particle.get_life_percentage()
-                particle.color = np.array(self.color_over_lifetime(life_pct), dtype=np.float32)
+                color_over_lifetime = self.color_over_lifetime
+                self.colors[:count] = [color_over_lifetime(pct) for pct in life_pcts]
             
             # Apply size over lifetime if defined
             if self.size_over_lifetime:
-                life_pct = particle.get_life_percentage()
-                particle.size = self.size_over_lifetime(life_pct) * particle.initial_size
-            
-            # Remove dead particles
-            if not particle.is_alive:
-                self.particles.remove(particle)
+                size_over_lifetime = self.size_over_lifetime
+                self.sizes[:count] = [size_over_lifetime(pct) for pct in life_pcts]
+                self.sizes[:count] *= self.initial_sizes[:count]
         
         # Emit new particles
-        if self.is_emitting and len(self.particles) < self.max_particles:
+        if self.is_emitting and self.count < self.max_particles:
             self.emission_timer += delta_time
             particles_to_spawn = int(self.emission_timer * self.emission_rate)
             
-            for _ in range(particles_to_spawn):
-                if len(self.particles) < self.max_particles:
-                    self._spawn_particle()
+            self.spawn_burst(particles_to_spawn)
             
             self.emission_timer -= particles_to_spawn / self.emission_rate
     
+    def _compact(self, alive: np.ndarray):
+        """
+        Drop dead particles, keeping live ones contiguous and in order.
+        
+        Args:
+            alive: Boolean mask over the current [0, count) particles
+        """
+        count = self.count
+        new_count = int(np.count_nonzero(alive))
+        
+        self.instance_buffer[:new_count] = self.instance_buffer[:count][alive]
+        for name, _ in self._FIELDS:
+            array = getattr(self, name)
+            array[:new_count] = array[:count][alive]
+        
+        self.count = new_count
+    
+    def get_instance_data(self) -> np.ndarray:
+        """
+        Get per-particle render data for instanced drawing.
+        Returns a view of the live rows of the instance buffer (no copy);
+        it is only valid until the next update.
+        
+        Returns:
+            (N, 9) float32 array: position (3), color (4), size, rotation
+        """
+        return self.instance_buffer[:self.count]
+    
     def get_active_particles(self) -> list[Particle]:
-        """Get list of active particles."""
-        return [p for p in self.particles if p.is_alive]
+        """
+        Get active particles as Particle objects.
+        Builds a snapshot from the particle arrays; use get_instance_data()
+        on hot paths.
+        """
+        particles = []
+        for i in range(self.count):
+            particle = Particle(
+                position=self.positions[i],
+                velocity=self.velocities[i],
+                color=self.colors[i],
+                size=float(self.sizes[i]),
+                lifetime=float(self.max_lifetimes[i]),
+                rotation=float(self.rotations[i]),
+                rotation_speed=float(self.rotation_speeds[i])
+            )
+            particle.lifetime = float(self.lifetimes[i])
+            particle.initial_size = float(self.initial_sizes[i])
+            particles.append(particle)
+        return particles
     
     def get_particle_count(self) -> int:
         """Get number of active particles."""
-        return len(self.get_active_particles())
-
+        return self.count
@@ -10,6 +10,10 @@ from typing import List
 from .particle import Particle
 
 
+# Bytes per particle instance: position (3), color (4), size, rotation as float32
+INSTANCE_BYTES = 9 * 4
+
+
 class ParticleRenderer:
     """
     Renders particles efficiently using GPU instancing.
@@ -21,6 +25,7 @@ class ParticleRenderer:
         self.vao = None
         self.quad_vbo = None
         self.instance_vbo = None
+        self.instance_capacity = 0  # Particles the instance VBO can hold
         
         # Uniform locations
         self.view_loc = None
@@ -180,8 +185,9 @@ class ParticleRenderer:
             glBindBuffer(GL_ARRAY_BUFFER, self.instance_vbo)
             
             # Allocate initial space for instance data
-            initial_size = 1000 * 9 * 4  # 1000 particles * 9 floats * 4 bytes
-            glBufferData(GL_ARRAY_BUFFER, initial_size, None, GL_DYNAMIC_DRAW)
+            self.instance_capacity = 1000
+            initial_size = self.instance_capacity * INSTANCE_BYTES
+            glBufferData(GL_ARRAY_BUFFER, initial_size, None, GL_STREAM_DRAW)
             
             # Set up instance attributes (positions for instancing)
             stride = 9 * 4  # 9 floats per instance
@@ -240,32 +246,71 @@ class ParticleRenderer:
         if not self.initialized or not particles:
             return
         
+        # Prepare instance data
+        instance_data = []
+        for particle in particles:
+            if particle.is_alive:
+                instance_data.extend([
+                    # Position (vec3)
+                    particle.position[0], particle.position[1], particle.position[2],
+                    # Color (vec4)
+                    particle.color[0], particle.color[1], particle.color[2], particle.color[3],
+                    # Size (float)
+                    particle.size,
+                    # Rotation (float)
+                    particle.rotation
+                ])
+        
+        if not instance_data:
+            return
+        
+        instance_array = np.array(instance_data, dtype=np.float32).reshape(-1, 9)
+        self.render_instances(instance_array, view_matrix, projection_matrix)
+    
+    def render_instances(
+        self,
+        instance_data: np.ndarray,
+        view_matrix: np.ndarray,
+        projection_matrix: np.ndarray
+    ):
+        """
+        Render pre-packed particle instance data.
+        
+        Args:
+            instance_data: (N, 9) float32 array - position (3), color (4), size, rotation
+            view_matrix: Camera view matrix
+            projection_matrix: Camera projection matrix
+        """
+        self.render_instance_blocks([instance_data], view_matrix, projection_matrix)
+    
+    def render_instance_blocks(
+        self,
+        instance_blocks: List[np.ndarray],
+        view_matrix: np.ndarray,
+        projection_matrix: np.ndarray
+    ):
+        """
+        Render several blocks of particle instance data in one draw call.
+        Each block is uploaded into its own range of the instance VBO, so
+        emitters never need to be concatenated on the CPU.
+        
+        Args:
+            instance_blocks: (N, 9) float32 arrays - position (3), color (4), size, rotation
+            view_matrix: Camera view matrix
+            projection_matrix: Camera projection matrix
+        """
+        if not self.initialized:
+            return
+        
+        instance_count = sum(len(block) for block in instance_blocks)
+        if instance_count == 0:
+            return
+        
         try:
             # Clear any pending OpenGL errors first
             while glGetError() != GL_NO_ERROR:
                 pass
             
-            # Prepare instance data
-            instance_data = []
-            for particle in particles:
-                if particle.is_alive:
-                    instance_data.extend([
-                        # Position (vec3)
-                        particle.position[0], particle.position[1], particle.position[2],
-                        # Color (vec4)
-                        particle.color[0], particle.color[1], particle.color[2], particle.color[3],
-                        # Size (float)
-                        particle.size,
-                        # Rotation (float)
-                        particle.rotation
-                    ])
-            
-            if not instance_data:
-                return
-            
-            instance_array = np.array(instance_data, dtype=np.float32)
-            instance_count = len(particles)
-            
             # Validate VAO and shader program basics
             if self.vao == 0 or self.shader_program == 0:
                 return  # Silently skip if not initialized
@@ -278,7 +323,20 @@ class ParticleRenderer:
             
             # Update instance VBO data (attributes already configured in _create_buffers)
             glBindBuffer(GL_ARRAY_BUFFER, self.instance_vbo)
-            glBufferData(GL_ARRAY_BUFFER, instance_array.nbytes, instance_array, GL_DYNAMIC_DRAW)
+            
+            # Orphan the buffer so the driver hands us fresh storage instead of
+            # stalling until last frame's draw has finished reading it
+            if instance_count > self.instance_capacity:
+                self.instance_capacity = max(instance_count, self.instance_capacity * 2)
+            glBufferData(GL_ARRAY_BUFFER, self.instance_capacity * INSTANCE_BYTES, None, GL_STREAM_DRAW)
+            
+            offset = 0
+            for block in instance_blocks:
+                if len(block) == 0:
+                    continue
+                block = np.ascontiguousarray(block, dtype=np.float32)
+                glBufferSubData(GL_ARRAY_BUFFER, offset, block.nbytes, block)
+                offset += block.nbytes
             
             # Set matrices
             glUniformMatrix4fv(self.view_loc, 1, GL_FALSE, view_matrix)
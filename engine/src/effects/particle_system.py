@@ -98,13 +98,15 @@ class ParticleSystem:
         if not self.enabled or not self.renderer:
             return
         
-        # Collect all active particles from all emitters
-        all_particles = []
-        for emitter in self.emitters.values():
-            all_particles.extend(emitter.get_active_particles())
+        # Collect instance data from all emitters with live particles
+        instance_blocks = [
+            emitter.get_instance_data()
+            for emitter in self.emitters.values()
+            if emitter.count
+        ]
         
-        if all_particles:
-            self.renderer.render(all_particles, view_matrix, projection_matrix)
+        if instance_blocks:
+            self.renderer.render_instance_blocks(instance_blocks, view_matrix, projection_matrix)
     
     def get_total_particle_count(self) -> int:
         """Get total number of active particles across all emitters."""
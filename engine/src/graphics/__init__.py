@@ -1,23 +1,25 @@
 """Graphics resources and data structures."""
 
 from .material import Material
-from .texture import Texture
+from .texture import Texture, LazyTexture
 from .mesh import Mesh
 from .vertex import Vertex
 from .model import Model
-from .bounding_volume import BoundingBox, BoundingSphere
+from .bounding_volume import BoundingBox, BoundingSphere, transform_spheres
 from .model_loader import ModelLoader
 from .light import Light, DirectionalLight, PointLight, SpotLight
 
 __all__ = [
     'Material',
     'Texture',
+    'LazyTexture',
     'Mesh',
     'Vertex',
     'Model',
     'ModelLoader',
     'BoundingBox',
     'BoundingSphere',
+    'transform_spheres',
     'Light',
     'DirectionalLight',
     'PointLight',
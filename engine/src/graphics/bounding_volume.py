@@ -9,6 +9,34 @@ from .mesh import Mesh
 from .vertex import Vertex
 
 
+def transform_spheres(
+    matrices: np.ndarray,
+    centers: np.ndarray,
+    radii: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Transform many local bounding spheres to world space at once.
+    
+    Radii are scaled by each matrix's largest basis column norm. Model
+    matrices are rotation times scale, so that is the largest axis scale
+    and the result still encloses the object under rotation combined with
+    non-uniform scale.
+    
+    Args:
+        matrices: (N, 4, 4) model matrices (row-vector layout, translation
+            in the last row, as built by Transform.get_model_matrix)
+        centers: (N, 3) local sphere centers
+        radii: (N,) local sphere radii
+        
+    Returns:
+        Tuple of ((N, 3) world centers, (N,) world radii)
+    """
+    basis = matrices[:, :3, :3]
+    world_centers = np.einsum('ni,nij->nj', centers, basis) + matrices[:, 3, :3]
+    world_radii = radii * np.linalg.norm(basis, axis=1).max(axis=1)
+    return world_centers, world_radii
+
+
 class BoundingSphere:
     """Represents a bounding sphere."""
     
@@ -36,9 +64,9 @@ class BoundingSphere:
         Returns:
             New transformed bounding sphere
         """
-        # Transform center
-        center_homogeneous = np.array([self.center[0], self.center[1], self.center[2], 1.0])
-        transformed_center = (matrix @ center_homogeneous)[:3]
+        # Transform center (engine matrices are laid out for row vectors:
+        # world = local @ matrix, translation in the last row)
+        transformed_center = self.center @ matrix[:3, :3] + matrix[3, :3]
         
         # Approximate radius scaling (using average of scale factors)
         # For uniform scale, this is exact
@@ -116,17 +144,13 @@ class BoundingBox:
         Returns:
             New AABB that encloses the transformed box
         """
-        corners = self.get_corners()
+        corners = np.array(self.get_corners())
         
-        # Transform all corners
-        transformed_corners = []
-        for corner in corners:
-            corner_homogeneous = np.array([corner[0], corner[1], corner[2], 1.0])
-            transformed = (matrix @ corner_homogeneous)[:3]
-            transformed_corners.append(transformed)
+        # Transform all corners (row vectors: corner @ matrix, translation
+        # in the last row)
+        transformed_corners = corners @ matrix[:3, :3] + matrix[3, :3]
         
         # Find new min/max
-        transformed_corners = np.array(transformed_corners)
         new_min = np.min(transformed_corners, axis=0)
         new_max = np.max(transformed_corners, axis=0)
         
@@ -3,6 +3,7 @@ Mesh Module
 Defines mesh data structure for storing vertex and index data.
 """
 
+import copy
 import numpy as np
 from typing import List, Optional, TYPE_CHECKING
 from .vertex import Vertex, vertices_to_array, calculate_tangents
@@ -37,9 +38,38 @@ class Mesh:
         self.index_data = np.array(indices, dtype=np.uint32) if indices else np.array([], dtype=np.uint32)
         
         # Buffer handles (will be set by renderer)
+        self.vao = None  # Vertex Array Object (OpenGL)
         self.vbo = None  # Vertex Buffer Object (OpenGL)
         self.ebo = None  # Element Buffer Object (OpenGL)
     
+    @property
+    def geometry_key(self) -> int:
+        """
+        Key shared by meshes with the same vertex data (see share()).
+        
+        The renderer uploads one VAO/VBO/EBO per key and holds on to the
+        vertex data with them, so a key is never reused by other geometry.
+        """
+        return id(self.vertex_data)
+    
+    def share(self, texture: Optional['Texture'] = None) -> 'Mesh':
+        """
+        Create a mesh that reuses this mesh's vertex data and GPU buffers.
+        
+        The new mesh only differs in its texture, so any number of them
+        cost one VAO/VBO and can be drawn in one instanced batch per
+        texture. The vertex data must not be edited afterwards.
+        
+        Args:
+            texture: Texture for the new mesh
+            
+        Returns:
+            Mesh sharing this mesh's geometry
+        """
+        mesh = copy.copy(self)
+        mesh.texture = texture
+        return mesh
+    
     @property
     def vertex_count(self) -> int:
         """Get the number of vertices."""
@@ -16,6 +16,9 @@ if TYPE_CHECKING:
 class Model:
     """Represents a 3D model composed of one or more meshes."""
     
+    # Unit quad shared by every create_textured_quad() model
+    _textured_quad_template: Optional[Mesh] = None
+    
     def __init__(self, name: str = "Model"):
         """
         Initialize a model.
@@ -206,6 +209,9 @@ class Model:
         """
         Create a quad with proper UV coordinates for texturing.
         
+        All textured quads share one unit-quad mesh on the GPU (see
+        Mesh.share()); scale the game object to size it.
+        
         Args:
             name: Model name
             texture: Optional texture to apply
@@ -213,18 +219,19 @@ class Model:
         Returns:
             Model with textured quad mesh
         """
-        vertices = [
-            # Position, Color, TexCoord, Normal
-            Vertex(position=(-0.5, -0.5, 0.0), color=(1.0, 1.0, 1.0), texcoord=(0.0, 0.0), normal=(0.0, 0.0, 1.0)),
-            Vertex(position=( 0.5, -0.5, 0.0), color=(1.0, 1.0, 1.0), texcoord=(1.0, 0.0), normal=(0.0, 0.0, 1.0)),
-            Vertex(position=( 0.5,  0.5, 0.0), color=(1.0, 1.0, 1.0), texcoord=(1.0, 1.0), normal=(0.0, 0.0, 1.0)),
-            Vertex(position=(-0.5,  0.5, 0.0), color=(1.0, 1.0, 1.0), texcoord=(0.0, 1.0), normal=(0.0, 0.0, 1.0)),
-        ]
-        indices = [0, 1, 2, 2, 3, 0]
+        if Model._textured_quad_template is None:
+            vertices = [
+                # Position, Color, TexCoord, Normal
+                Vertex(position=(-0.5, -0.5, 0.0), color=(1.0, 1.0, 1.0), texcoord=(0.0, 0.0), normal=(0.0, 0.0, 1.0)),
+                Vertex(position=( 0.5, -0.5, 0.0), color=(1.0, 1.0, 1.0), texcoord=(1.0, 0.0), normal=(0.0, 0.0, 1.0)),
+                Vertex(position=( 0.5,  0.5, 0.0), color=(1.0, 1.0, 1.0), texcoord=(1.0, 1.0), normal=(0.0, 0.0, 1.0)),
+                Vertex(position=(-0.5,  0.5, 0.0), color=(1.0, 1.0, 1.0), texcoord=(0.0, 1.0), normal=(0.0, 0.0, 1.0)),
+            ]
+            indices = [0, 1, 2, 2, 3, 0]
+            Model._textured_quad_template = Mesh(vertices, indices)
         
         model = Model(name)
-        mesh = Mesh(vertices, indices, texture=texture)
-        model.add_mesh(mesh)
+        model.add_mesh(Model._textured_quad_template.share(texture))
         return model
     
     @staticmethod
@@ -6,13 +6,24 @@ Handles texture loading and management for OpenGL.
 from OpenGL.GL import *  # type: ignore
 from PIL import Image
 import numpy as np
-from typing import Optional
+import time
+from typing import Optional, Tuple
+from collections import OrderedDict
+from concurrent.futures import Future
 import os
 
 
 class Texture:
     """Represents an OpenGL texture."""
     
+    # Channel count -> (pixel format, sized internal format)
+    _FORMATS = {
+        1: (GL_RED, GL_R8),
+        2: (GL_RG, GL_RG8),
+        3: (GL_RGB, GL_RGB8),
+        4: (GL_RGBA, GL_RGBA8),
+    }
+    
     def __init__(self, filepath: Optional[str] = None):
         """
         Initialize a texture.
@@ -29,43 +40,84 @@ class Texture:
         if filepath:
             self.load(filepath)
     
-    def load(self, filepath: str) -> bool:
+    def load(self, filepath: str, channels: Optional[int] = None) -> bool:
         """
         Load a texture from file.
         
         Args:
             filepath: Path to image file
+            channels: Optional channel count to keep (see decode())
             
         Returns:
             True if successful, False otherwise
         """
+        image = Texture.decode(filepath, channels)
+        if image is None:
+            return False
+        return self.upload(image)
+    
+    @staticmethod
+    def decode(filepath: str, channels: Optional[int] = None) -> Optional[Tuple[np.ndarray, int, int, int]]:
+        """
+        Decode an image file into pixel data ready for upload.
+        
+        Makes no OpenGL calls, so it can run on a worker thread. Grayscale
+        images (roughness, AO) decode to a single channel, 16-bit ones
+        scaled down to 8 bits.
+        
+        Args:
+            filepath: Path to image file
+            channels: Optional channel count to keep, e.g. 2 for normal maps
+                whose Z is rebuilt in the shader from X and Y
+            
+        Returns:
+            Tuple of (pixels, width, height, channels), or None on failure
+        """
         try:
             if not os.path.exists(filepath):
                 print(f"ERROR: Texture file not found: {filepath}")
-                return False
+                return None
             
             # Load image
             img = Image.open(filepath)
             
-            # Convert to RGB/RGBA
-            if img.mode == 'RGB':
-                img_data = img.convert('RGB')
-                gl_format = GL_RGB
-                self.channels = 3
+            # Flip image (OpenGL expects origin at bottom-left)
+            flipped = img.transpose(Image.FLIP_TOP_BOTTOM)
+            
+            if img.mode in ('I;16', 'I;16B', 'I'):
+                # 16-bit grayscale: PIL's convert() would clip it to white
+                pixels = (np.array(flipped, dtype=np.uint32) >> 8).astype(np.uint8)[..., None]
+            elif img.mode in ('L', '1'):
+                pixels = np.array(flipped.convert('L'), dtype=np.uint8)[..., None]
             elif img.mode == 'RGBA':
-                img_data = img.convert('RGBA')
-                gl_format = GL_RGBA
-                self.channels = 4
+                pixels = np.array(flipped.convert('RGBA'), dtype=np.uint8)
             else:
-                img_data = img.convert('RGB')
-                gl_format = GL_RGB
-                self.channels = 3
+                pixels = np.array(flipped.convert('RGB'), dtype=np.uint8)
             
-            # Flip image (OpenGL expects origin at bottom-left)
-            img_data = img_data.transpose(Image.FLIP_TOP_BOTTOM)
+            if channels is not None and channels < pixels.shape[2]:
+                pixels = pixels[..., :channels]
+            
+            return np.ascontiguousarray(pixels), img.width, img.height, pixels.shape[2]
             
-            self.width = img.width
-            self.height = img.height
+        except Exception as e:
+            print(f"ERROR: Failed to decode texture '{filepath}': {e}")
+            return None
+    
+    def upload(self, image: Tuple[np.ndarray, int, int, int]) -> bool:
+        """
+        Upload decoded pixel data to a new OpenGL texture.
+        
+        Must run on the thread that owns the OpenGL context.
+        
+        Args:
+            image: (pixels, width, height, channels) as returned by decode()
+            
+        Returns:
+            True if successful, False otherwise
+        """
+        try:
+            pixels, self.width, self.height, self.channels = image
+            gl_format, internal_format = Texture._FORMATS[self.channels]
             
             # Generate texture
             self.texture_id = glGenTextures(1)
@@ -77,12 +129,20 @@ class Texture:
             glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MIN_FILTER, GL_LINEAR_MIPMAP_LINEAR)
             glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MAG_FILTER, GL_LINEAR)
             
+            if self.channels == 1:
+                # Sample single-channel maps as gray like the old RGB upload
+                glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_SWIZZLE_G, GL_RED)
+                glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_SWIZZLE_B, GL_RED)
+            
+            # Rows of 1- and 2-channel images are not 4-byte aligned
+            glPixelStorei(GL_UNPACK_ALIGNMENT, 1)
+            
             # Upload texture data
             glTexImage2D(
-                GL_TEXTURE_2D, 0, gl_format,
+                GL_TEXTURE_2D, 0, internal_format,
                 self.width, self.height, 0,
                 gl_format, GL_UNSIGNED_BYTE,
-                np.array(img_data, dtype=np.uint8)
+                pixels
             )
             
             # Generate mipmaps
@@ -91,15 +151,51 @@ class Texture:
             # Unbind
             glBindTexture(GL_TEXTURE_2D, 0)
             
-            print(f"[OK] Texture loaded: {filepath} ({self.width}x{self.height}, {self.channels} channels)")
+            print(f"[OK] Texture loaded: {self.filepath} ({self.width}x{self.height}, {self.channels} channels)")
             return True
             
         except Exception as e:
-            print(f"ERROR: Failed to load texture '{filepath}': {e}")
+            print(f"ERROR: Failed to load texture '{self.filepath}': {e}")
             import traceback
             traceback.print_exc()
             return False
     
+    @staticmethod
+    def from_image(filepath: str, image: Tuple[np.ndarray, int, int, int]) -> 'Texture':
+        """
+        Create a texture from pixel data decoded ahead of time.
+        
+        Args:
+            filepath: Path the image was decoded from
+            image: (pixels, width, height, channels) as returned by decode()
+            
+        Returns:
+            Texture (texture_id is None if the upload failed)
+        """
+        texture = Texture()
+        texture.filepath = filepath
+        texture.upload(image)
+        return texture
+    
+    @staticmethod
+    def from_path_lazy(
+        filepath: str,
+        decode_future: Optional[Future] = None,
+        channels: Optional[int] = None
+    ) -> 'LazyTexture':
+        """
+        Create a texture that loads the first time it is bound.
+        
+        Args:
+            filepath: Path to image file
+            decode_future: Optional background decode of filepath (see decode())
+            channels: Optional channel count to keep (see decode())
+            
+        Returns:
+            LazyTexture
+        """
+        return LazyTexture(filepath, decode_future, channels)
+    
     def bind(self, texture_unit: int = 0):
         """
         Bind this texture to a texture unit.
@@ -156,3 +252,139 @@ class Texture:
         """String representation."""
         return f"Texture(id={self.texture_id}, size={self.width}x{self.height})"
 
+
+class LazyTexture(Texture):
+    """
+    Texture that decodes and uploads itself on first use.
+    
+    The renderer only reads texture_id (or binds) for objects that passed
+    frustum culling, so textures of objects never seen stay off disk and
+    out of VRAM. Loaded lazy textures share a memory budget; when it is
+    exceeded the least recently bound ones are deleted and reload the
+    next time they are needed. Once the renderer calls begin_frame(),
+    loads are also limited to upload_budget seconds per frame, so many
+    textures coming into view at once spread over several frames.
+    """
+    
+    # GPU memory budget shared by all lazy textures
+    budget_bytes = 256 * 1024 * 1024
+    
+    # Seconds of decoding/uploading allowed per frame; one load always
+    # goes through so loading keeps progressing
+    upload_budget = 0.004
+    _frame_budget_active = False
+    _frame_load_time = 0.0
+    _frame_loads = 0
+    
+    # Loaded textures in least-recently-bound order -> estimated bytes
+    _resident: 'OrderedDict[LazyTexture, int]' = OrderedDict()
+    _resident_bytes = 0
+    
+    def __init__(
+        self,
+        filepath: str,
+        decode_future: Optional[Future] = None,
+        channels: Optional[int] = None
+    ):
+        """
+        Initialize a lazy texture.
+        
+        Args:
+            filepath: Path to image file
+            decode_future: Optional background decode of filepath; until it
+                finishes the texture reports no texture_id
+            channels: Optional channel count to keep (see decode())
+        """
+        self._texture_id: Optional[int] = None
+        super().__init__()
+        self.filepath = filepath
+        self._decode_future = decode_future
+        self._decode_channels = channels
+        self._failed = False
+    
+    @property
+    def texture_id(self) -> Optional[int]:
+        """OpenGL texture ID, loading the texture first if needed."""
+        self.ensure_loaded()
+        return self._texture_id
+    
+    @texture_id.setter
+    def texture_id(self, value: Optional[int]):
+        self._texture_id = value
+    
+    def ensure_loaded(self) -> bool:
+        """
+        Decode and upload the texture if it is not resident.
+        
+        Returns:
+            True if the texture is ready to bind
+        """
+        if self._texture_id is not None:
+            if self in LazyTexture._resident:
+                LazyTexture._resident.move_to_end(self)
+            return True
+        if self._failed:
+            return False
+        
+        # Background decode still running: draw untextured this frame
+        if self._decode_future is not None and not self._decode_future.done():
+            return False
+        
+        # This frame's load budget is spent: try again next frame
+        if (LazyTexture._frame_budget_active and LazyTexture._frame_loads
+                and LazyTexture._frame_load_time >= LazyTexture.upload_budget):
+            return False
+        
+        start = time.perf_counter()
+        if self._decode_future is not None:
+            image = self._decode_future.result()
+            self._decode_future = None
+        else:
+            image = Texture.decode(self.filepath, self._decode_channels)
+        
+        loaded = image is not None and self.upload(image)
+        LazyTexture._frame_load_time += time.perf_counter() - start
+        LazyTexture._frame_loads += 1
+        if not loaded:
+            self._failed = True
+            return False
+        
+        # Texel bytes plus a third for the mip chain
+        size = self.width * self.height * self.channels * 4 // 3
+        LazyTexture._resident[self] = size
+        LazyTexture._resident_bytes += size
+        LazyTexture._evict_over_budget()
+        return True
+    
+    @classmethod
+    def begin_frame(cls):
+        """Start a new frame's upload budget (called by the renderer)."""
+        cls._frame_budget_active = True
+        cls._frame_load_time = 0.0
+        cls._frame_loads = 0
+    
+    @classmethod
+    def _evict_over_budget(cls):
+        """Unload least recently bound textures until under budget."""
+        # Always keep the most recent texture, even if it alone is too big
+        while cls._resident_bytes > cls.budget_bytes and len(cls._resident) > 1:
+            texture, _ = next(iter(cls._resident.items()))
+            print(f"[LazyTexture] Evicting {texture.filepath} (over {cls.budget_bytes // (1024 * 1024)} MB budget)")
+            texture.unload()
+    
+    def unload(self):
+        """Delete the GPU texture; it reloads from disk on next use."""
+        size = LazyTexture._resident.pop(self, None)
+        if size is not None:
+            LazyTexture._resident_bytes -= size
+        if self._texture_id is not None:
+            glDeleteTextures(1, [self._texture_id])
+            self._texture_id = None
+    
+    def cleanup(self):
+        """Clean up texture resources."""
+        self.unload()
+    
+    def __repr__(self) -> str:
+        """String representation."""
+        return f"LazyTexture(path={self.filepath}, id={self._texture_id})"
@@ -64,6 +64,9 @@ class Frustum:
     def __init__(self):
         """Initialize an empty frustum."""
         self.planes: list[FrustumPlane] = [None] * 6
+        # Same planes packed as rows of (nx, ny, nz, d), normals pointing
+        # inward, for testing many volumes at once
+        self.plane_array = np.zeros((6, 4), dtype=np.float32)
         self._initialized = False
     
     def update_from_camera(
@@ -136,16 +139,63 @@ class Frustum:
         bottom_plane_normal = np.cross(front_mult_far + up * half_v_side, right)
         self.planes[self.BOTTOM] = create_plane(position, bottom_plane_normal)
         
+        self._pack_planes()
         self._initialized = True
     
     def update_from_matrix(self, view_projection_matrix: np.ndarray):
         """
-        Extract frustum planes from view-projection matrix (legacy method).
+        Extract frustum planes from a view-projection matrix
+        (Gribb/Hartmann).
         
-        Note: update_from_camera() is preferred as it's more reliable.
+        Engine matrices are laid out for row vectors (clip = world @ view @
+        projection), so the plane equations come from sums and differences
+        of the matrix columns.
+        
+        Args:
+            view_projection_matrix: view @ projection (4x4)
         """
-        # This method is kept for backward compatibility but update_from_camera is preferred
-        pass
+        m = np.asarray(view_projection_matrix, dtype=np.float64)
+        w = m[:, 3]
+        rows = np.empty((6, 4), dtype=np.float64)
+        rows[self.LEFT] = w + m[:, 0]
+        rows[self.RIGHT] = w - m[:, 0]
+        rows[self.BOTTOM] = w + m[:, 1]
+        rows[self.TOP] = w - m[:, 1]
+        rows[self.NEAR] = w + m[:, 2]
+        rows[self.FAR] = w - m[:, 2]
+        
+        # Normalize so plane distances are in world units
+        rows /= np.linalg.norm(rows[:, :3], axis=1)[:, None]
+        
+        for index, row in enumerate(rows):
+            self.planes[index] = FrustumPlane(row[:3], float(row[3]))
+        self.plane_array[:] = rows
+        self._initialized = True
+    
+    def _pack_planes(self):
+        """Copy the plane objects into plane_array."""
+        for index, plane in enumerate(self.planes):
+            self.plane_array[index, :3] = plane.normal
+            self.plane_array[index, 3] = plane.distance
+    
+    def cull_spheres(self, centers: np.ndarray, radii: np.ndarray) -> np.ndarray:
+        """
+        Test many spheres against the frustum in one pass.
+        
+        Args:
+            centers: (N, 3) sphere centers
+            radii: (N,) sphere radii
+            
+        Returns:
+            (N,) bool array, True where the sphere is at least partly inside
+        """
+        if not self._initialized:
+            return np.ones(len(radii), dtype=bool)
+        
+        # Signed distance of every center to every plane: (N, 6)
+        planes = self.plane_array
+        distances = centers @ planes[:, :3].T + planes[:, 3]
+        return (distances >= -radii[:, None]).all(axis=1)
     
     def test_point(self, point: np.ndarray) -> FrustumResult:
         """
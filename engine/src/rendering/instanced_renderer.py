@@ -7,21 +7,23 @@ import numpy as np
 from typing import Dict, List, Optional, TYPE_CHECKING
 from collections import defaultdict
 from OpenGL.GL import *  # type: ignore
+from ..scene.gameobject import get_model_matrices
 
 if TYPE_CHECKING:
     from ..scene.gameobject import GameObject
     from ..graphics.mesh import Mesh
+    from ..graphics.material import Material
 
 
 class InstanceBatch:
     """Represents a batch of instances to render together."""
     
-    def __init__(self, mesh_id: int):
+    def __init__(self, mesh_id: tuple):
         """
         Initialize an instance batch.
         
         Args:
-            mesh_id: Unique identifier for the mesh
+            mesh_id: Batching key of the mesh (see InstancedRenderer.get_mesh_id)
         """
         self.mesh_id = mesh_id
         self.instances: List['GameObject'] = []
@@ -50,21 +52,15 @@ class InstanceBatch:
         if not self.dirty or len(self.instances) == 0:
             return
         
-        # Collect all instance matrices
-        matrices = []
-        for obj in self.instances:
-            if obj.active:
-                model_matrix = obj.get_model_matrix()
-                # OpenGL expects column-major matrices, so transpose
-                model_matrix_transposed = model_matrix.T
-                matrices.append(model_matrix_transposed.flatten())
-        
-        if len(matrices) == 0:
+        # Collect all instance matrices in one vectorized pass
+        active = [obj for obj in self.instances if obj.active]
+        if len(active) == 0:
             self.instance_matrices = np.array([], dtype=np.float32)
             return
         
-        # Convert to numpy array (N instances x 16 floats)
-        self.instance_matrices = np.array(matrices, dtype=np.float32)
+        # OpenGL expects column-major matrices, so transpose (N instances x 16 floats)
+        matrices = get_model_matrices(active)
+        self.instance_matrices = np.ascontiguousarray(matrices.transpose(0, 2, 1)).reshape(len(active), 16)
         self.dirty = False
     
     def upload_to_gpu(self):
@@ -107,20 +103,26 @@ class InstancedRenderer:
             max_instances_per_batch: Maximum instances per batch (default: 10000)
         """
         self.max_instances_per_batch = max_instances_per_batch
-        self.batches: Dict[int, InstanceBatch] = {}  # Maps mesh_id to InstanceBatch
+        self.batches: Dict[tuple, InstanceBatch] = {}  # Maps mesh_id to InstanceBatch
         self.enabled = True
         
-    def get_mesh_id(self, mesh: 'Mesh') -> int:
+    def get_mesh_id(self, mesh: 'Mesh', material: Optional['Material'] = None) -> tuple:
         """
-        Get a unique identifier for a mesh.
+        Get the batching key for a mesh drawn with a material.
+        
+        Meshes sharing geometry (Mesh.share()), texture and material batch
+        together, so e.g. every textured quad with the same texture and
+        material is one draw. A batch is drawn with its first object's
+        material, so objects with different materials never share one.
         
         Args:
             mesh: Mesh object
+            material: Material of the object drawing the mesh
             
         Returns:
-            Unique mesh identifier
+            (geometry key, texture id, material id) batching key
         """
-        return id(mesh)
+        return (mesh.geometry_key, id(mesh.texture), id(material))
     
     def add_instance(self, game_object: 'GameObject', mesh: 'Mesh'):
         """
@@ -133,7 +135,7 @@ class InstancedRenderer:
         if not self.enabled:
             return
         
-        mesh_id = self.get_mesh_id(mesh)
+        mesh_id = self.get_mesh_id(mesh, game_object.material)
         
         if mesh_id not in self.batches:
             self.batches[mesh_id] = InstanceBatch(mesh_id)
@@ -151,7 +153,7 @@ class InstancedRenderer:
         if not self.enabled:
             return
         
-        mesh_id = self.get_mesh_id(mesh)
+        mesh_id = self.get_mesh_id(mesh, game_object.material)
         
         if mesh_id in self.batches:
             self.batches[mesh_id].remove_instance(game_object)
@@ -181,14 +183,14 @@ class InstancedRenderer:
         self.clear()
         
         # Group objects by mesh
-        mesh_groups: Dict[int, List['GameObject']] = defaultdict(list)
+        mesh_groups: Dict[tuple, List['GameObject']] = defaultdict(list)
         
         for obj in objects:
             if not obj.active or not obj.model:
                 continue
             
             for mesh in obj.model.meshes:
-                mesh_id = self.get_mesh_id(mesh)
+                mesh_id = self.get_mesh_id(mesh, obj.material)
                 mesh_groups[mesh_id].append(obj)
         
         # Create batches
@@ -207,7 +209,7 @@ class InstancedRenderer:
             batch.update_instance_data()
             batch.upload_to_gpu()
     
-    def get_batches(self) -> Dict[int, InstanceBatch]:
+    def get_batches(self) -> Dict[tuple, InstanceBatch]:
         """
         Get all instance batches.
         
@@ -4,7 +4,7 @@ Orchestrates all rendering stages and manages renderer components.
 """
 
 from typing import Optional, Callable, Dict, Any
-from OpenGL.GL import glDisable, glEnable, glIsEnabled, GL_CULL_FACE
+from OpenGL.GL import glDisable, glEnable, GL_CULL_FACE
 import numpy as np
 
 
@@ -135,8 +135,12 @@ class RenderPipeline:
         
         # CRITICAL: Disable culling before UI rendering
         # 3D rendering may have enabled it, but UI should never be culled
-        cull_state_before = glIsEnabled(GL_CULL_FACE)
-        glDisable(GL_CULL_FACE)
+        # (state comes from the renderer's shadow copy, not a glIsEnabled query)
+        gl_state = self.scene_renderer.gl_state
+        cull_state_before = gl_state['cull']
+        if cull_state_before:
+            glDisable(GL_CULL_FACE)
+            gl_state['cull'] = False
         
         # Render 2D text overlay objects (if any)
         if hasattr(scene, 'text2d_objects') and len(scene.text2d_objects) > 0:
@@ -153,6 +157,7 @@ class RenderPipeline:
         # Restore culling state if it was enabled
         if cull_state_before:
             glEnable(GL_CULL_FACE)
+            gl_state['cull'] = True
     
     def get_current_scene(self):
         """Get the current active scene."""
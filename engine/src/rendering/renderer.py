@@ -7,11 +7,13 @@ from OpenGL.GL import *  # type: ignore
 from OpenGL.GL.shaders import compileProgram, compileShader  # type: ignore
 import numpy as np
 import ctypes
-from typing import Optional, Dict, List
-from ..core.window import Window
+from typing import Optional, Dict, List, TYPE_CHECKING
 from ..scene.camera import Camera
 from ..scene.scene import Scene
+from ..scene.gameobject import get_model_matrices
 from ..graphics.mesh import Mesh
+from ..graphics.bounding_volume import transform_spheres
+from ..graphics.texture import LazyTexture
 from .shadow_map import ShadowMap
 from .frustum import Frustum, FrustumResult
 from .instanced_renderer import InstancedRenderer
@@ -19,6 +21,10 @@ from .lod_system import LODSystem, LODLevel
 from ..systems.settings_manager import SettingsManager
 import os
 
+if TYPE_CHECKING:
+    # core imports this module (Application owns the renderer)
+    from ..core.window import Window
+
 
 class OpenGLRenderer:
     """Manages OpenGL rendering."""
@@ -56,16 +62,26 @@ class OpenGLRenderer:
         self.scene: Optional[Scene] = None
         
         # Window reference
-        self.window: Optional[Window] = None
+        self.window: Optional['Window'] = None
         
-        # Mesh VBO tracking (for cleanup)
-        self._mesh_vbos: Dict[int, int] = {}  # Maps mesh id to VBO
+        # Mesh buffer tracking (for cleanup): Mesh.geometry_key -> (VAO, VBO,
+        # EBO or None, vertex data). The vertex data is kept alive here so its
+        # id (the key) can't be reused by another mesh's array
+        self._mesh_buffers: Dict[int, tuple] = {}
         
         # Shadow maps
         self.shadow_maps: Dict[str, ShadowMap] = {}  # Maps light name to shadow map
+        # Light-space matrices of static lights: light name -> (inputs, matrix)
+        self._light_space_cache: Dict[str, tuple] = {}
+        
+        # Main shader uniform locations looked up by name, and the light
+        # data last uploaded to them
+        self._uniform_locations: Dict[str, int] = {}
+        self._uploaded_light_state = None
         
         # Frustum culling
         self.frustum = Frustum()
+        self._frustum_view_projection = None  # VP the frustum planes were built from
         self.frustum_culling_enabled = True
         self._culled_count = 0
         self._total_count = 0
@@ -86,9 +102,14 @@ class OpenGLRenderer:
         self.msaa_enabled = False
         self.render_distance = 1000.0
         
+        # Python-side shadow of the capabilities only this renderer toggles,
+        # so overlays (UI) can save/restore them without glIsEnabled
+        # round-trips every frame
+        self.gl_state = {'depth': False, 'cull': False}
+        
         print(f"[Renderer] Initialized with settings: {settings is not None}")
         
-    def init(self, window: Window) -> bool:
+    def init(self, window: 'Window') -> bool:
         """
         Initialize OpenGL components.
         
@@ -119,6 +140,7 @@ class OpenGLRenderer:
             # Set up OpenGL state
             glEnable(GL_DEPTH_TEST)
             glDepthFunc(GL_LESS)
+            self.gl_state['depth'] = True
             
             # Disable face culling for now (for debugging)
             # glEnable(GL_CULL_FACE)
@@ -386,29 +408,37 @@ class OpenGLRenderer:
                 max_objects = self.settings.get('graphics.octree_max_objects_per_node', 10)
                 scene.enable_octree(max_depth=max_depth, max_objects_per_node=max_objects)
         
-        # Create VBOs for all meshes in the scene
+        # Create vertex buffers for all meshes in the scene
         for game_object in scene.game_objects:
             if game_object.model:
                 for mesh in game_object.model.meshes:
-                    mesh_id = id(mesh)
-                    if mesh_id not in self._mesh_vbos:
+                    if mesh.vao is None:
                         self._create_vertex_buffer(mesh)
         
         # Create shadow maps for lights that cast shadows
         self._create_shadow_maps()
     
     def _create_vertex_buffer(self, mesh: Mesh) -> bool:
-        """Create OpenGL vertex buffer for a mesh."""
+        """
+        Create the OpenGL VAO and buffers for a mesh.
+        
+        Meshes sharing geometry (Mesh.share()) reuse the first one's buffers.
+        """
         try:
             from ..graphics.vertex import Vertex as VertexClass
             
-            # Bind VAO first (required for setting up vertex attributes)
-            glBindVertexArray(self.vao)
+            buffers = self._mesh_buffers.get(mesh.geometry_key)
+            if buffers is not None:
+                mesh.vao, mesh.vbo, mesh.ebo, _ = buffers
+                return True
+            
+            # Each geometry gets its own VAO, so its attribute pointers and
+            # index buffer are restored by a single bind when drawing
+            vao = glGenVertexArrays(1)
+            glBindVertexArray(vao)
             
             # Generate buffers
             vbo = glGenBuffers(1)
-            mesh_id = id(mesh)
-            self._mesh_vbos[mesh_id] = vbo
             mesh.vbo = vbo
             
             # Bind and upload vertex data
@@ -459,6 +489,8 @@ class OpenGLRenderer:
             # Unbind VAO
             glBindVertexArray(0)
             
+            mesh.vao = vao
+            self._mesh_buffers[mesh.geometry_key] = (vao, vbo, mesh.ebo, mesh.vertex_data)
             return True
             
         except Exception as e:
@@ -526,6 +558,13 @@ class OpenGLRenderer:
         # Get active lights from scene
         active_lights = self.scene.get_active_lights()
         
+        # Uniform values live in the program, so skip the upload when the
+        # lights are exactly as they were last frame
+        light_state = [light.get_light_data() for light in active_lights]
+        if light_state == self._uploaded_light_state:
+            return
+        self._uploaded_light_state = light_state
+        
         # Enable lighting if we have lights
         has_lights = len(active_lights) > 0
         glUniform1i(self.lighting_enabled_loc, 1 if has_lights else 0)
@@ -564,12 +603,12 @@ class OpenGLRenderer:
         glUniform1i(self.num_point_lights_loc, len(point_lights))
         for i, point_light in enumerate(point_lights):
             data = point_light.get_light_data()
-            pos_loc = glGetUniformLocation(self.shader_program, f"pointLights_position[{i}]")
-            color_loc = glGetUniformLocation(self.shader_program, f"pointLights_color[{i}]")
-            intensity_loc = glGetUniformLocation(self.shader_program, f"pointLights_intensity[{i}]")
-            constant_loc = glGetUniformLocation(self.shader_program, f"pointLights_constant[{i}]")
-            linear_loc = glGetUniformLocation(self.shader_program, f"pointLights_linear[{i}]")
-            quadratic_loc = glGetUniformLocation(self.shader_program, f"pointLights_quadratic[{i}]")
+            pos_loc = self._uniform_location(f"pointLights_position[{i}]")
+            color_loc = self._uniform_location(f"pointLights_color[{i}]")
+            intensity_loc = self._uniform_location(f"pointLights_intensity[{i}]")
+            constant_loc = self._uniform_location(f"pointLights_constant[{i}]")
+            linear_loc = self._uniform_location(f"pointLights_linear[{i}]")
+            quadratic_loc = self._uniform_location(f"pointLights_quadratic[{i}]")
             
             glUniform3fv(pos_loc, 1, data['position'])
             glUniform3fv(color_loc, 1, data['color'])
@@ -582,15 +621,15 @@ class OpenGLRenderer:
         glUniform1i(self.num_spot_lights_loc, len(spot_lights))
         for i, spot_light in enumerate(spot_lights):
             data = spot_light.get_light_data()
-            pos_loc = glGetUniformLocation(self.shader_program, f"spotLights_position[{i}]")
-            dir_loc = glGetUniformLocation(self.shader_program, f"spotLights_direction[{i}]")
-            color_loc = glGetUniformLocation(self.shader_program, f"spotLights_color[{i}]")
-            intensity_loc = glGetUniformLocation(self.shader_program, f"spotLights_intensity[{i}]")
-            inner_cutoff_loc = glGetUniformLocation(self.shader_program, f"spotLights_innerCutoff[{i}]")
-            outer_cutoff_loc = glGetUniformLocation(self.shader_program, f"spotLights_outerCutoff[{i}]")
-            constant_loc = glGetUniformLocation(self.shader_program, f"spotLights_constant[{i}]")
-            linear_loc = glGetUniformLocation(self.shader_program, f"spotLights_linear[{i}]")
-            quadratic_loc = glGetUniformLocation(self.shader_program, f"spotLights_quadratic[{i}]")
+            pos_loc = self._uniform_location(f"spotLights_position[{i}]")
+            dir_loc = self._uniform_location(f"spotLights_direction[{i}]")
+            color_loc = self._uniform_location(f"spotLights_color[{i}]")
+            intensity_loc = self._uniform_location(f"spotLights_intensity[{i}]")
+            inner_cutoff_loc = self._uniform_location(f"spotLights_innerCutoff[{i}]")
+            outer_cutoff_loc = self._uniform_location(f"spotLights_outerCutoff[{i}]")
+            constant_loc = self._uniform_location(f"spotLights_constant[{i}]")
+            linear_loc = self._uniform_location(f"spotLights_linear[{i}]")
+            quadratic_loc = self._uniform_location(f"spotLights_quadratic[{i}]")
             
             glUniform3fv(pos_loc, 1, data['position'])
             glUniform3fv(dir_loc, 1, data['direction'])
@@ -602,6 +641,22 @@ class OpenGLRenderer:
             glUniform1f(linear_loc, data['linear'])
             glUniform1f(quadratic_loc, data['quadratic'])
     
+    def _uniform_location(self, name: str) -> int:
+        """
+        Get a uniform location in the main shader, looking it up only once.
+        
+        Args:
+            name: Uniform name
+            
+        Returns:
+            Uniform location (-1 if the uniform is not active)
+        """
+        location = self._uniform_locations.get(name)
+        if location is None:
+            location = glGetUniformLocation(self.shader_program, name)
+            self._uniform_locations[name] = location
+        return location
+    
     def _setup_shadow_mapping(self):
         """Set up shadow mapping uniforms and bind shadow textures."""
         if not self.scene:
@@ -625,13 +680,13 @@ class OpenGLRenderer:
             shadow_map.bind_texture(2)  # Texture unit 2
             
             light_space_matrix = self._calculate_light_space_matrix(directional_light)
-            lsm_loc = glGetUniformLocation(self.shader_program, "lightSpaceMatrixDirectional")
+            lsm_loc = self._uniform_location("lightSpaceMatrixDirectional")
             glUniformMatrix4fv(lsm_loc, 1, GL_FALSE, light_space_matrix)
             
-            use_shadows_loc = glGetUniformLocation(self.shader_program, "useShadowsDirectional")
+            use_shadows_loc = self._uniform_location("useShadowsDirectional")
             glUniform1i(use_shadows_loc, 1)
         else:
-            use_shadows_loc = glGetUniformLocation(self.shader_program, "useShadowsDirectional")
+            use_shadows_loc = self._uniform_location("useShadowsDirectional")
             glUniform1i(use_shadows_loc, 0)
         
         # Set up spotlight shadows
@@ -641,23 +696,39 @@ class OpenGLRenderer:
                 shadow_map.bind_texture(3 + i)  # Texture units 3-6
                 
                 light_space_matrix = self._calculate_light_space_matrix(spot_lights[i])
-                lsm_loc = glGetUniformLocation(self.shader_program, f"lightSpaceMatrixSpot[{i}]")
+                lsm_loc = self._uniform_location(f"lightSpaceMatrixSpot[{i}]")
                 glUniformMatrix4fv(lsm_loc, 1, GL_FALSE, light_space_matrix)
                 
-                use_shadows_loc = glGetUniformLocation(self.shader_program, f"useShadowsSpot[{i}]")
+                use_shadows_loc = self._uniform_location(f"useShadowsSpot[{i}]")
                 glUniform1i(use_shadows_loc, 1)
             else:
-                use_shadows_loc = glGetUniformLocation(self.shader_program, f"useShadowsSpot[{i}]")
+                use_shadows_loc = self._uniform_location(f"useShadowsSpot[{i}]")
                 glUniform1i(use_shadows_loc, 0)
         
         # Disable point light shadows for now
         for i in range(4):
-            use_shadows_loc = glGetUniformLocation(self.shader_program, f"useShadowsPoint[{i}]")
+            use_shadows_loc = self._uniform_location(f"useShadowsPoint[{i}]")
             glUniform1i(use_shadows_loc, 0)
     
     def _calculate_light_space_matrix(self, light):
-        """Calculate light-space matrix for shadow mapping."""
+        """
+        Get the light-space matrix for shadow mapping.
+        
+        Cached per light until its type, position or direction change, so
+        static lights build it once instead of twice per frame.
+        """
         light_data = light.get_light_data()
+        key = (light_data['type'], light_data.get('position'), light_data.get('direction'))
+        cached = self._light_space_cache.get(light.name)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        
+        matrix = self._build_light_space_matrix(light_data)
+        self._light_space_cache[light.name] = (key, matrix)
+        return matrix
+    
+    def _build_light_space_matrix(self, light_data: dict) -> np.ndarray:
+        """Build the light-space matrix from a light's data."""
         light_type = light_data['type']
         
         if light_type == 'directional':
@@ -765,6 +836,7 @@ class OpenGLRenderer:
             # Set uniform
             light_space_loc = glGetUniformLocation(self.shadow_shader, "lightSpaceMatrix")
             glUniformMatrix4fv(light_space_loc, 1, GL_FALSE, light_space_matrix)
+            model_loc = glGetUniformLocation(self.shadow_shader, "model")
             
             # Render all objects
             for game_object in self.scene.game_objects:
@@ -773,25 +845,15 @@ class OpenGLRenderer:
                 
                 # Set model matrix
                 model = game_object.transform.get_model_matrix()
-                model_loc = glGetUniformLocation(self.shadow_shader, "model")
                 glUniformMatrix4fv(model_loc, 1, GL_FALSE, model)
                 
-                # Render each mesh
+                # Render each mesh (the shadow shader only reads position)
                 for mesh in game_object.model.meshes:
-                    if mesh.vbo:
-                        glBindVertexArray(self.vao)
-                        glBindBuffer(GL_ARRAY_BUFFER, mesh.vbo)
-                        
-                        # Only need position for shadow pass
-                        glEnableVertexAttribArray(0)
-                        from ..graphics.vertex import Vertex as VertexClass
-                        stride = VertexClass.get_stride()
-                        glVertexAttribPointer(0, 3, GL_FLOAT, GL_FALSE, stride, 
-                                            ctypes.c_void_p(VertexClass.get_position_offset()))
+                    if mesh.vao:
+                        glBindVertexArray(mesh.vao)
                         
                         # Draw
                         if mesh.has_indices and mesh.ebo:
-                            glBindBuffer(GL_ELEMENT_ARRAY_BUFFER, mesh.ebo)
                             glDrawElements(GL_TRIANGLES, mesh.index_count, GL_UNSIGNED_INT, None)
                         else:
                             glDrawArrays(GL_TRIANGLES, 0, mesh.vertex_count)
@@ -807,6 +869,9 @@ class OpenGLRenderer:
         if not self.scene:
             return
         
+        # Lazy textures coming into view share a per-frame upload budget
+        LazyTexture.begin_frame()
+        
         try:
             # CRITICAL: Set viewport to current dimensions at start of frame
             # This ensures shadow pass saves/restores correct dimensions
@@ -847,28 +912,18 @@ class OpenGLRenderer:
             self._setup_shadow_mapping()
             
             # Update frustum from camera (for culling)
-            view_projection = None
             if active_camera and self.frustum_culling_enabled:
-                view_projection = projection @ view
-                # Use direct camera parameters method (more reliable than matrix extraction)
-                self.frustum.update_from_camera(
-                    active_camera.position,
-                    active_camera.front,
-                    active_camera.right,
-                    active_camera.up,
-                    active_camera.fov,
-                    active_camera.aspect_ratio,
-                    active_camera.near,
-                    active_camera.far
-                )
+                # The camera returns the same cached VP until it moves, so a
+                # still camera keeps last frame's planes
+                view_projection = active_camera.get_view_projection_matrix()
+                if view_projection is not self._frustum_view_projection:
+                    self.frustum.update_from_matrix(view_projection)
+                    self._frustum_view_projection = view_projection
             
             # Reset culling stats
             self._total_count = 0
             self._culled_count = 0
             
-            # Bind VAO
-            glBindVertexArray(self.vao)
-            
             # Get objects to render (using octree if enabled, otherwise all active objects)
             all_active_objects = self.scene.get_active_objects()
             self._total_count = len(all_active_objects)
@@ -879,22 +934,9 @@ class OpenGLRenderer:
                     objects_to_render = self.scene.get_objects_in_frustum(self.frustum)
                     self._culled_count = self._total_count - len(objects_to_render)
                 else:
-                    # No octree, do per-object frustum culling
-                    objects_to_render = []
-                    for game_object in all_active_objects:
-                        if game_object.model:
-                            model_matrix = game_object.get_model_matrix()
-                            world_bounds = game_object.model.get_bounding_box(model_matrix)
-                            result = self.frustum.test_aabb(
-                                world_bounds.min_point,
-                                world_bounds.max_point
-                            )
-                            if result != FrustumResult.OUTSIDE:
-                                objects_to_render.append(game_object)
-                            else:
-                                self._culled_count += 1
-                        else:
-                            objects_to_render.append(game_object)
+                    # No octree, cull all objects against the frustum in one pass
+                    objects_to_render = self._cull_objects(all_active_objects)
+                    self._culled_count = self._total_count - len(objects_to_render)
             else:
                 # No frustum culling, render all active objects
                 objects_to_render = all_active_objects
@@ -1051,9 +1093,11 @@ class OpenGLRenderer:
             glEnable(GL_CULL_FACE)
             glCullFace(GL_BACK)
             glFrontFace(GL_CCW)
+            self.gl_state['cull'] = True
             print(f"  [OK] Face culling enabled")
         else:
             glDisable(GL_CULL_FACE)
+            self.gl_state['cull'] = False
             print(f"  [OK] Face culling disabled")
         
         # === Wireframe Mode (Debug) ===
@@ -1092,11 +1136,6 @@ class OpenGLRenderer:
             
             # CRITICAL: Restore OpenGL state for 2D rendering
             # Shadow map creation changes framebuffer bindings and other state
-            from OpenGL.GL import (glBindFramebuffer, glViewport, GL_FRAMEBUFFER,
-                                  glEnable, glDisable, GL_BLEND, GL_DEPTH_TEST,
-                                  glBlendFunc, GL_SRC_ALPHA, GL_ONE_MINUS_SRC_ALPHA,
-                                  GL_CULL_FACE)
-            
             # Restore framebuffer to screen
             glBindFramebuffer(GL_FRAMEBUFFER, 0)
             
@@ -1113,10 +1152,12 @@ class OpenGLRenderer:
             
             # Ensure depth test is enabled for 3D
             glEnable(GL_DEPTH_TEST)
+            self.gl_state['depth'] = True
             
             # CRITICAL: Disable face culling for 2D UI rendering
             # UI elements should always be visible regardless of culling settings
             glDisable(GL_CULL_FACE)
+            self.gl_state['cull'] = False
             
             print("[Renderer] OpenGL state fully restored for rendering (culling disabled for UI)")
         else:
@@ -1145,6 +1186,33 @@ class OpenGLRenderer:
             
             print(f"[Renderer] Shadow maps recreated at {shadow_size}x{shadow_size}")
     
+    def _cull_objects(self, objects: List) -> List:
+        """
+        Frustum-cull objects using their bounding spheres, all at once.
+        
+        Objects without a model are always kept.
+        
+        Args:
+            objects: Active game objects
+            
+        Returns:
+            Objects that are at least partly inside the frustum
+        """
+        modeled = [obj for obj in objects if obj.model]
+        if not modeled:
+            return list(objects)
+        
+        matrices = get_model_matrices(modeled)
+        spheres = [obj.model.get_bounding_sphere() for obj in modeled]
+        centers = np.array([sphere.center for sphere in spheres], dtype=np.float32)
+        radii = np.array([sphere.radius for sphere in spheres], dtype=np.float32)
+        
+        world_centers, world_radii = transform_spheres(matrices, centers, radii)
+        visible = self.frustum.cull_spheres(world_centers, world_radii)
+        
+        visible_ids = {id(obj) for obj, keep in zip(modeled, visible) if keep}
+        return [obj for obj in objects if not obj.model or id(obj) in visible_ids]
+    
     def _render_standard(self, objects_to_render: List, camera: Optional[Camera] = None):
         """Render objects using standard per-object draw calls."""
         if self.use_instancing_loc is not None:
@@ -1154,6 +1222,9 @@ class OpenGLRenderer:
         if camera:
             camera_position = camera.position
         
+        # Meshes sharing geometry share a VAO: only rebind when it changes
+        bound_vao = None
+        
         for game_object in objects_to_render:
             if game_object.model:
                 # Get LOD level if enabled
@@ -1188,8 +1259,10 @@ class OpenGLRenderer:
                 
                 # Draw all meshes in the model (using LOD model if applicable)
                 for mesh in render_model.meshes:
-                    if hasattr(mesh, 'vbo') and mesh.vbo:
-                        glBindBuffer(GL_ARRAY_BUFFER, mesh.vbo)
+                    if mesh.vao:
+                        if mesh.vao != bound_vao:
+                            glBindVertexArray(mesh.vao)
+                            bound_vao = mesh.vao
                         
                         # Bind diffuse texture if available
                         has_texture = hasattr(mesh, 'texture') and mesh.texture and mesh.texture.texture_id
@@ -1217,8 +1290,7 @@ class OpenGLRenderer:
                             glUniform1i(self.use_normal_map_loc, 0)
                         
                         # Use indexed rendering if available
-                        if mesh.has_indices and hasattr(mesh, 'ebo') and mesh.ebo:
-                            glBindBuffer(GL_ELEMENT_ARRAY_BUFFER, mesh.ebo)
+                        if mesh.has_indices and mesh.ebo:
                             glDrawElements(GL_TRIANGLES, mesh.index_count, GL_UNSIGNED_INT, None)
                         else:
                             glDrawArrays(GL_TRIANGLES, 0, mesh.vertex_count)
@@ -1272,7 +1344,7 @@ class OpenGLRenderer:
             
             # Group by mesh and LOD level
             for mesh in render_model.meshes:
-                mesh_id = self.instanced_renderer.get_mesh_id(mesh)
+                mesh_id = self.instanced_renderer.get_mesh_id(mesh, game_object.material)
                 key = (mesh_id, lod_level)
                 lod_groups[key].append((game_object, render_model, mesh))
         
@@ -1300,11 +1372,11 @@ class OpenGLRenderer:
             batch.upload_to_gpu()
             
             # Render the batch
-            if not first_mesh or not hasattr(first_mesh, 'vbo') or not first_mesh.vbo:
+            if not first_mesh or not first_mesh.vao:
                 continue
             
-            # Bind mesh vertex buffer
-            glBindBuffer(GL_ARRAY_BUFFER, first_mesh.vbo)
+            # Bind mesh VAO (vertex attributes and index buffer)
+            glBindVertexArray(first_mesh.vao)
             
             # Set up instance matrix attributes
             if batch.instance_vbo is not None:
@@ -1318,7 +1390,7 @@ class OpenGLRenderer:
                     glVertexAttribPointer(location, 4, GL_FLOAT, GL_FALSE, stride, ctypes.c_void_p(i * 16))
                     glVertexAttribDivisor(location, 1)
                 
-                glBindBuffer(GL_ARRAY_BUFFER, first_mesh.vbo)
+                glBindBuffer(GL_ARRAY_BUFFER, 0)
             
             # Set material
             self._set_material(first_obj)
@@ -1347,8 +1419,7 @@ class OpenGLRenderer:
             
             # Draw instanced
             instance_count = len(objects_for_batch)
-            if first_mesh.has_indices and hasattr(first_mesh, 'ebo') and first_mesh.ebo:
-                glBindBuffer(GL_ELEMENT_ARRAY_BUFFER, first_mesh.ebo)
+            if first_mesh.has_indices and first_mesh.ebo:
                 glDrawElementsInstanced(GL_TRIANGLES, first_mesh.index_count, GL_UNSIGNED_INT, None, instance_count)
             else:
                 glDrawArraysInstanced(GL_TRIANGLES, 0, first_mesh.vertex_count, instance_count)
@@ -1376,10 +1447,13 @@ class OpenGLRenderer:
             shadow_map.cleanup()
         self.shadow_maps.clear()
         
-        # Clean up all mesh VBOs
-        for vbo in self._mesh_vbos.values():
+        # Clean up all mesh VAOs and buffers
+        for vao, vbo, ebo, _ in self._mesh_buffers.values():
+            glDeleteVertexArrays(1, [vao])
             glDeleteBuffers(1, [vbo])
-        self._mesh_vbos.clear()
+            if ebo:
+                glDeleteBuffers(1, [ebo])
+        self._mesh_buffers.clear()
         
         # Clean up VAO
         if self.vao:
@@ -1390,6 +1464,8 @@ class OpenGLRenderer:
         if self.shader_program:
             glDeleteProgram(self.shader_program)
             self.shader_program = None
+            self._uniform_locations.clear()
+            self._uploaded_light_state = None
         
         if self.shadow_shader:
             glDeleteProgram(self.shadow_shader)
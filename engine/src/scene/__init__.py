@@ -3,7 +3,7 @@
 from .scene import Scene
 from .splash_scene import SplashScene
 from .entity import Entity
-from .gameobject import GameObject, Transform
+from .gameobject import GameObject, Transform, TransformArray, build_model_matrices, get_model_matrices
 from .gamescript import GameScript
 from .camera import Camera
 
@@ -13,6 +13,9 @@ __all__ = [
     'Entity',
     'GameObject',
     'Transform',
+    'TransformArray',
+    'build_model_matrices',
+    'get_model_matrices',
     'GameScript',
     'Camera'
 ]
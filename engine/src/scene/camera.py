@@ -57,25 +57,65 @@ class Camera(Entity):
         self.yaw = -90.0  # Looking towards -Z
         self.pitch = 0.0
         
+        # Cached matrices, keyed on the values they were built from so
+        # in-place edits to position/front/up are picked up too
+        self._view_key = None
+        self._view_cache = None
+        self._projection_key = None
+        self._projection_cache = None
+        self._view_projection_cache = None
+        
         self._update_camera_vectors()
     
     def get_view_matrix(self) -> np.ndarray:
         """
         Get the view matrix (lookAt matrix).
         
+        The matrix is cached until position, front or up change; callers
+        must not modify the returned array.
+        
         Returns:
             4x4 view matrix
         """
-        return self._look_at(self.position, self.position + self.front, self.up)
+        key = (self.position.tolist(), self.front.tolist(), self.up.tolist())
+        if key != self._view_key:
+            self._view_cache = self._look_at(self.position, self.position + self.front, self.up)
+            self._view_key = key
+            self._view_projection_cache = None
+        return self._view_cache
     
     def get_projection_matrix(self) -> np.ndarray:
         """
         Get the projection matrix (perspective).
         
+        The matrix is cached until fov, aspect ratio or clip planes change;
+        callers must not modify the returned array.
+        
         Returns:
             4x4 projection matrix
         """
-        return self._perspective(self.fov, self.aspect_ratio, self.near, self.far)
+        key = (self.fov, self.aspect_ratio, self.near, self.far)
+        if key != self._projection_key:
+            self._projection_cache = self._perspective(self.fov, self.aspect_ratio, self.near, self.far)
+            self._projection_key = key
+            self._view_projection_cache = None
+        return self._projection_cache
+    
+    def get_view_projection_matrix(self) -> np.ndarray:
+        """
+        Get the combined view-projection matrix (view @ projection).
+        
+        Cached alongside the view and projection matrices; callers must not
+        modify the returned array.
+        
+        Returns:
+            4x4 view-projection matrix
+        """
+        view = self.get_view_matrix()
+        projection = self.get_projection_matrix()
+        if self._view_projection_cache is None:
+            self._view_projection_cache = view @ projection
+        return self._view_projection_cache
     
     @property
     def forward(self) -> np.ndarray:
@@ -12,6 +12,10 @@ if TYPE_CHECKING:
 class Entity:
     """Base class for all entities in a scene."""
     
+    # Bumped whenever any entity's (or scene's) script list changes, so
+    # scenes know to rebuild their flat script schedule
+    _script_generation = 0
+    
     def __init__(self, name: str = "Entity"):
         """
         Initialize an entity.
@@ -120,6 +124,7 @@ class Entity:
         # Initialize the script with this entity
         script.entity = self
         self.scripts.append(script)
+        Entity._script_generation += 1
         
         # Call on_attach callback with this entity
         script.on_attach(self)
@@ -139,6 +144,7 @@ class Entity:
             script.on_detach()
             self.scripts.remove(script)
             script.entity = None
+            Entity._script_generation += 1
     
     def get_script(self, script_type: type) -> Optional['GameScript']:
         """
@@ -178,16 +184,20 @@ class Entity:
         """
         # Start scripts on first update
         if not self._scripts_started:
-            for script in self.scripts:
-                if script.enabled:
-                    script.on_start()
-            self._scripts_started = True
+            self.start_scripts()
         
         # Update enabled scripts
         for script in self.scripts:
             if script.enabled:
                 script.on_update(delta_time)
     
+    def start_scripts(self):
+        """Call on_start on all enabled scripts (once, before their first update)."""
+        for script in self.scripts:
+            if script.enabled:
+                script.on_start()
+        self._scripts_started = True
+    
     def __repr__(self) -> str:
         """String representation of the entity."""
         return f"{self.__class__.__name__}(name='{self.name}', active={self.active}, scripts={len(self.scripts)})"
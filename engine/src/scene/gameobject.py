@@ -4,7 +4,7 @@ Represents a game object with transform and model.
 """
 
 import numpy as np
-from typing import Optional, Tuple, TYPE_CHECKING
+from typing import Optional, Tuple, List, TYPE_CHECKING
 from .entity import Entity
 from ..graphics.model import Model
 
@@ -29,9 +29,44 @@ class Transform:
             rotation: Rotation in degrees (pitch, yaw, roll)
             scale: Scale (x, y, z)
         """
-        self.position = np.array(position, dtype=np.float32)
-        self.rotation = np.array(rotation, dtype=np.float32)
-        self.scale = np.array(scale, dtype=np.float32)
+        # Rows are position, rotation, scale. A TransformArray swaps this
+        # for a view of one of its rows so all transforms of a scene sit
+        # in a single contiguous block
+        self._data = np.array([position, rotation, scale], dtype=np.float32)
+        self._store: Optional['TransformArray'] = None
+        self._index = -1
+    
+    @property
+    def position(self) -> np.ndarray:
+        """Position (x, y, z); a view, so in-place edits write through."""
+        return self._data[0]
+    
+    @position.setter
+    def position(self, value):
+        self._data[0] = value
+    
+    @property
+    def rotation(self) -> np.ndarray:
+        """Rotation in degrees (pitch, yaw, roll); a view like position."""
+        return self._data[1]
+    
+    @rotation.setter
+    def rotation(self, value):
+        self._data[1] = value
+    
+    @property
+    def scale(self) -> np.ndarray:
+        """Scale (x, y, z); a view like position."""
+        return self._data[2]
+    
+    @scale.setter
+    def scale(self, value):
+        self._data[2] = value
+    
+    @property
+    def store(self) -> Optional['TransformArray']:
+        """TransformArray holding this transform's data, if any."""
+        return self._store
     
     def get_model_matrix(self) -> np.ndarray:
         """
@@ -83,9 +118,212 @@ class Transform:
         return model
 
 
+class TransformArray:
+    """
+    Structure-of-arrays storage for many transforms.
+    
+    Attached transforms keep working as before, but their position,
+    rotation and scale live in rows of one (capacity, 3, 3) array, so
+    whole-scene passes (model matrices, culling, batched scripts) read
+    contiguous columns instead of three attributes per object. Freed
+    rows are reused by later attaches.
+    """
+    
+    def __init__(self, capacity: int = 64):
+        """
+        Initialize empty storage.
+        
+        Args:
+            capacity: Initial number of rows (grows by doubling)
+        """
+        self._data = np.zeros((max(capacity, 1), 3, 3), dtype=np.float32)
+        self._transforms: List[Optional[Transform]] = []
+        self._free: List[int] = []
+    
+    def __len__(self) -> int:
+        """Number of attached transforms."""
+        return len(self._transforms) - len(self._free)
+    
+    @property
+    def positions(self) -> np.ndarray:
+        """(N, 3) positions by row, including free rows (writable view)."""
+        return self._data[:len(self._transforms), 0]
+    
+    @property
+    def rotations(self) -> np.ndarray:
+        """(N, 3) rotations by row, including free rows (writable view)."""
+        return self._data[:len(self._transforms), 1]
+    
+    @property
+    def scales(self) -> np.ndarray:
+        """(N, 3) scales by row, including free rows (writable view)."""
+        return self._data[:len(self._transforms), 2]
+    
+    def attach(self, transform: Transform) -> int:
+        """
+        Move a transform's data into this storage.
+        
+        Args:
+            transform: Transform to attach (detached from any other storage)
+            
+        Returns:
+            Row index of the transform
+        """
+        if transform._store is self:
+            return transform._index
+        if transform._store is not None:
+            transform._store.detach(transform)
+        
+        if self._free:
+            index = self._free.pop()
+        else:
+            index = len(self._transforms)
+            self._transforms.append(None)
+            if index == len(self._data):
+                self._grow()
+        
+        self._data[index] = transform._data
+        self._transforms[index] = transform
+        transform._data = self._data[index]
+        transform._store = self
+        transform._index = index
+        return index
+    
+    def detach(self, transform: Transform):
+        """
+        Give a transform its own copy of its data and free its row.
+        
+        Args:
+            transform: Transform previously attached to this storage
+        """
+        if transform._store is not self:
+            return
+        index = transform._index
+        transform._data = self._data[index].copy()
+        transform._store = None
+        transform._index = -1
+        self._transforms[index] = None
+        self._free.append(index)
+    
+    def _grow(self):
+        """Double the capacity and re-point attached transforms at the new rows."""
+        data = np.zeros((len(self._data) * 2, 3, 3), dtype=np.float32)
+        data[:len(self._data)] = self._data
+        self._data = data
+        for index, transform in enumerate(self._transforms):
+            if transform is not None:
+                transform._data = data[index]
+    
+    def indices_of(self, transforms: List[Transform]) -> Optional[np.ndarray]:
+        """
+        Get the row indices of transforms.
+        
+        Args:
+            transforms: Transforms to look up
+            
+        Returns:
+            Index array in the same order, or None if any transform is not
+            attached to this storage
+        """
+        indices = np.array(
+            [t._index if t._store is self else -1 for t in transforms],
+            dtype=np.intp
+        )
+        if len(indices) and indices.min() < 0:
+            return None
+        return indices
+    
+    def model_matrices(self, indices: np.ndarray) -> np.ndarray:
+        """
+        Build model matrices for the given rows.
+        
+        Args:
+            indices: Row indices (see indices_of())
+            
+        Returns:
+            (N, 4, 4) float32 model matrices
+        """
+        rows = self._data[indices]
+        return build_model_matrices(rows[:, 0], rows[:, 1], rows[:, 2])
+
+
+def build_model_matrices(
+    positions: np.ndarray,
+    rotations: np.ndarray,
+    scales: np.ndarray
+) -> np.ndarray:
+    """
+    Build many model matrices at once, matching Transform.get_model_matrix().
+    
+    Args:
+        positions: (N, 3) positions
+        rotations: (N, 3) rotations in degrees (pitch, yaw, roll)
+        scales: (N, 3) scales
+        
+    Returns:
+        (N, 4, 4) float32 model matrices
+    """
+    radians = np.radians(rotations)
+    cos = np.cos(radians)
+    sin = np.sin(radians)
+    cx, cy, cz = cos[:, 0], cos[:, 1], cos[:, 2]
+    sx, sy, sz = sin[:, 0], sin[:, 1], sin[:, 2]
+    
+    # rotation = rotation_z @ rotation_y @ rotation_x, written out
+    rotation = np.empty((len(positions), 3, 3), dtype=np.float32)
+    rotation[:, 0, 0] = cz * cy
+    rotation[:, 0, 1] = -sz * cx + cz * sy * sx
+    rotation[:, 0, 2] = sz * sx + cz * sy * cx
+    rotation[:, 1, 0] = sz * cy
+    rotation[:, 1, 1] = cz * cx + sz * sy * sx
+    rotation[:, 1, 2] = -cz * sx + sz * sy * cx
+    rotation[:, 2, 0] = -sy
+    rotation[:, 2, 1] = cy * sx
+    rotation[:, 2, 2] = cy * cx
+    
+    # translation @ rotation @ scale: scale scales the columns, and the
+    # translation row is rotated and scaled along with them
+    models = np.zeros((len(positions), 4, 4), dtype=np.float32)
+    models[:, :3, :3] = rotation * scales[:, None, :]
+    models[:, 3, :3] = np.einsum('ni,nij->nj', positions, rotation) * scales
+    models[:, 3, 3] = 1.0
+    return models
+
+
+def get_model_matrices(game_objects: List['GameObject']) -> np.ndarray:
+    """
+    Get the model matrices of many game objects in one vectorized pass.
+    
+    Args:
+        game_objects: Game objects
+        
+    Returns:
+        (N, 4, 4) float32 model matrices, in the same order
+    """
+    transforms = [obj.transform for obj in game_objects]
+    
+    # Objects of one scene share a TransformArray: gather their rows at once
+    store = transforms[0]._store if transforms else None
+    if store is not None:
+        indices = store.indices_of(transforms)
+        if indices is not None:
+            return store.model_matrices(indices)
+    
+    rows = np.array([t._data for t in transforms], dtype=np.float32).reshape(-1, 3, 3)
+    return build_model_matrices(rows[:, 0], rows[:, 1], rows[:, 2])
+
+
 class GameObject(Entity):
     """Represents a game object in the scene."""
     
+    # Texture paths to load once the OpenGL context exists, and their
+    # background decodes (see Application.preload_textures)
+    _texture_path: Optional[str] = None
+    _normal_map_path: Optional[str] = None
+    _roughness_map_path: Optional[str] = None
+    _ao_map_path: Optional[str] = None
+    _pending_textures: Optional[dict] = None
+    
     def __init__(
         self,
         name: str = "GameObject",
@@ -13,6 +13,9 @@ if TYPE_CHECKING:
 class GameScript:
     """Base class for game scripts/behaviors."""
     
+    # Input manager, set by the scene before the first update
+    input = None
+    
     def __init__(self, entity: Optional['Entity'] = None):
         """
         Initialize a game script.
@@ -3,13 +3,14 @@ Scene Module
 Manages game objects, cameras, and scene hierarchy.
 """
 
-from typing import List, Optional, TYPE_CHECKING
+from typing import List, Optional, Tuple, TYPE_CHECKING
 import numpy as np
+from .entity import Entity
+from .gameobject import TransformArray
 
 if TYPE_CHECKING:
     from .gameobject import GameObject
     from .camera import Camera
-    from .entity import Entity
     from .gamescript import GameScript
     from ..graphics.light import Light
     from ..spatial.octree import Octree
@@ -35,14 +36,32 @@ class Scene:
         self.audio_sources: List = []  # Audio sources (Audio2D and Audio3D)
         self.active_camera_index: int = 0
         self._entities: List['Entity'] = []  # All entities (unified list)
+        self._entities_snapshot: Tuple['Entity', ...] = ()  # See get_all_entities()
+        self._snapshot_generation = -1
+        self.transforms = TransformArray()  # Game object transforms (SoA)
         self.scripts: List['GameScript'] = []  # Global scripts attached to the scene
         self._scripts_started = False
         
+        # Flat (entity, script) update list, rebuilt when scripts or
+        # entities change (see Entity._script_generation)
+        self._script_schedule: List[tuple] = []
+        self._schedule_generation = -1
+        self._unstarted_entities: List['Entity'] = []
+        self._script_input = None
+        
         # Spatial partitioning
         self.octree: Optional['Octree'] = None
         self.octree_enabled = False
         self.octree_auto_rebuild = True  # Rebuild octree when objects added/removed
     
+    def on_enter(self):
+        """
+        Called by Application.set_scene() when this scene becomes active,
+        before its first frame. Override to build per-visit state up front
+        instead of during the first render.
+        """
+        pass
+    
     def add_game_object(self, game_object: 'GameObject'):
         """
         Add a game object to the scene.
@@ -52,6 +71,8 @@ class Scene:
         """
         self.game_objects.append(game_object)
         self._entities.append(game_object)
+        self.transforms.attach(game_object.transform)
+        Entity._script_generation += 1
         
         # Add to octree if enabled
         if self.octree_enabled and self.octree:
@@ -66,8 +87,10 @@ class Scene:
         """
         if game_object in self.game_objects:
             self.game_objects.remove(game_object)
+            self.transforms.detach(game_object.transform)
         if game_object in self._entities:
             self._entities.remove(game_object)
+            Entity._script_generation += 1
         
         # Remove from octree if enabled
         if self.octree_enabled and self.octree:
@@ -99,6 +122,8 @@ class Scene:
     
     def clear(self):
         """Remove all game objects from the scene."""
+        for game_object in self.game_objects:
+            self.transforms.detach(game_object.transform)
         self.game_objects.clear()
         if self.octree:
             self.octree.clear()
@@ -119,6 +144,7 @@ class Scene:
         """
         self.cameras.append(camera)
         self._entities.append(camera)
+        Entity._script_generation += 1
         # If this is the first camera, set it as active
         if len(self.cameras) == 1:
             self.active_camera_index = 0
@@ -140,6 +166,7 @@ class Scene:
         
         if camera in self._entities:
             self._entities.remove(camera)
+            Entity._script_generation += 1
     
     def set_active_camera(self, index: int):
         """
@@ -178,6 +205,7 @@ class Scene:
         """
         self.lights.append(light)
         self._entities.append(light)
+        Entity._script_generation += 1
     
     def remove_light(self, light: 'Light'):
         """
@@ -190,6 +218,7 @@ class Scene:
             self.lights.remove(light)
             if light in self._entities:
                 self._entities.remove(light)
+                Entity._script_generation += 1
     
     def get_active_lights(self) -> List['Light']:
         """
@@ -216,6 +245,7 @@ class Scene:
         """
         self.text3d_objects.append(text3d)
         self._entities.append(text3d)
+        Entity._script_generation += 1
     
     def remove_text3d(self, text3d):
         """
@@ -228,6 +258,7 @@ class Scene:
             self.text3d_objects.remove(text3d)
             if text3d in self._entities:
                 self._entities.remove(text3d)
+                Entity._script_generation += 1
     
     def get_active_text3d(self) -> List:
         """
@@ -254,6 +285,7 @@ class Scene:
         """
         self.audio_sources.append(audio_source)
         self._entities.append(audio_source)
+        Entity._script_generation += 1
     
     def remove_audio_source(self, audio_source):
         """
@@ -269,6 +301,7 @@ class Scene:
             self.audio_sources.remove(audio_source)
             if audio_source in self._entities:
                 self._entities.remove(audio_source)
+                Entity._script_generation += 1
     
     def get_active_audio_sources(self) -> List:
         """
@@ -286,14 +319,20 @@ class Scene:
     
     # === Entity Management (Generic) ===
     
-    def get_all_entities(self) -> List['Entity']:
+    def get_all_entities(self) -> Tuple['Entity', ...]:
         """
         Get all entities in the scene (game objects + cameras).
         
+        The tuple is reused until an entity is added or removed (tracked
+        by Entity._script_generation), so per-frame callers don't copy.
+        
         Returns:
-            List of all entities
+            Tuple of all entities
         """
-        return self._entities.copy()
+        if self._snapshot_generation != Entity._script_generation:
+            self._entities_snapshot = tuple(self._entities)
+            self._snapshot_generation = Entity._script_generation
+        return self._entities_snapshot
     
     def get_active_entities(self) -> List['Entity']:
         """
@@ -349,6 +388,7 @@ class Scene:
         script.entity = None
         script.scene = self
         self.scripts.append(script)
+        Entity._script_generation += 1
         
         # Call on_attach callback with scene reference
         script.on_attach(self)
@@ -368,6 +408,7 @@ class Scene:
             script.on_detach()
             self.scripts.remove(script)
             script.scene = None
+            Entity._script_generation += 1
     
     def get_script(self, script_type: type) -> Optional['GameScript']:
         """
@@ -412,15 +453,64 @@ class Scene:
                     script.on_start()
             self._scripts_started = True
         
-        # Update global scripts
-        for script in self.scripts:
-            if script.enabled:
+        if self._schedule_generation != Entity._script_generation:
+            self._build_script_schedule()
+        
+        # Entity scripts start the first frame their entity is active
+        if self._unstarted_entities:
+            for entity in self._unstarted_entities:
+                if entity.active and not entity._scripts_started:
+                    entity.start_scripts()
+            self._unstarted_entities = [
+                entity for entity in self._unstarted_entities if not entity._scripts_started
+            ]
+        
+        # Update global scripts, then entity scripts, in one flat pass.
+        # Scripts that add or remove scripts/entities rebind the schedule
+        # rather than mutating it, so this pass finishes over the current
+        # list and the new one is picked up next frame
+        for entity, script in self._script_schedule:
+            if script.enabled and (entity is None or entity.active):
                 script.on_update(delta_time)
-        
-        # Update all entity scripts
+    
+    def _build_script_schedule(self):
+        """Flatten global and entity scripts into one update list."""
+        schedule = [(None, script) for script in self.scripts]
         for entity in self._entities:
-            if entity.active:
-                entity.update_scripts(delta_time)
+            schedule.extend((entity, script) for script in entity.scripts)
+        
+        self._script_schedule = schedule
+        self._unstarted_entities = [
+            entity for entity in self._entities if entity.scripts and not entity._scripts_started
+        ]
+        self._schedule_generation = Entity._script_generation
+        
+        if self._script_input is not None:
+            self._assign_script_input()
+    
+    def set_script_input(self, input_manager):
+        """
+        Give every script the input manager (GameScript.input).
+        
+        Scripts added later receive it when the schedule is rebuilt.
+        
+        Args:
+            input_manager: Input instance
+        """
+        if input_manager is self._script_input:
+            return
+        self._script_input = input_manager
+        self._assign_script_input()
+    
+    def _assign_script_input(self):
+        """Set `input` on every scheduled script."""
+        if self._schedule_generation != Entity._script_generation:
+            # Rebuilding assigns the input to the fresh script list
+            self._build_script_schedule()
+            return
+        input_manager = self._script_input
+        for _, script in self._script_schedule:
+            script.input = input_manager
     
     # === Spatial Partitioning (Octree) ===
     
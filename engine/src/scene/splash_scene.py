@@ -3,11 +3,13 @@ Splash Scene Module
 A scene for showing splash screens with centered text.
 """
 
-from typing import Optional
+from typing import Optional, TYPE_CHECKING
 from .scene import Scene
-from ..ui.text2d import Text2D
 from ..ui.font import Font
 
+if TYPE_CHECKING:
+    from ..ui.text2d import Text2D
+
 
 class SplashScene(Scene):
     """
@@ -27,8 +29,8 @@ class SplashScene(Scene):
         super().__init__(name)
         
         # Text entities
-        self.title_text: Optional[Text2D] = None
-        self.loading_text: Optional[Text2D] = None
+        self.title_text: Optional['Text2D'] = None
+        self.loading_text: Optional['Text2D'] = None
         
         # Store fonts
         self.title_font = title_font
@@ -43,6 +45,9 @@ class SplashScene(Scene):
     
     def _create_text_entities(self):
         """Create the title and loading text entities."""
+        # Imported here: ui.text2d imports the scene package (for Entity)
+        from ..ui.text2d import Text2D
+        
         # Title text (will be centered)
         self.title_text = Text2D(
             label="SplashTitle",
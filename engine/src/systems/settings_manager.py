@@ -7,7 +7,7 @@ Generic settings system for render, audio, window, and performance.
 import json
 import os
 from pathlib import Path
-from typing import Any, Dict, Optional, List
+from typing import Any, Callable, Dict, Optional, List
 import copy
 
 
@@ -207,27 +207,35 @@ class SettingsManager:
             settings.set('graphics.bloom', True)
             settings.set('audio.master_volume', 0.5, save=True)
         """
-        keys = path.split('.')
-        target = self.settings
-        
-        # Navigate to the parent
-        for key in keys[:-1]:
-            if key not in target:
-                target[key] = {}
-            target = target[key]
-        
-        # Set the value
-        old_value = target.get(keys[-1])
-        target[keys[-1]] = value
-        
-        # Trigger callbacks if value changed
-        if old_value != value:
-            self._trigger_callbacks(path, value, old_value)
+        *parents, leaf = path.split('.')
+        self._assign(path, parents, leaf, value)
         
         # Save if requested
         if save:
             self.save()
     
+    def get_setter(self, path: str) -> Callable[[Any], None]:
+        """
+        Get a setter bound to one setting path.
+        The path is split once here, so calling the setter (e.g. from a UI
+        callback) skips the string parsing done by set(). Callbacks still fire.
+        
+        Args:
+            path: Dot-separated path (e.g., 'window.vsync')
+            
+        Returns:
+            Function(value) that sets the setting
+            
+        Example:
+            checkbox.on_toggle = settings.get_setter('window.vsync')
+        """
+        *parents, leaf = path.split('.')
+        
+        def setter(value: Any):
+            self._assign(path, parents, leaf, value)
+        
+        return setter
+    
     def get_category(self, category: str) -> Dict[str, Any]:
         """
         Get all settings in a category.
@@ -313,6 +321,31 @@ class SettingsManager:
             self._callbacks[path] = []
         self._callbacks[path].append(callback)
     
+    def _assign(self, path: str, parents: List[str], leaf: str, value: Any):
+        """
+        Store a setting value and fire callbacks if it changed.
+        Shared by set() and get_setter() setters.
+        
+        Args:
+            path: Full dot-separated path (passed to callbacks)
+            parents: Keys of the containers above the setting
+            leaf: Key of the setting itself
+            value: New value
+        """
+        # Containers are looked up per call - reset_to_defaults() replaces them
+        target = self.settings
+        for key in parents:
+            if key not in target:
+                target[key] = {}
+            target = target[key]
+        
+        old_value = target.get(leaf)
+        target[leaf] = value
+        
+        # Trigger callbacks if value changed
+        if old_value != value:
+            self._trigger_callbacks(path, value, old_value)
+    
     def _trigger_callbacks(self, path: str, new_value: Any, old_value: Any):
         """Trigger callbacks for a setting change."""
         if path in self._callbacks:
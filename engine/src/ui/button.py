@@ -114,7 +114,7 @@ class UIButton(UIElement):
         )
         
         # Draw text (centered - use compiled sizes for accurate centering)
-        if text_renderer and hasattr(text_renderer, 'font') and text_renderer.font:
+        if text_renderer and text_renderer.font:
             # Text centering calculation
             text_width = len(self.text) * 10 * self.style.text_size  # Restored original
             text_height = 16 * self.style.text_size
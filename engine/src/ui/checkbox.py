@@ -79,6 +79,15 @@ class UICheckbox(UIElement):
             if self.on_toggle:
                 self.on_toggle(value)
     
+    def set_checked(self, value: bool):
+        """
+        Set checked state without triggering the toggle callback.
+        
+        Args:
+            value: New checked state
+        """
+        self._checked = value
+    
     def _handle_toggle(self):
         """Handle click to toggle."""
         self.checked = not self._checked
@@ -130,7 +139,7 @@ class UICheckbox(UIElement):
             )
         
         # Draw label (scaled positioning)
-        if self.label and text_renderer and hasattr(text_renderer, 'font') and text_renderer.font:
+        if self.label and text_renderer and text_renderer.font:
             label_offset_x = 10 * self.style.text_size  # Scale horizontal spacing
             label_offset_y = 8 * self.style.text_size   # Scale vertical offset
             label_x = x + box_size + label_offset_x
@@ -22,6 +22,7 @@ class UIDropdown(UIElement):
         selected_index: int = 0,
         anchor: Anchor = Anchor.TOP_LEFT,
         on_select: Optional[Callable[[int, str], None]] = None,
+        on_open_change: Optional[Callable[['UIDropdown', bool], None]] = None,
         style: Optional[DropdownStyle] = None,
         **kwargs
     ):
@@ -35,6 +36,7 @@ class UIDropdown(UIElement):
             selected_index: Initially selected index
             anchor: Anchor point
             on_select: Selection callback (receives index and text)
+            on_open_change: Open/close callback (receives dropdown and open state)
             style: Dropdown style (uses default if None)
             **kwargs: Additional CSS-like parameters
         """
@@ -76,6 +78,7 @@ class UIDropdown(UIElement):
         self.options = options or ["Option 1", "Option 2"]
         self.selected_index = max(0, min(len(self.options) - 1, selected_index))
         self.on_select = on_select
+        self.on_open_change = on_open_change
         self.style = style or DropdownStyle()
         
         # State
@@ -93,13 +96,40 @@ class UIDropdown(UIElement):
     
     def _handle_toggle(self):
         """Toggle dropdown open/closed."""
-        self.is_open = not self.is_open
+        self.set_open(not self.is_open)
+    
+    def set_open(self, is_open: bool):
+        """
+        Open or close the dropdown.
+        Notifies on_open_change only when the state actually transitions,
+        so listeners can cache render order instead of polling every frame.
+        
+        Args:
+            is_open: New open state
+        """
+        if self.is_open == is_open:
+            return
+        
+        self.is_open = is_open
         
         # Change layer when opening/closing
         if self.is_open:
             self.layer = 300  # Move to overlay layer (on top of everything!)
         else:
             self.layer = 200  # Return to normal layer
+        
+        if self.on_open_change:
+            self.on_open_change(self, self.is_open)
+    
+    def set_selected(self, index: int):
+        """
+        Select an option by index without triggering the select callback.
+        
+        Args:
+            index: Option index
+        """
+        if 0 <= index < len(self.options):
+            self.selected_index = index
     
     def select(self, index: int):
         """
@@ -156,12 +186,12 @@ class UIDropdown(UIElement):
                 if (x <= mouse_x <= x + w and 
                     option_y <= mouse_y <= option_y + self.style.item_height):
                     self.select(i)
-                    self.is_open = False
+                    self.set_open(False)
                     return True
         
         # Click outside closes dropdown
         if self.is_open:
-            self.is_open = False
+            self.set_open(False)
         
         return False
     
@@ -197,7 +227,7 @@ class UIDropdown(UIElement):
         )
         
         # Draw selected text
-        if text_renderer and hasattr(text_renderer, 'font') and text_renderer.font:
+        if text_renderer and text_renderer.font:
             text = self.get_selected_text()
             text_x = x + self.style.padding
             text_y_offset = 8 * self.style.text_size  # Scale vertical offset
@@ -265,7 +295,7 @@ class UIDropdown(UIElement):
                     )
                 
                 # Draw option text (scaled positioning)
-                if text_renderer and hasattr(text_renderer, 'font') and text_renderer.font:
+                if text_renderer and text_renderer.font:
                     opt_text_x = x + self.style.padding
                     opt_text_y_offset = 8 * self.style.text_size  # Scale vertical offset
                     opt_text_y = option_y + self.style.item_height / 2 + opt_text_y_offset
@@ -303,9 +303,15 @@ class FlexContainer(UIElement):
         
         Args:
             delta_time: Time since last frame
+            
+        Returns:
+            True if any child's appearance changed
         """
+        changed = False
         for child in self.children:
-            child.update(delta_time)
+            if child.update(delta_time):
+                changed = True
+        return changed
     
     def render(self, ui_renderer, text_renderer):
         """
@@ -6,7 +6,7 @@ Loads TrueType fonts using PIL/Pillow and generates glyph textures.
 from PIL import Image, ImageDraw, ImageFont  # type: ignore
 from OpenGL.GL import *  # type: ignore
 import numpy as np
-from typing import Optional
+from typing import Dict, Optional, Tuple
 import os
 from .font import Font, Glyph
 
@@ -19,10 +19,43 @@ class FontLoader:
     # ASCII printable characters (32-126)
     DEFAULT_CHARSET = ''.join(chr(i) for i in range(32, 127))
     
+    # Common system fonts tried in order when the requested file does not exist
+    FALLBACK_PATHS = (
+        "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf",
+        "C:/Windows/Fonts/arial.ttf",
+    )
+    
+    # Loaded fonts keyed by (requested path, size, charset); glyph textures
+    # are shared by every caller asking for the same font
+    _cache: Dict[Tuple[str, int, Optional[str]], Font] = {}
+    # load() calls not yet matched by release(), per cache key
+    _ref_counts: Dict[Tuple[str, int, Optional[str]], int] = {}
+    
+    @staticmethod
+    def resolve_path(filepath: str) -> Optional[str]:
+        """
+        Find a loadable font file, falling back to FALLBACK_PATHS.
+        
+        Args:
+            filepath: Requested path to .ttf font file
+            
+        Returns:
+            Existing font path, or None if no font could be found
+        """
+        if os.path.exists(filepath):
+            return filepath
+        for fallback in FontLoader.FALLBACK_PATHS:
+            if os.path.exists(fallback):
+                print(f"WARNING: Font file not found: {filepath}, using {fallback}")
+                return fallback
+        return None
+    
     @staticmethod
     def load(filepath: str, size: int = 48, charset: Optional[str] = None) -> Optional[Font]:
         """
         Load a TrueType font and generate glyph textures using PIL.
+        Fonts are cached, so loading the same font again is a dict lookup;
+        callers that are done with a font hand it back with release().
         
         Args:
             filepath: Path to .ttf font file
@@ -32,10 +65,46 @@ class FontLoader:
         Returns:
             Font instance if successful, None otherwise
         """
+        key = (filepath, size, charset)
+        font = FontLoader._cache.get(key)
+        if font is None:
+            font = FontLoader._load_uncached(filepath, size, charset)
+            if font is None:
+                return None
+            FontLoader._cache[key] = font
+        
+        FontLoader._ref_counts[key] = FontLoader._ref_counts.get(key, 0) + 1
+        return font
+    
+    @staticmethod
+    def release(font: Font):
+        """
+        Hand back a font obtained from load(); its glyph textures are
+        freed once every load() of it has been released.
+        
+        Args:
+            font: Font returned by load()
+        """
+        for key, cached in FontLoader._cache.items():
+            if cached is font:
+                remaining = FontLoader._ref_counts.get(key, 1) - 1
+                if remaining > 0:
+                    FontLoader._ref_counts[key] = remaining
+                    return
+                break
+        
+        # Last user (or a font the cache doesn't know about)
+        FontLoader.cleanup_font(font)
+    
+    @staticmethod
+    def _load_uncached(filepath: str, size: int, charset: Optional[str]) -> Optional[Font]:
+        """Load a font from disk and upload its glyph textures."""
         try:
-            if not os.path.exists(filepath):
+            resolved = FontLoader.resolve_path(filepath)
+            if resolved is None:
                 print(f"ERROR: Font file not found: {filepath}")
                 return None
+            filepath = resolved
             
             print(f"Loading font: {filepath} (size {size})")
             
@@ -162,12 +231,19 @@ class FontLoader:
     @staticmethod
     def cleanup_font(font: Font):
         """
-        Clean up OpenGL resources for a font.
+        Clean up OpenGL resources for a font, even if other callers still
+        use it (see release() for shared fonts).
         
         Args:
             font: Font to clean up
         """
         try:
+            # Drop it from the cache so the next load() re-creates the textures
+            for key, cached in list(FontLoader._cache.items()):
+                if cached is font:
+                    del FontLoader._cache[key]
+                    FontLoader._ref_counts.pop(key, None)
+            
             for glyph in font.glyphs.values():
                 if glyph.texture_id:
                     glDeleteTextures([glyph.texture_id])
@@ -109,7 +109,7 @@ class UILabel(UIElement):
             )
         
         # Draw text (use actual scaled text size for positioning)
-        if text_renderer and hasattr(text_renderer, 'font') and text_renderer.font:
+        if text_renderer and text_renderer.font:
             # Calculate actual rendered text height for consistent positioning
             actual_text_scale = self.size * self.style.text_size
             text_height = 16 * actual_text_scale  # Standard text height calculation
@@ -99,6 +99,16 @@ class UISlider(UIElement):
         if self._value != old_value and self.on_value_change:
             self.on_value_change(self._value)
     
+    def set_value(self, val: float):
+        """
+        Set value without triggering the change callback
+        (e.g. to reflect a setting that changed elsewhere).
+        
+        Args:
+            val: New value (clamped to the slider range)
+        """
+        self._value = max(self.min_value, min(self.max_value, val))
+    
     def get_value_percentage(self) -> float:
         """Get value as percentage (0.0 - 1.0)."""
         if self.max_value == self.min_value:
@@ -220,7 +230,7 @@ class UISlider(UIElement):
         )
         
         # Draw label at slider level (scaled spacing)
-        if self.label and text_renderer and hasattr(text_renderer, 'font') and text_renderer.font:
+        if self.label and text_renderer and text_renderer.font:
             label_offset_y = 5 * self.style.text_size  # Positive offset - moves down
             text_renderer.render_text(
                 text_renderer.font,
@@ -232,7 +242,7 @@ class UISlider(UIElement):
             )
         
         # Draw value next to the handle (not far right)
-        if text_renderer and hasattr(text_renderer, 'font') and text_renderer.font:
+        if text_renderer and text_renderer.font:
             # Show actual shadow value if it's shadow quality
             if "Shadow" in self.label:
                 # Map value to shadow resolution
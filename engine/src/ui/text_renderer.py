@@ -6,11 +6,29 @@ Low-level OpenGL text rendering engine.
 from OpenGL.GL import *  # type: ignore
 from OpenGL.GL.shaders import compileProgram, compileShader  # type: ignore
 import numpy as np
-from typing import Optional, Tuple, List
+from typing import Optional, Tuple, List, Dict
+from collections import OrderedDict
 import os
 from .font import Font
 
 
+# Texture coordinates for the two triangles of a glyph quad
+# (image is already flipped in font_loader, so use normal texture coords)
+_QUAD_UVS = np.array([
+    [0.0, 0.0],  # bottom-left (at baseline y)
+    [0.0, 1.0],  # top-left
+    [1.0, 1.0],  # top-right
+    [0.0, 0.0],  # bottom-left (at baseline y)
+    [1.0, 1.0],  # top-right
+    [1.0, 0.0]   # bottom-right (at baseline y)
+], dtype=np.float32)
+
+# Laid-out strings and uploaded batches kept for reuse, so text that did
+# not change since last frame is neither re-laid out nor re-uploaded
+_LAYOUT_CACHE_SIZE = 256
+_BATCH_CACHE_SIZE = 8
+
+
 class TextRenderer:
     """
     Low-level text rendering engine that handles OpenGL setup and rendering.
@@ -21,13 +39,26 @@ class TextRenderer:
         """Initialize text renderer."""
         self.shader_program: Optional[int] = None
         self.vao: Optional[int] = None
-        self.vbo: Optional[int] = None
         self.projection_loc: Optional[int] = None
         self.text_color_loc: Optional[int] = None
         self.text_sampler_loc: Optional[int] = None
         self.initialized = False
         self.screen_width = 0
         self.screen_height = 0
+        self.font: Optional[Font] = None  # Font attached for UI widget text
+        # Renderer's tracked GL state ({'depth': bool, 'cull': bool}); depth
+        # is queried from OpenGL on each flush while this is None
+        self.gl_state: Optional[Dict[str, bool]] = None
+        
+        # Glyph quads queued between begin_batch() and end_batch()
+        self._batch_depth = 0
+        self._batch_quads: List[Tuple[float, float, float, float]] = []
+        self._batch_keys: List[Tuple[Tuple[float, float, float], int]] = []
+        
+        # (font, text, x, y, scale) -> (glyph quads, glyph texture ids)
+        self._layout_cache: OrderedDict = OrderedDict()
+        # (quads, keys) of a flushed batch -> (VBO, draw runs)
+        self._batch_cache: OrderedDict = OrderedDict()
         
     def init(self, screen_width: int, screen_height: int) -> bool:
         """
@@ -50,21 +81,11 @@ class TextRenderer:
             self.text_color_loc = glGetUniformLocation(self.shader_program, "textColor")
             self.text_sampler_loc = glGetUniformLocation(self.shader_program, "text")
             
-            # Create VAO and VBO for rendering quads
+            # Create VAO for rendering quads; each batch brings its own VBO
+            # (see _flush_batch) and is pointed at before drawing
             self.vao = glGenVertexArrays(1)
-            self.vbo = glGenBuffers(1)
-            
             glBindVertexArray(self.vao)
-            glBindBuffer(GL_ARRAY_BUFFER, self.vbo)
-            
-            # Allocate memory for quad vertices (6 vertices * 4 floats)
-            glBufferData(GL_ARRAY_BUFFER, 6 * 4 * 4, None, GL_DYNAMIC_DRAW)
-            
-            # Set up vertex attributes
             glEnableVertexAttribArray(0)
-            glVertexAttribPointer(0, 4, GL_FLOAT, GL_FALSE, 4 * 4, None)
-            
-            glBindBuffer(GL_ARRAY_BUFFER, 0)
             glBindVertexArray(0)
             
             # Mark as initialized BEFORE setting projection (so it doesn't return early)
@@ -147,10 +168,32 @@ class TextRenderer:
         glUniformMatrix4fv(self.projection_loc, 1, GL_FALSE, projection)
         glUseProgram(0)
     
+    def clear_font(self):
+        """Detach the font attached for UI widget text."""
+        self.font = None
+    
+    def begin_batch(self):
+        """
+        Start queuing text instead of drawing it immediately.
+        Everything passed to render_text() until the matching end_batch()
+        is uploaded once and drawn with one call per glyph/color pair.
+        Batches may nest; only the outermost end_batch() draws.
+        """
+        self._batch_depth += 1
+    
+    def end_batch(self):
+        """Draw all text queued since the matching begin_batch()."""
+        if self._batch_depth == 0:
+            return
+        self._batch_depth -= 1
+        if self._batch_depth == 0:
+            self._flush_batch()
+    
     def render_text(self, font: Font, text: str, x: float, y: float, 
                    scale: float = 1.0, color: Tuple[float, float, float] = (1.0, 1.0, 1.0)):
         """
         Render text at screen position.
+        Queued into the current batch if one is open.
         
         Args:
             font: Font to use
@@ -166,26 +209,45 @@ class TextRenderer:
         if not font or not text:
             return
         
-        # Enable blending for text transparency
-        glEnable(GL_BLEND)
-        glBlendFunc(GL_SRC_ALPHA, GL_ONE_MINUS_SRC_ALPHA)
+        rgb = (color[0], color[1], color[2])
         
-        # Disable depth test for 2D text
-        depth_test_enabled = glIsEnabled(GL_DEPTH_TEST)
-        if depth_test_enabled:
-            glDisable(GL_DEPTH_TEST)
+        layout_key = (font, text, x, y, scale)
+        layout = self._layout_cache.get(layout_key)
+        if layout is None:
+            layout = self._layout_text(font, text, x, y, scale)
+            self._layout_cache[layout_key] = layout
+            if len(self._layout_cache) > _LAYOUT_CACHE_SIZE:
+                self._layout_cache.popitem(last=False)
+        else:
+            self._layout_cache.move_to_end(layout_key)
         
-        # Use text shader
-        glUseProgram(self.shader_program)
-        glUniform3f(self.text_color_loc, color[0], color[1], color[2])
-        glUniform1i(self.text_sampler_loc, 0)
-        glActiveTexture(GL_TEXTURE0)
+        glyph_quads, texture_ids = layout
+        self._batch_quads.extend(glyph_quads)
+        self._batch_keys.extend([(rgb, texture_id) for texture_id in texture_ids])
         
-        glBindVertexArray(self.vao)
+        if self._batch_depth == 0:
+            self._flush_batch()
+    
+    @staticmethod
+    def _layout_text(font: Font, text: str, x: float, y: float, scale: float) -> Tuple[tuple, tuple]:
+        """
+        Lay out the glyph quads of a string.
         
-        # Render each character
+        Args:
+            font: Font to use
+            text: Text string
+            x: X position (pixels, left edge)
+            y: Y position (pixels, baseline)
+            scale: Scale factor
+            
+        Returns:
+            ((x, y, width, height) per drawn glyph, glyph texture ids)
+        """
+        quads = []
+        texture_ids = []
+        
+        # Lay out each character
         current_x = x
-        chars_rendered = 0
         for char in text:
             glyph = font.get_glyph(char)
             if not glyph:
@@ -196,8 +258,6 @@ class TextRenderer:
                 current_x += (glyph.advance >> 6) * scale
                 continue
             
-            chars_rendered += 1
-            
             # Calculate glyph position and size
             # Baseline alignment: y is the baseline, glyphs align properly
             xpos = current_x + glyph.bearing_x * scale
@@ -205,34 +265,108 @@ class TextRenderer:
             # Top of glyph should be at: y - bearing_y (in screen coords, down is positive)
             ypos = y - glyph.bearing_y * scale
             
-            w = glyph.width * scale
-            h = glyph.height * scale
+            quads.append((xpos, ypos, glyph.width * scale, glyph.height * scale))
+            texture_ids.append(glyph.texture_id)
             
-            # Update VBO for each character
-            # Image is already flipped in font_loader, so use normal texture coords
-            vertices = np.array([
-                [xpos,     ypos + h,   0.0, 0.0],  # bottom-left (at baseline y)
-                [xpos,     ypos,       0.0, 1.0],  # top-left
-                [xpos + w, ypos,       1.0, 1.0],  # top-right
-                
-                [xpos,     ypos + h,   0.0, 0.0],  # bottom-left (at baseline y)
-                [xpos + w, ypos,       1.0, 1.0],  # top-right
-                [xpos + w, ypos + h,   1.0, 0.0]   # bottom-right (at baseline y)
-            ], dtype=np.float32)
+            # Advance cursor (bitshift by 6 to get value in pixels)
+            current_x += (glyph.advance >> 6) * scale
+        
+        return tuple(quads), tuple(texture_ids)
+    
+    @staticmethod
+    def _build_batch(quads: List[tuple], keys: List[tuple]) -> Tuple[np.ndarray, list]:
+        """
+        Build vertex data for queued glyph quads, grouped by glyph and color.
+        
+        Args:
+            quads: (x, y, width, height) per glyph
+            keys: (rgb, texture_id) per glyph
             
-            # Bind glyph texture
-            glBindTexture(GL_TEXTURE_2D, glyph.texture_id)
+        Returns:
+            (vertices, runs): (N, 6, 4) float32 vertices and one
+            (rgb, texture_id, first_vertex, vertex_count) per draw call
+        """
+        # Group identical glyph/color pairs so each group is one contiguous draw
+        order = sorted(range(len(keys)), key=keys.__getitem__)
+        rects = np.array(quads, dtype=np.float32)[order]
+        
+        x0 = rects[:, 0]
+        y0 = rects[:, 1]
+        x1 = x0 + rects[:, 2]
+        y1 = y0 + rects[:, 3]
+        
+        vertices = np.empty((len(order), 6, 4), dtype=np.float32)
+        vertices[:, :, 0] = np.stack((x0, x0, x1, x0, x1, x1), axis=1)
+        vertices[:, :, 1] = np.stack((y1, y0, y0, y1, y0, y1), axis=1)
+        vertices[:, :, 2:] = _QUAD_UVS
+        
+        runs = []
+        run_start = 0
+        run_count = len(order)
+        for i in range(1, run_count + 1):
+            if i < run_count and keys[order[i]] == keys[order[run_start]]:
+                continue
+            rgb, texture_id = keys[order[run_start]]
+            runs.append((rgb, texture_id, run_start * 6, (i - run_start) * 6))
+            run_start = i
+        
+        return vertices, runs
+    
+    def _flush_batch(self):
+        """Draw queued glyph quads, uploading them only if this batch was not drawn recently."""
+        quads = self._batch_quads
+        keys = self._batch_keys
+        if not quads:
+            return
+        
+        signature = (tuple(quads), tuple(keys))
+        cached = self._batch_cache.get(signature)
+        if cached is not None:
+            self._batch_cache.move_to_end(signature)
+            vbo, runs = cached
+        else:
+            vertices, runs = self._build_batch(quads, keys)
             
-            # Update VBO
-            glBindBuffer(GL_ARRAY_BUFFER, self.vbo)
-            glBufferSubData(GL_ARRAY_BUFFER, 0, vertices.nbytes, vertices)
+            # Reuse the least recently drawn batch's buffer once the cache is full
+            if len(self._batch_cache) >= _BATCH_CACHE_SIZE:
+                _, (vbo, _) = self._batch_cache.popitem(last=False)
+            else:
+                vbo = glGenBuffers(1)
+            glBindBuffer(GL_ARRAY_BUFFER, vbo)
+            glBufferData(GL_ARRAY_BUFFER, vertices.nbytes, vertices, GL_DYNAMIC_DRAW)
             glBindBuffer(GL_ARRAY_BUFFER, 0)
-            
-            # Render quad
-            glDrawArrays(GL_TRIANGLES, 0, 6)
-            
-            # Advance cursor (bitshift by 6 to get value in pixels)
-            current_x += (glyph.advance >> 6) * scale
+            self._batch_cache[signature] = (vbo, runs)
+        
+        # Enable blending for text transparency (alpha accumulated "over"
+        # so text drawn into an offscreen UI cache stays premultiplied)
+        glEnable(GL_BLEND)
+        glBlendFuncSeparate(GL_SRC_ALPHA, GL_ONE_MINUS_SRC_ALPHA, GL_ONE, GL_ONE_MINUS_SRC_ALPHA)
+        
+        # Disable depth test for 2D text (already off inside scoped_2d_state)
+        gl_state = self.gl_state
+        depth_test_enabled = gl_state['depth'] if gl_state is not None else glIsEnabled(GL_DEPTH_TEST)
+        if depth_test_enabled:
+            glDisable(GL_DEPTH_TEST)
+        
+        # Use text shader
+        glUseProgram(self.shader_program)
+        glUniform1i(self.text_sampler_loc, 0)
+        glActiveTexture(GL_TEXTURE0)
+        
+        # Point the VAO at this batch's buffer
+        glBindVertexArray(self.vao)
+        glBindBuffer(GL_ARRAY_BUFFER, vbo)
+        glVertexAttribPointer(0, 4, GL_FLOAT, GL_FALSE, 4 * 4, None)
+        glBindBuffer(GL_ARRAY_BUFFER, 0)
+        
+        # One draw per run of quads sharing a glyph texture and color
+        current_color = None
+        for rgb, texture_id, first, count in runs:
+            if rgb != current_color:
+                glUniform3f(self.text_color_loc, rgb[0], rgb[1], rgb[2])
+                current_color = rgb
+            glBindTexture(GL_TEXTURE_2D, texture_id)
+            glDrawArrays(GL_TRIANGLES, first, count)
         
         glBindVertexArray(0)
         glBindTexture(GL_TEXTURE_2D, 0)
@@ -242,6 +376,9 @@ class TextRenderer:
         if depth_test_enabled:
             glEnable(GL_DEPTH_TEST)
         glDisable(GL_BLEND)
+        
+        quads.clear()
+        keys.clear()
     
     def render_text_objects(self, text_objects: List):
         """
@@ -250,6 +387,7 @@ class TextRenderer:
         Args:
             text_objects: List of Text2D objects to render
         """
+        self.begin_batch()
         for text_obj in text_objects:
             if not text_obj.visible:
                 continue
@@ -265,12 +403,15 @@ class TextRenderer:
                 scale=text_obj.scale,
                 color=text_obj.color
             )
+        self.end_batch()
     
     def cleanup(self):
         """Clean up OpenGL resources."""
         try:
-            if self.vbo:
-                glDeleteBuffers(1, [self.vbo])
+            for vbo, _ in self._batch_cache.values():
+                glDeleteBuffers(1, [vbo])
+            self._batch_cache.clear()
+            self._layout_cache.clear()
             if self.vao:
                 glDeleteVertexArrays(1, [self.vao])
             if self.shader_program:
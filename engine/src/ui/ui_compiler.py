@@ -288,9 +288,8 @@ class UICompiler:
                     component.compiled_y = (self.viewport_height - component.compiled_height) / 2
         
         # Compile children recursively
-        if hasattr(component, 'children'):
-            for child in component.children:
-                self.compile_component(child)
+        for child in component.children:
+            self.compile_component(child)
         
         # If this is a layout container (FlexContainer, GridContainer), perform layout
         if hasattr(component, 'layout'):
@@ -20,6 +20,9 @@ class UIComponent:
     This is the new base class that replaces/wraps UIElement with sizing support.
     """
     
+    # Every component has children, so tree walks never need hasattr probes
+    children: tuple = ()
+    
     def __init__(
         self,
         x: Union[float, UISize] = 0.0,
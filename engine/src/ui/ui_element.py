@@ -26,6 +26,13 @@ class UIElement:
     Handles positioning, sizing, visibility, and basic events.
     """
     
+    # Every element has children, so tree walks never need hasattr probes
+    children: tuple = ()
+    
+    # Bumped by set_visible() whenever any element is shown or hidden, so
+    # cached draw lists (which skip hidden subtrees) know to rebuild
+    visibility_version = 0
+    
     def __init__(
         self,
         x: float = 0.0,
@@ -80,6 +87,9 @@ class UIElement:
         self.padding_right = 0.0
         self.padding_top = 0.0
         self.padding_bottom = 0.0
+        
+        # Screen-space (left, top, right, bottom), refreshed on layout changes
+        self.cached_bbox: Optional[Tuple[float, float, float, float]] = None
     
     def get_absolute_position(self) -> Tuple[float, float]:
         """
@@ -123,6 +133,18 @@ class UIElement:
         x, y = self.get_absolute_position()
         return (x, y, self.width, self.height)
     
+    def update_cached_bbox(self) -> Tuple[float, float, float, float]:
+        """
+        Recompute the cached screen-space bounding box.
+        Call after the element (or an ancestor) moves or resizes.
+        
+        Returns:
+            Tuple of (left, top, right, bottom) in screen coordinates
+        """
+        x, y, w, h = self.get_bounds()
+        self.cached_bbox = (x, y, x + w, y + h)
+        return self.cached_bbox
+    
     def contains_point(self, mouse_x: float, mouse_y: float) -> bool:
         """
         Check if a point is inside this element.
@@ -240,13 +262,21 @@ class UIElement:
     def update(self, delta_time: float):
         """
         Update element logic.
+        Subclasses that animate return True from frames that change how
+        they look, so the UI manager redraws its cached frame.
         
         Args:
             delta_time: Time since last frame in seconds
+            
+        Returns:
+            True if this element or a child changed visibly
         """
         # Update children
+        changed = False
         for child in self.children:
-            child.update(delta_time)
+            if child.update(delta_time):
+                changed = True
+        return changed
     
     def render(self, text_renderer):
         """
@@ -274,13 +304,24 @@ class UIElement:
         self.width = width
         self.height = height
     
+    def set_visible(self, visible: bool):
+        """
+        Show or hide the element (and with it, its children).
+        
+        Args:
+            visible: Whether element is visible
+        """
+        if visible != self.visible:
+            self.visible = visible
+            UIElement.visibility_version += 1
+    
     def show(self):
         """Make element visible."""
-        self.visible = True
+        self.set_visible(True)
     
     def hide(self):
         """Hide element."""
-        self.visible = False
+        self.set_visible(False)
     
     def enable(self):
         """Enable element (can receive input)."""
@@ -3,6 +3,7 @@ UI Manager
 Manages all UI elements, handles input routing, and coordinates rendering.
 """
 
+import numpy as np
 from typing import List, Optional, Tuple
 from .ui_element import UIElement
 from .ui_compiler import UICompiler
@@ -11,6 +12,25 @@ from OpenGL.GL import (glIsEnabled, glEnable, glDisable, GL_BLEND,
                        GL_SRC_ALPHA, GL_ONE_MINUS_SRC_ALPHA)
 
 
+def _hit_test(rects: np.ndarray, x: float, y: float) -> int:
+    """
+    Find the topmost rect containing a point.
+    
+    Args:
+        rects: (N, 4) float32 array of (left, top, right, bottom) edges
+        x: Point X position
+        y: Point Y position
+        
+    Returns:
+        Index of the last (topmost) containing rect, or -1 if none
+    """
+    hits = np.flatnonzero(
+        (rects[:, 0] <= x) & (x <= rects[:, 2]) &
+        (rects[:, 1] <= y) & (y <= rects[:, 3])
+    )
+    return int(hits[-1]) if hits.size else -1
+
+
 class UIManager:
     """
     Manages UI elements and handles input routing.
@@ -39,6 +59,18 @@ class UIManager:
         self.mouse_y = 0.0
         self.mouse_pressed = False
         
+        # Packed root element bounds for mouse hit-testing, rebuilt lazily
+        self._rects = np.zeros((0, 4), dtype=np.float32)
+        self._rects_dirty = True
+        
+        # True while the last mouse move was handled by some element
+        # (hovered, dragging, open dropdown), so leaving it still dispatches
+        self._pointer_active = False
+        
+        # Set whenever something visible may have changed (hover, clicks,
+        # layout, animation); scenes may reuse the last drawn UI while clear
+        self.dirty = True
+        
         # CSS-like size compiler (%, vw, vh → px)
         self.compiler = UICompiler(window_width, window_height)
         
@@ -57,6 +89,8 @@ class UIManager:
         """
         if element not in self.elements:
             self.elements.append(element)
+            self._rects_dirty = True
+            self.dirty = True
     
     def remove_element(self, element: UIElement):
         """
@@ -67,11 +101,30 @@ class UIManager:
         """
         if element in self.elements:
             self.elements.remove(element)
+            self._rects_dirty = True
+            self.dirty = True
     
     def clear(self):
         """Remove all UI elements."""
         self.elements.clear()
         self.focused_element = None
+        self._rects_dirty = True
+        self._pointer_active = False
+        self.dirty = True
+    
+    def invalidate_layout(self):
+        """Mark root element bounds stale (call after moving or resizing elements)."""
+        self._rects_dirty = True
+        self.dirty = True
+    
+    def _update_rects(self):
+        """Pack root element bounds into the hit-test array."""
+        rects = np.empty((len(self.elements), 4), dtype=np.float32)
+        for i, element in enumerate(self.elements):
+            x, y, w, h = element.get_bounds()
+            rects[i] = (x, y, x + w, y + h)
+        self._rects = rects
+        self._rects_dirty = False
     
     def on_mouse_move(self, x: float, y: float):
         """
@@ -84,9 +137,24 @@ class UIManager:
         self.mouse_x = x
         self.mouse_y = y
         
+        if self._rects_dirty:
+            self._update_rects()
+        
+        # Nothing under the cursor now or on the last move, and no drag in
+        # progress - there is no hover state to update
+        if (not self._pointer_active and not self.mouse_pressed
+                and _hit_test(self._rects, x, y) < 0):
+            return
+        
+        # Hover/drag state may change from here on
+        self.dirty = True
+        
         # Update hover state for all elements
+        handled = False
         for element in self.elements:
-            element.handle_mouse_move(x, y)
+            if element.handle_mouse_move(x, y):
+                handled = True
+        self._pointer_active = handled
     
     def on_mouse_click(self, x: float, y: float, button: int) -> bool:
         """
@@ -101,6 +169,7 @@ class UIManager:
             True if event was handled
         """
         self.mouse_pressed = True
+        self.dirty = True
         
         # Process elements in reverse order (front to back)
         for element in reversed(self.elements):
@@ -120,6 +189,7 @@ class UIManager:
             button: Mouse button
         """
         self.mouse_pressed = False
+        self.dirty = True
         
         # Process elements
         for element in reversed(self.elements):
@@ -129,12 +199,15 @@ class UIManager:
     def update(self, delta_time: float):
         """
         Update all UI elements.
+        Only marks the UI dirty when an element reports a visible change,
+        so static menus keep reusing their cached frame.
         
         Args:
             delta_time: Time since last frame in seconds
         """
         for element in self.elements:
-            element.update(delta_time)
+            if element.update(delta_time):
+                self.dirty = True
     
     def render(self, text_renderer, ui_renderer=None):
         """
@@ -171,11 +244,11 @@ class UIManager:
         # Check if element supports CSS-like sizing
         if hasattr(element, 'x_size') and hasattr(element, 'compiled_x'):
             self.compiler.compile_component(element)
+            self._rects_dirty = True
         
         # Compile children
-        if hasattr(element, 'children'):
-            for child in element.children:
-                self._compile_element_recursive(child)
+        for child in element.children:
+            self._compile_element_recursive(child)
     
     def set_window_size(self, width: int, height: int):
         """
@@ -190,16 +263,31 @@ class UIManager:
         
         # Update compiler viewport
         self.compiler.set_viewport(width, height)
+        self._rects_dirty = True
+        self.dirty = True
     
-    def prepare_for_rendering(self):
+    def prepare_for_rendering(
+        self,
+        depth_test_enabled: Optional[bool] = None,
+        cull_face_enabled: Optional[bool] = None
+    ):
         """
         Prepare OpenGL state for 2D UI rendering.
         Saves current state and sets up for 2D rendering (no depth, no culling, blending).
         Call this before rendering UI elements.
+        
+        Args:
+            depth_test_enabled: Known GL_DEPTH_TEST state (None = query OpenGL)
+            cull_face_enabled: Known GL_CULL_FACE state (None = query OpenGL)
         """
-        # Save current OpenGL state
-        self._saved_depth_state = glIsEnabled(GL_DEPTH_TEST)
-        self._saved_cull_state = glIsEnabled(GL_CULL_FACE)
+        # Save current OpenGL state (skip the driver query when the caller
+        # already tracks it - glIsEnabled can force a pipeline sync)
+        if depth_test_enabled is None:
+            depth_test_enabled = glIsEnabled(GL_DEPTH_TEST)
+        if cull_face_enabled is None:
+            cull_face_enabled = glIsEnabled(GL_CULL_FACE)
+        self._saved_depth_state = depth_test_enabled
+        self._saved_cull_state = cull_face_enabled
         
         # Set up for 2D UI rendering
         glDisable(GL_DEPTH_TEST)      # 2D UI doesn't need depth testing
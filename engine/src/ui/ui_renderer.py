@@ -3,10 +3,34 @@ UI Renderer
 OpenGL-based rendering for UI components (rectangles, circles, gradients).
 """
 
+import ctypes
 import numpy as np
+from contextlib import contextmanager
 from OpenGL.GL import *
 from OpenGL.GL import shaders
-from typing import Tuple
+from typing import Dict, List, Optional, Tuple
+
+
+# Floats per batched rect instance: x, y, width, height, r, g, b, a, round
+# (round is 1.0 for circles, which are cut from their bounding quad)
+RECT_INSTANCE_FLOATS = 9
+
+
+def unit_circle_fan(segments: int) -> np.ndarray:
+    """
+    Tessellate a unit circle as a triangle fan (center + closed rim).
+    
+    Args:
+        segments: Number of rim segments
+        
+    Returns:
+        (segments + 2, 2) float32 array of vertices around (0, 0)
+    """
+    angles = np.linspace(0.0, 2.0 * np.pi, segments + 1, dtype=np.float64)
+    fan = np.zeros((segments + 2, 2), dtype=np.float32)
+    fan[1:, 0] = np.cos(angles)
+    fan[1:, 1] = np.sin(angles)
+    return fan
 
 
 class UIRenderer:
@@ -23,12 +47,32 @@ class UIRenderer:
         self.vbo = None
         self.circle_vao = None  # Separate VAO for circles
         self.circle_vbo = None  # Separate VBO for circles
+        # Baked unit-circle fans in circle_vbo: segments -> (first vertex, count)
+        self._circle_fans: Dict[int, Tuple[int, int]] = {}
+        self._circle_vertices = np.zeros((0, 2), dtype=np.float32)
         self.color_loc = None
         self.position_loc = None
         self.size_loc = None
         self.projection_loc = None
         self.projection_matrix = None
         
+        # Instanced rect batching (shares the unit-quad VBO)
+        self.instanced_program = None
+        self.instanced_projection_loc = None
+        self.batch_vao = None
+        self.instance_vbo = None
+        self._instance_capacity = 0  # Rects the instance VBO can hold
+        self._batch_depth = 0
+        self._batch_rects: List[Tuple[float, ...]] = []
+        
+        # Offscreen copy of the last drawn UI, composited while nothing changes
+        self.cache_fbo = None
+        self.cache_texture = None
+        self.cache_program = None
+        self.cache_vao = None
+        self._cache_size = (0, 0)
+        self._cache_prev_fbo = 0
+        
         self.screen_width = 800
         self.screen_height = 600
     
@@ -105,6 +149,83 @@ class UIRenderer:
         self.size_loc = glGetUniformLocation(self.shader_program, "size")
         self.color_loc = glGetUniformLocation(self.shader_program, "color")
         
+        # Instanced variant - per-rect position, size and color as attributes
+        instanced_vertex_source = """
+        #version 330 core
+        layout(location = 0) in vec2 aPos;
+        layout(location = 1) in vec4 iRect;   // x, y, width, height
+        layout(location = 2) in vec4 iColor;
+        layout(location = 3) in float iRound;
+        
+        uniform mat4 projection;
+        
+        out vec4 vColor;
+        out vec2 vLocal;
+        flat out float vRound;
+        
+        void main() {
+            vec2 scaledPos = aPos * iRect.zw + iRect.xy;
+            gl_Position = projection * vec4(scaledPos, 0.0, 1.0);
+            vColor = iColor;
+            vLocal = aPos * 2.0 - 1.0;
+            vRound = iRound;
+        }
+        """
+        
+        instanced_fragment_source = """
+        #version 330 core
+        in vec4 vColor;
+        in vec2 vLocal;
+        flat in float vRound;
+        out vec4 FragColor;
+        
+        void main() {
+            if (vRound > 0.5 && dot(vLocal, vLocal) > 1.0) {
+                discard;
+            }
+            FragColor = vColor;
+        }
+        """
+        
+        self.instanced_program = shaders.compileProgram(
+            shaders.compileShader(instanced_vertex_source, GL_VERTEX_SHADER),
+            shaders.compileShader(instanced_fragment_source, GL_FRAGMENT_SHADER)
+        )
+        self.instanced_projection_loc = glGetUniformLocation(self.instanced_program, "projection")
+        
+        # Composite shader - draws the cached UI texture over the whole screen
+        cache_vertex_source = """
+        #version 330 core
+        layout(location = 0) in vec2 aPos;
+        
+        out vec2 vUV;
+        
+        void main() {
+            vUV = aPos;
+            gl_Position = vec4(aPos * 2.0 - 1.0, 0.0, 1.0);
+        }
+        """
+        
+        cache_fragment_source = """
+        #version 330 core
+        in vec2 vUV;
+        out vec4 FragColor;
+        
+        uniform sampler2D uiTexture;
+        
+        void main() {
+            FragColor = texture(uiTexture, vUV);
+        }
+        """
+        
+        self.cache_program = shaders.compileProgram(
+            shaders.compileShader(cache_vertex_source, GL_VERTEX_SHADER),
+            shaders.compileShader(cache_fragment_source, GL_FRAGMENT_SHADER)
+        )
+        glUseProgram(self.cache_program)
+        glUniform1i(glGetUniformLocation(self.cache_program, "uiTexture"), 0)
+        glUseProgram(0)
+        
         print("[UIRenderer] Shaders compiled successfully")
     
     def _create_buffers(self):
@@ -135,9 +256,81 @@ class UIRenderer:
         
         glBindVertexArray(0)
         
-        # Create separate VAO/VBO for circles (DYNAMIC)
+        # Create VAO for batched rects: shared unit quad + per-instance data
+        self.batch_vao = glGenVertexArrays(1)
+        glBindVertexArray(self.batch_vao)
+        
+        glBindBuffer(GL_ARRAY_BUFFER, self.vbo)
+        glEnableVertexAttribArray(0)
+        glVertexAttribPointer(0, 2, GL_FLOAT, GL_FALSE, 0, None)
+        
+        self._instance_capacity = 256
+        stride = RECT_INSTANCE_FLOATS * 4
+        self.instance_vbo = glGenBuffers(1)
+        glBindBuffer(GL_ARRAY_BUFFER, self.instance_vbo)
+        glBufferData(GL_ARRAY_BUFFER, self._instance_capacity * stride, None, GL_STREAM_DRAW)
+        
+        # Rect (location 1), color (location 2) and round flag (location 3),
+        # advanced once per instance
+        glEnableVertexAttribArray(1)
+        glVertexAttribPointer(1, 4, GL_FLOAT, GL_FALSE, stride, ctypes.c_void_p(0))
+        glVertexAttribDivisor(1, 1)
+        glEnableVertexAttribArray(2)
+        glVertexAttribPointer(2, 4, GL_FLOAT, GL_FALSE, stride, ctypes.c_void_p(16))
+        glVertexAttribDivisor(2, 1)
+        glEnableVertexAttribArray(3)
+        glVertexAttribPointer(3, 1, GL_FLOAT, GL_FALSE, stride, ctypes.c_void_p(32))
+        glVertexAttribDivisor(3, 1)
+        
+        glBindVertexArray(0)
+        glBindBuffer(GL_ARRAY_BUFFER, 0)
+        
+        # Create VAO for compositing the UI cache (shares the unit quad)
+        self.cache_vao = glGenVertexArrays(1)
+        glBindVertexArray(self.cache_vao)
+        glBindBuffer(GL_ARRAY_BUFFER, self.vbo)
+        glEnableVertexAttribArray(0)
+        glVertexAttribPointer(0, 2, GL_FLOAT, GL_FALSE, 0, None)
+        glBindVertexArray(0)
+        glBindBuffer(GL_ARRAY_BUFFER, 0)
+        
+        # Create separate VAO/VBO for circles (STATIC unit-circle fans,
+        # placed and scaled by the position/size uniforms)
         self.circle_vao = glGenVertexArrays(1)
         self.circle_vbo = glGenBuffers(1)
+        self._circle_fans = {}
+        self._circle_vertices = np.zeros((0, 2), dtype=np.float32)
+        self._circle_fan(32)
+    
+    def _circle_fan(self, segments: int) -> Tuple[int, int]:
+        """
+        Get the baked unit-circle fan for a segment count, tessellating and
+        uploading it the first time that count is requested.
+        
+        Args:
+            segments: Number of rim segments
+            
+        Returns:
+            (first vertex, vertex count) in circle_vbo
+        """
+        fan = self._circle_fans.get(segments)
+        if fan is not None:
+            return fan
+        
+        vertices = unit_circle_fan(segments)
+        fan = (len(self._circle_vertices), len(vertices))
+        self._circle_vertices = np.concatenate((self._circle_vertices, vertices))
+        self._circle_fans[segments] = fan
+        
+        glBindVertexArray(self.circle_vao)
+        glBindBuffer(GL_ARRAY_BUFFER, self.circle_vbo)
+        glBufferData(GL_ARRAY_BUFFER, self._circle_vertices.nbytes, self._circle_vertices, GL_STATIC_DRAW)
+        glEnableVertexAttribArray(0)
+        glVertexAttribPointer(0, 2, GL_FLOAT, GL_FALSE, 0, None)
+        glBindVertexArray(0)
+        glBindBuffer(GL_ARRAY_BUFFER, 0)
+        
+        return fan
     
     def set_projection(self, width: int, height: int):
         """
@@ -157,6 +350,184 @@ class UIRenderer:
             [0.0,        0.0,        -1.0,   0.0],
             [0.0,        0.0,         0.0,   1.0]
         ], dtype=np.float32).T  # Transpose for column-major
+        
+        self._upload_projection()
+    
+    def _upload_projection(self):
+        """
+        Store the projection in both programs' uniform state.
+        Uniforms persist per program, so draws never need to re-send it.
+        """
+        if self.projection_matrix is None:
+            return
+        
+        if self.shader_program:
+            glUseProgram(self.shader_program)
+            glUniformMatrix4fv(self.projection_loc, 1, GL_FALSE, self.projection_matrix)
+        if self.instanced_program:
+            glUseProgram(self.instanced_program)
+            glUniformMatrix4fv(self.instanced_projection_loc, 1, GL_FALSE, self.projection_matrix)
+        glUseProgram(0)
+    
+    @contextmanager
+    def scoped_2d_state(self, gl_state: Optional[Dict[str, bool]] = None):
+        """
+        Set up 2D UI state (no depth test, no culling, alpha blending) for the
+        duration of a with-block and restore depth/culling afterwards.
+        Only capabilities that are actually on get toggled. A passed gl_state
+        is kept in sync, so nested 2D draws can read it instead of querying GL.
+        
+        Args:
+            gl_state: Renderer's tracked state ({'depth': bool, 'cull': bool});
+                queried from OpenGL when None
+        """
+        if gl_state is not None:
+            depth_enabled = gl_state['depth']
+            cull_enabled = gl_state['cull']
+        else:
+            depth_enabled = glIsEnabled(GL_DEPTH_TEST)
+            cull_enabled = glIsEnabled(GL_CULL_FACE)
+        
+        if depth_enabled:
+            glDisable(GL_DEPTH_TEST)
+        if cull_enabled:
+            glDisable(GL_CULL_FACE)
+        glEnable(GL_BLEND)
+        # Alpha accumulates "over" as well, so UI drawn into the cache
+        # texture ends up premultiplied (same colors on screen)
+        glBlendFuncSeparate(GL_SRC_ALPHA, GL_ONE_MINUS_SRC_ALPHA, GL_ONE, GL_ONE_MINUS_SRC_ALPHA)
+        if gl_state is not None:
+            gl_state['depth'] = False
+            gl_state['cull'] = False
+        
+        try:
+            yield
+        finally:
+            if depth_enabled:
+                glEnable(GL_DEPTH_TEST)
+            if cull_enabled:
+                glEnable(GL_CULL_FACE)
+            if gl_state is not None:
+                gl_state['depth'] = depth_enabled
+                gl_state['cull'] = cull_enabled
+    
+    def has_cache(self) -> bool:
+        """Check whether the UI cache holds a frame at the current screen size."""
+        return (self.cache_texture is not None
+                and self._cache_size == (self.screen_width, self.screen_height))
+    
+    def begin_cache(self):
+        """
+        Redirect UI drawing into the cache texture (cleared to transparent).
+        Must be paired with end_cache(); draw_cache() then shows the result.
+        """
+        width, height = self.screen_width, self.screen_height
+        if self._cache_size != (width, height):
+            self._create_cache(width, height)
+        
+        self._cache_prev_fbo = glGetIntegerv(GL_DRAW_FRAMEBUFFER_BINDING)
+        glBindFramebuffer(GL_DRAW_FRAMEBUFFER, self.cache_fbo)
+        glClearBufferfv(GL_COLOR, 0, (0.0, 0.0, 0.0, 0.0))
+    
+    def end_cache(self):
+        """Restore the framebuffer that was bound before begin_cache()."""
+        self.flush()
+        glBindFramebuffer(GL_DRAW_FRAMEBUFFER, self._cache_prev_fbo)
+    
+    def draw_cache(self):
+        """Composite the cached UI (premultiplied alpha) over the current framebuffer."""
+        if self.cache_texture is None:
+            return
+        
+        glEnable(GL_BLEND)
+        glBlendFunc(GL_ONE, GL_ONE_MINUS_SRC_ALPHA)
+        
+        glUseProgram(self.cache_program)
+        glActiveTexture(GL_TEXTURE0)
+        glBindTexture(GL_TEXTURE_2D, self.cache_texture)
+        glBindVertexArray(self.cache_vao)
+        glDrawArrays(GL_TRIANGLES, 0, 6)
+        glBindVertexArray(0)
+        glBindTexture(GL_TEXTURE_2D, 0)
+        glUseProgram(0)
+        
+        glBlendFunc(GL_SRC_ALPHA, GL_ONE_MINUS_SRC_ALPHA)
+    
+    def _create_cache(self, width: int, height: int):
+        """
+        (Re)create the UI cache framebuffer and its color texture.
+        
+        Args:
+            width: Cache width in pixels
+            height: Cache height in pixels
+        """
+        self._delete_cache()
+        
+        self.cache_texture = glGenTextures(1)
+        glBindTexture(GL_TEXTURE_2D, self.cache_texture)
+        glTexImage2D(GL_TEXTURE_2D, 0, GL_RGBA8, width, height, 0, GL_RGBA, GL_UNSIGNED_BYTE, None)
+        glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MIN_FILTER, GL_NEAREST)
+        glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MAG_FILTER, GL_NEAREST)
+        glBindTexture(GL_TEXTURE_2D, 0)
+        
+        self.cache_fbo = glGenFramebuffers(1)
+        glBindFramebuffer(GL_FRAMEBUFFER, self.cache_fbo)
+        glFramebufferTexture2D(GL_FRAMEBUFFER, GL_COLOR_ATTACHMENT0, GL_TEXTURE_2D, self.cache_texture, 0)
+        glBindFramebuffer(GL_FRAMEBUFFER, 0)
+        
+        self._cache_size = (width, height)
+    
+    def _delete_cache(self):
+        """Release the UI cache framebuffer and texture."""
+        if self.cache_fbo:
+            glDeleteFramebuffers(1, [self.cache_fbo])
+        if self.cache_texture:
+            glDeleteTextures([self.cache_texture])
+        self.cache_fbo = None
+        self.cache_texture = None
+        self._cache_size = (0, 0)
+    
+    def begin_batch(self):
+        """
+        Start queuing rectangles instead of drawing them immediately.
+        Queued rects and circles are drawn in order with one instanced call
+        by the outermost end_batch().
+        """
+        self._batch_depth += 1
+    
+    def end_batch(self):
+        """Draw all rectangles queued since the matching begin_batch()."""
+        if self._batch_depth == 0:
+            return
+        self._batch_depth -= 1
+        if self._batch_depth == 0:
+            self.flush()
+    
+    def flush(self):
+        """Draw queued rectangles now (keeps later primitives on top)."""
+        rects = self._batch_rects
+        if not rects:
+            return
+        
+        instance_data = np.array(rects, dtype=np.float32)
+        count = len(rects)
+        rects.clear()
+        
+        glUseProgram(self.instanced_program)
+        
+        # Orphan and refill the instance buffer
+        glBindBuffer(GL_ARRAY_BUFFER, self.instance_vbo)
+        if count > self._instance_capacity:
+            self._instance_capacity = max(count, self._instance_capacity * 2)
+        glBufferData(GL_ARRAY_BUFFER, self._instance_capacity * RECT_INSTANCE_FLOATS * 4, None, GL_STREAM_DRAW)
+        glBufferSubData(GL_ARRAY_BUFFER, 0, instance_data.nbytes, instance_data)
+        glBindBuffer(GL_ARRAY_BUFFER, 0)
+        
+        glBindVertexArray(self.batch_vao)
+        glDrawArraysInstanced(GL_TRIANGLES, 0, 6, count)
+        glBindVertexArray(0)
+        
+        glUseProgram(0)
     
     def draw_rect(
         self,
@@ -177,10 +548,15 @@ class UIRenderer:
         if not self.initialized or not self.shader_program or not self.vao:
             return
         
+        if self._batch_depth:
+            self._batch_rects.append((x, y, width, height, *color, 0.0))
+            return
+        
         # Verify shader and VAO are still valid
         if not glIsProgram(self.shader_program):
             print("[UIRenderer] ERROR: Shader program invalid! Reinitializing...")
             self._create_shaders()
+            self._upload_projection()
         
         if not glIsVertexArray(self.vao):
             print("[UIRenderer] ERROR: VAO invalid! Reinitializing...")
@@ -189,8 +565,7 @@ class UIRenderer:
         # Use shader
         glUseProgram(self.shader_program)
         
-        # Set uniforms
-        glUniformMatrix4fv(self.projection_loc, 1, GL_FALSE, self.projection_matrix)
+        # Set per-rect uniforms (projection is already stored in the program)
         glUniform2f(self.position_loc, x, y)
         glUniform2f(self.size_loc, width, height)
         glUniform4f(self.color_loc, *color)
@@ -212,7 +587,7 @@ class UIRenderer:
         segments: int = 32
     ):
         """
-        Draw a filled circle using triangle fan.
+        Draw a filled circle using a pre-baked unit triangle fan.
         
         Args:
             x, y: Center position
@@ -223,38 +598,25 @@ class UIRenderer:
         if not self.initialized:
             return
         
-        # Create circle vertices
-        vertices = []
-        vertices.extend([x, y])  # Center point
-        
-        for i in range(segments + 1):
-            angle = 2.0 * np.pi * i / segments
-            vx = x + radius * np.cos(angle)
-            vy = y + radius * np.sin(angle)
-            vertices.extend([vx, vy])
-        
-        vertices = np.array(vertices, dtype=np.float32)
-        
-        # Use SEPARATE VAO/VBO for circles to avoid corrupting rectangle VBO
-        glBindVertexArray(self.circle_vao)
-        
-        # Upload to GPU (DYNAMIC buffer for circles)
-        glBindBuffer(GL_ARRAY_BUFFER, self.circle_vbo)
-        glBufferData(GL_ARRAY_BUFFER, vertices.nbytes, vertices, GL_DYNAMIC_DRAW)
+        if self._batch_depth:
+            # Same instance stream as rects, so draw order is kept without
+            # breaking the batch; the shader cuts the circle from its quad
+            diameter = radius * 2.0
+            self._batch_rects.append((x - radius, y - radius, diameter, diameter, *color, 1.0))
+            return
         
-        # Set vertex attribute for circle VAO
-        glEnableVertexAttribArray(0)
-        glVertexAttribPointer(0, 2, GL_FLOAT, GL_FALSE, 0, None)
+        # Tessellated once per segment count; no per-frame trig or upload
+        first, count = self._circle_fan(segments)
         
-        # Use shader with identity transform (vertices are already in screen space)
+        # Unit fan is scaled by the radius and moved to the center
         glUseProgram(self.shader_program)
-        glUniformMatrix4fv(self.projection_loc, 1, GL_FALSE, self.projection_matrix)
-        glUniform2f(self.position_loc, 0.0, 0.0)
-        glUniform2f(self.size_loc, 1.0, 1.0)
+        glUniform2f(self.position_loc, x, y)
+        glUniform2f(self.size_loc, radius, radius)
         glUniform4f(self.color_loc, *color)
         
-        # Draw
-        glDrawArrays(GL_TRIANGLE_FAN, 0, len(vertices) // 2)
+        # Draw (separate VAO so the rectangle VBO is never touched)
+        glBindVertexArray(self.circle_vao)
+        glDrawArrays(GL_TRIANGLE_FAN, first, count)
         
         glBindVertexArray(0)
         
@@ -298,6 +660,17 @@ class UIRenderer:
             glDeleteBuffers(1, [self.circle_vbo])
         if self.circle_vao:
             glDeleteVertexArrays(1, [self.circle_vao])
+        if self.instance_vbo:
+            glDeleteBuffers(1, [self.instance_vbo])
+        if self.batch_vao:
+            glDeleteVertexArrays(1, [self.batch_vao])
+        if self.instanced_program:
+            glDeleteProgram(self.instanced_program)
+        if self.cache_vao:
+            glDeleteVertexArrays(1, [self.cache_vao])
+        if self.cache_program:
+            glDeleteProgram(self.cache_program)
+        self._delete_cache()
         if self.shader_program:
             glDeleteProgram(self.shader_program)
         
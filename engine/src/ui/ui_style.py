@@ -9,6 +9,8 @@ from typing import Tuple
 class Color:
     """RGBA color representation."""
     
+    __slots__ = ('r', 'g', 'b', 'a')
+    
     def __init__(self, r: float, g: float, b: float, a: float = 1.0):
         """
         Initialize color.
@@ -58,7 +60,13 @@ class Colors:
 
 
 class UIStyle:
-    """Base style class."""
+    """
+    Base style class.
+    Styles declare their fields in __slots__: widgets read them on every
+    render, and slot reads skip the instance __dict__.
+    """
+    
+    __slots__ = ('padding', 'margin', 'border_width', 'border_radius')
     
     def __init__(self):
         """Initialize base style."""
@@ -71,6 +79,8 @@ class UIStyle:
 class ButtonStyle(UIStyle):
     """Style for buttons."""
     
+    __slots__ = ('bg_color', 'hover_color', 'press_color', 'text_color', 'border_color', 'text_size')
+    
     def __init__(self):
         """Initialize button style."""
         super().__init__()
@@ -92,6 +102,12 @@ class ButtonStyle(UIStyle):
 class SliderStyle(UIStyle):
     """Style for sliders."""
     
+    __slots__ = (
+        'track_color', 'track_border_color', 'fill_color', 'fill_hover_color',
+        'handle_color', 'handle_hover_color', 'handle_press_color',
+        'track_height', 'handle_radius', 'label_spacing', 'text_size'
+    )
+    
     def __init__(self):
         """Initialize slider style."""
         super().__init__()
@@ -116,11 +132,19 @@ class SliderStyle(UIStyle):
         
         # Label spacing
         self.label_spacing = 10.0  # Space between label and slider
+        
+        # Text
+        self.text_size = 1.0
 
 
 class CheckboxStyle(UIStyle):
     """Style for checkboxes."""
     
+    __slots__ = (
+        'box_color', 'box_hover_color', 'box_border_color', 'check_color',
+        'check_hover_color', 'text_color', 'box_size', 'check_padding', 'text_size'
+    )
+    
     def __init__(self):
         """Initialize checkbox style."""
         super().__init__()
@@ -148,6 +172,8 @@ class CheckboxStyle(UIStyle):
 class PanelStyle(UIStyle):
     """Style for panels."""
     
+    __slots__ = ('bg_color', 'border_color')
+    
     def __init__(self):
         """Initialize panel style."""
         super().__init__()
@@ -165,6 +191,8 @@ class PanelStyle(UIStyle):
 class LabelStyle(UIStyle):
     """Style for labels."""
     
+    __slots__ = ('text_color', 'bg_color', 'text_size')
+    
     def __init__(self):
         """Initialize label style."""
         super().__init__()
@@ -181,6 +209,11 @@ class LabelStyle(UIStyle):
 class DropdownStyle(UIStyle):
     """Style for dropdowns."""
     
+    __slots__ = (
+        'bg_color', 'hover_color', 'selected_color', 'text_color', 'border_color',
+        'item_height', 'text_size'
+    )
+    
     def __init__(self):
         """Initialize dropdown style."""
         super().__init__()
@@ -3,12 +3,99 @@ Modern Settings Menu Scene
 Game-specific settings menu using modern OpenGL UI components.
 """
 
-from engine.src import Scene, SettingsManager, SettingsPresets
+import time
+from bisect import bisect_right
+from functools import partial
+from engine.src import Scene, SettingsManager, SettingsPresets, FontLoader
 from engine.src.ui import (
     UIManager, UIPanel, UIButton, UILabel, UISlider,
-    UICheckbox, UIDropdown, Anchor, DefaultTheme
+    UICheckbox, UIDropdown, Anchor, DefaultTheme, px
 )
 
+
+# Shadow map resolutions selectable by the shadow quality slider (0.0 - 1.0)
+_SHADOW_SIZES = (512, 1024, 2048, 4096)
+
+# Slider values where the selection steps up to the next resolution
+# (midpoints between the slider positions below)
+_SHADOW_THRESHOLDS = (0.165, 0.495, 0.83)
+
+# Slider position for each shadow map resolution
+_SHADOW_SLIDER_VALUES = {512: 0.0, 1024: 0.33, 2048: 0.66, 4096: 1.0}
+
+# Graphics preset button labels (lower-cased for SettingsPresets)
+_PRESET_OPTIONS = ("Low", "Medium", "High", "Ultra")
+
+# MSAA dropdown options and their sample counts, index for index
+_MSAA_OPTIONS = ("Off", "2x", "4x", "8x")
+_MSAA_SAMPLES = (0, 2, 4, 8)
+
+# MSAA dropdown option index for each sample count
+_MSAA_INDEX = {samples: index for index, samples in enumerate(_MSAA_SAMPLES)}
+
+# Minimum seconds between writes of buffered slider values (about one frame)
+_SETTINGS_FLUSH_INTERVAL = 0.016
+
+# Main panel size (the panel is centered in the window by _layout)
+_PANEL_WIDTH = 600
+_PANEL_HEIGHT = 500
+
+# Size and range shared by the full-width sliders
+_SLIDER = {'x': 20, 'width': 480, 'height': 30, 'min_value': 0.0, 'max_value': 1.0}
+
+# Main panel children in add order, built by _build_widgets(). Each entry is
+# (kind, scene attribute or None, constructor kwargs, callback, setting):
+#   callback: (scene method name, *leading args) or None
+#   setting:  (path, default, value map or None) giving the widget's value;
+#             a value map translates the setting (e.g. samples -> option index)
+_WIDGETS = (
+    ('label', None, {'x': 20, 'y': 10, 'text': "SETTINGS", 'size': 1.5, 'bold': True}, None, None),
+    
+    # === GRAPHICS SECTION ===
+    ('label', None, {'x': 20, 'y': 50, 'text': "GRAPHICS", 'size': 1.2, 'bold': True}, None, None),
+    *(('button', None, {'x': 20 + i * 135, 'y': 80, 'width': 125, 'height': 35, 'text': preset},
+       ('_on_preset_click', preset.lower()), None)
+      for i, preset in enumerate(_PRESET_OPTIONS)),
+    ('slider', 'shadow_slider', {**_SLIDER, 'y': 145, 'label': "Shadow Quality"},
+     ('_on_shadow_quality_change',), ('graphics.shadow_map_size', 2048, _SHADOW_SLIDER_VALUES)),
+    ('label', None, {'x': 20, 'y': 195, 'text': "MSAA:", 'size': 0.9}, None, None),
+    ('dropdown', 'msaa_dropdown', {'x': 100, 'y': 190, 'width': 150, 'height': 30, 'options': _MSAA_OPTIONS},
+     ('_on_msaa_change',), ('graphics.msaa_samples', 4, _MSAA_INDEX)),
+    ('checkbox', 'vsync_checkbox', {'x': 20, 'y': 240, 'label': "VSync"},
+     ('_on_vsync_toggle',), ('window.vsync', True, None)),
+    ('checkbox', 'fullscreen_checkbox', {'x': 200, 'y': 240, 'label': "Fullscreen"},
+     ('_on_fullscreen_toggle',), ('window.fullscreen', False, None)),
+    
+    # === AUDIO SECTION ===
+    ('label', None, {'x': 20, 'y': 290, 'text': "AUDIO", 'size': 1.2, 'bold': True}, None, None),
+    ('slider', 'master_vol_slider', {**_SLIDER, 'y': 335, 'label': "Master Volume"},
+     ('_on_volume_change', 'master_volume'), ('audio.master_volume', 0.8, None)),
+    ('slider', 'music_vol_slider', {**_SLIDER, 'y': 390, 'label': "Music Volume"},
+     ('_on_volume_change', 'music_volume'), ('audio.music_volume', 0.6, None)),
+    
+    # === ACTION BUTTONS ===
+    ('button', None, {'x': 20, 'y': 440, 'width': 120, 'height': 40, 'text': "APPLY"}, ('_on_apply',), None),
+    ('button', None, {'x': 160, 'y': 440, 'width': 120, 'height': 40, 'text': "RESET"}, ('_on_reset',), None),
+    ('button', None, {'x': 300, 'y': 440, 'width': 120, 'height': 40, 'text': "BACK"}, ('_on_back',), None),
+)
+
+# Widget class, callback keyword and value keyword for each _WIDGETS kind
+_WIDGET_KINDS = {
+    'label': (UILabel, None, None),
+    'button': (UIButton, 'on_click', None),
+    'slider': (UISlider, 'on_value_change', 'current_value'),
+    'checkbox': (UICheckbox, 'on_toggle', 'checked'),
+    'dropdown': (UIDropdown, 'on_select', 'selected_index'),
+}
+
+# Silent (no callback) value setter for each kind that shows a setting
+_WIDGET_SETTERS = {
+    'slider': UISlider.set_value,
+    'checkbox': UICheckbox.set_checked,
+    'dropdown': UIDropdown.set_selected,
+}
+
+
 class SettingsMenuScene(Scene):
     """
     Modern settings menu with OpenGL-based UI components.
@@ -38,259 +125,162 @@ class SettingsMenuScene(Scene):
         self.theme = theme or DefaultTheme()
         self.ui_manager: UIManager = None
         
+        # Widgets that settings/layout code updates in place
+        self.main_panel: UIPanel = None
+        self.shadow_slider: UISlider = None
+        self.msaa_dropdown: UIDropdown = None
+        self.vsync_checkbox: UICheckbox = None
+        self.fullscreen_checkbox: UICheckbox = None
+        self.master_vol_slider: UISlider = None
+        self.music_vol_slider: UISlider = None
+        
         self._initialized = False
+        
+        # Layer-sorted draw list of on-screen elements, built once per UI layout
+        self._draw_list: list = []
+        self._draw_list_dirty = True
+        self._window_size = (1280, 720)
+        
+        # Open dropdowns, drawn after the main pass so they stay on top
+        self._deferred_render: list = []
+        
+        # UI font, loaded lazily on first render
+        self._ui_font = None
+        
+        # Last shadow map size written by the slider (skips repeated writes
+        # while dragging within one step); None forces the next write
+        self._last_shadow_size = None
+        
+        # Slider values buffered between flushes (path -> value); committed
+        # at most once per frame by update() and on mouse release
+        self._pending_settings: dict = {}
+        self._last_flush_t = 0.0
     
     def initialize_ui(self, window_width: int, window_height: int):
         """
         Initialize modern UI elements.
+        Widgets are built once; later calls (and resizes) only re-layout.
         
         Args:
             window_width: Window width
             window_height: Window height
         """
         if self._initialized:
+            self._layout(window_width, window_height)
             return
         
         print("[SettingsMenu] Initializing modern UI...")
         
         self.ui_manager = UIManager(window_width, window_height)
+        self._build_widgets()
+        self._layout(window_width, window_height)
         
-        # Main panel
-        panel_width = 600
-        panel_height = 500
-        panel_x = (window_width - panel_width) / 2
-        panel_y = (window_height - panel_height) / 2
+        self._deferred_render.clear()
+        self._initialized = True
+        print("[SettingsMenu] Modern UI initialized")
+    
+    def _build_widgets(self):
+        """Construct every widget once, with the main panel at the origin."""
+        # Theme styles are shared instances, looked up by widget kind
+        theme = self.theme
         
+        # Main panel (positioned by _layout)
         main_panel = UIPanel(
-            x=panel_x,
-            y=panel_y,
-            width=panel_width,
-            height=panel_height,
-            style=self.theme.panel
+            x=0,
+            y=0,
+            width=_PANEL_WIDTH,
+            height=_PANEL_HEIGHT,
+            style=theme.panel
         )
         self.ui_manager.add_element(main_panel)
+        self.main_panel = main_panel
         
-        # Title
-        title = UILabel(
-            x=20,
-            y=10,
-            text="SETTINGS",
-            size=1.5,
-            bold=True,
-            style=self.theme.label
-        )
-        main_panel.add_child(title)
-        
-        # === GRAPHICS SECTION ===
-        
-        graphics_header = UILabel(
-            x=20,
-            y=50,
-            text="GRAPHICS",
-            size=1.2,
-            bold=True,
-            style=self.theme.label
-        )
-        main_panel.add_child(graphics_header)
-        
-        # Graphics preset buttons
-        presets = ["Low", "Medium", "High", "Ultra"]
-        for i, preset in enumerate(presets):
-            btn = UIButton(
-                x=20 + i * 135,
-                y=80,
-                width=125,
-                height=35,
-                text=preset,
-                on_click=lambda p=preset.lower(): self._on_preset_click(p),
-                style=self.theme.button
-            )
-            main_panel.add_child(btn)
-        
-        # Shadow Quality Slider (with more space for label)
-        shadow_current = self.app.settings.get('graphics.shadow_map_size') if self.app else 2048
-        shadow_value = {512: 0.0, 1024: 0.33, 2048: 0.66, 4096: 1.0}.get(shadow_current, 0.66)
-        
-        shadow_slider = UISlider(
-            x=20,
-            y=145,  # Lower to give space for label
-            width=480,
-            height=30,
-            min_value=0.0,
-            max_value=1.0,
-            current_value=shadow_value,
-            on_value_change=self._on_shadow_quality_change,
-            label="Shadow Quality",
-            style=self.theme.slider
-        )
-        main_panel.add_child(shadow_slider)
-        
-        # MSAA Dropdown (with label, more spacing from slider)
-        msaa_label = UILabel(
-            x=20,
-            y=195,
-            text="MSAA:",
-            size=0.9,
-            style=self.theme.label
-        )
-        main_panel.add_child(msaa_label)
-        
-        msaa_current = self.app.settings.get('graphics.msaa_samples') if self.app else 4
-        msaa_options = ["Off", "2x", "4x", "8x"]
-        msaa_map = {0: 0, 2: 1, 4: 2, 8: 3}
-        msaa_index = msaa_map.get(msaa_current, 2)
-        
-        msaa_dropdown = UIDropdown(
-            x=100,
-            y=190,
-            width=150,
-            height=30,
-            options=msaa_options,
-            selected_index=msaa_index,
-            on_select=self._on_msaa_change,
-            style=self.theme.dropdown
-        )
-        main_panel.add_child(msaa_dropdown)
-        
-        # VSync Checkbox (with more spacing)
-        vsync_current = self.app.settings.get('window.vsync') if self.app else True
-        vsync_checkbox = UICheckbox(
-            x=20,
-            y=240,
-            label="VSync",
-            checked=vsync_current,
-            on_toggle=self._on_vsync_toggle,
-            style=self.theme.checkbox
-        )
-        main_panel.add_child(vsync_checkbox)
-        
-        # Fullscreen Checkbox
-        fullscreen_current = self.app.settings.get('window.fullscreen') if self.app else False
-        fullscreen_checkbox = UICheckbox(
-            x=200,
-            y=240,
-            label="Fullscreen",
-            checked=fullscreen_current,
-            on_toggle=self._on_fullscreen_toggle,
-            style=self.theme.checkbox
-        )
-        main_panel.add_child(fullscreen_checkbox)
-        
-        # === AUDIO SECTION ===
+        # Children (positions are relative to the panel)
+        for kind, attr, kwargs, callback, setting in _WIDGETS:
+            widget_class, callback_arg, value_arg = _WIDGET_KINDS[kind]
+            kwargs = dict(kwargs, style=getattr(theme, kind))
+            
+            if callback is not None:
+                handler = getattr(self, callback[0])
+                kwargs[callback_arg] = partial(handler, *callback[1:]) if len(callback) > 1 else handler
+            if setting is not None:
+                kwargs[value_arg] = self._setting_value(setting)
+            if kind == 'dropdown':
+                kwargs['on_open_change'] = self._on_dropdown_open_change
+            
+            widget = widget_class(**kwargs)
+            main_panel.add_child(widget)
+            if attr is not None:
+                setattr(self, attr, widget)
+    
+    def _setting_value(self, setting: tuple):
+        """
+        Get the widget value for a _WIDGETS setting entry.
         
-        audio_header = UILabel(
-            x=20,
-            y=290,
-            text="AUDIO",
-            size=1.2,
-            bold=True,
-            style=self.theme.label
-        )
-        main_panel.add_child(audio_header)
-        
-        # Master Volume Slider
-        master_vol_current = self.app.settings.get('audio.master_volume') if self.app else 0.8
-        
-        master_vol_slider = UISlider(
-            x=20,
-            y=335,  # More space for label
-            width=480,
-            height=30,
-            min_value=0.0,
-            max_value=1.0,
-            current_value=master_vol_current,
-            on_value_change=self._on_master_volume_change,
-            label="Master Volume",
-            style=self.theme.slider
-        )
-        main_panel.add_child(master_vol_slider)
-        
-        # Music Volume Slider
-        music_vol_current = self.app.settings.get('audio.music_volume') if self.app else 0.6
-        
-        music_vol_slider = UISlider(
-            x=20,
-            y=390,  # Proper spacing
-            width=480,
-            height=30,
-            min_value=0.0,
-            max_value=1.0,
-            current_value=music_vol_current,
-            on_value_change=self._on_music_volume_change,
-            label="Music Volume",
-            style=self.theme.slider
-        )
-        main_panel.add_child(music_vol_slider)
-        
-        # === ACTION BUTTONS ===
-        
-        # Apply Button
-        apply_btn = UIButton(
-            x=20,
-            y=440,
-            width=120,
-            height=40,
-            text="APPLY",
-            on_click=self._on_apply,
-            style=self.theme.button
-        )
-        main_panel.add_child(apply_btn)
-        
-        # Reset Button
-        reset_btn = UIButton(
-            x=160,
-            y=440,
-            width=120,
-            height=40,
-            text="RESET",
-            on_click=self._on_reset,
-            style=self.theme.button
-        )
-        main_panel.add_child(reset_btn)
-        
-        # Back Button
-        back_btn = UIButton(
-            x=300,
-            y=440,
-            width=120,
-            height=40,
-            text="BACK",
-            on_click=self._on_back,
-            style=self.theme.button
-        )
-        main_panel.add_child(back_btn)
+        Args:
+            setting: (path, default, value map or None)
+            
+        Returns:
+            Current setting (default without an app), mapped if a map is given
+        """
+        path, default, value_map = setting
+        current = self.app.settings.get(path) if self.app else default
+        if value_map is not None:
+            return value_map.get(current, value_map[default])
+        return current
+    
+    def _layout(self, window_width: int, window_height: int):
+        """
+        Position the already-built widgets for the given window size.
+        Children are placed relative to the main panel, so only it moves.
         
-        self._initialized = True
-        print("[SettingsMenu] Modern UI initialized")
+        Args:
+            window_width: Window width
+            window_height: Window height
+        """
+        self.ui_manager.set_window_size(window_width, window_height)
+        self._window_size = (window_width, window_height)
+        
+        panel = self.main_panel
+        panel_x = (window_width - _PANEL_WIDTH) / 2
+        panel_y = (window_height - _PANEL_HEIGHT) / 2
+        panel.x = panel.compiled_x = panel_x
+        panel.y = panel.compiled_y = panel_y
+        panel.x_size = px(panel_x)
+        panel.y_size = px(panel_y)
+        
+        # Bounding boxes and the offscreen cull depend on the layout
+        self._draw_list_dirty = True
     
     # === Callbacks ===
     
+    def _on_dropdown_open_change(self, dropdown, is_open: bool):
+        """Move a dropdown in or out of the deferred (on-top) render list."""
+        if is_open:
+            self._deferred_render.append(dropdown)
+        elif dropdown in self._deferred_render:
+            self._deferred_render.remove(dropdown)
+    
     def _on_preset_click(self, preset: str):
         """Handle graphics preset click."""
         print(f"[SettingsMenu] Applying {preset} preset...")
         if self.app and self.app.settings:
             SettingsPresets.apply_graphics_preset(self.app.settings, preset)
+            self._last_shadow_size = None
     
     def _on_shadow_quality_change(self, value: float):
         """Handle shadow quality slider change."""
-        resolutions = {
-            0.0: 512,
-            0.33: 1024,
-            0.66: 2048,
-            1.0: 4096
-        }
-        
-        # Find closest resolution
-        closest_value = min(resolutions.keys(), key=lambda k: abs(k - value))
-        shadow_size = resolutions[closest_value]
+        # Quantize slider value to the nearest resolution step
+        shadow_size = _SHADOW_SIZES[bisect_right(_SHADOW_THRESHOLDS, value)]
+        if shadow_size == self._last_shadow_size:
+            return
+        self._last_shadow_size = shadow_size
         
-        if self.app and self.app.settings:
-            self.app.settings.set('graphics.shadow_map_size', shadow_size)
+        self._pending_settings['graphics.shadow_map_size'] = shadow_size
     
     def _on_msaa_change(self, index: int, text: str):
         """Handle MSAA dropdown change."""
-        msaa_map = {"Off": 0, "2x": 2, "4x": 4, "8x": 8}
-        msaa_value = msaa_map.get(text, 4)
+        msaa_value = _MSAA_SAMPLES[index] if 0 <= index < len(_MSAA_SAMPLES) else 4
         
         if self.app and self.app.settings:
             self.app.settings.set('graphics.msaa_samples', msaa_value)
@@ -305,27 +295,41 @@ class SettingsMenuScene(Scene):
         if self.app and self.app.settings:
             self.app.settings.set('window.fullscreen', value)
     
-    def _on_master_volume_change(self, value: float):
-        """Handle master volume slider change."""
-        if self.app and self.app.settings:
-            self.app.settings.set('audio.master_volume', value)
+    def _on_volume_change(self, channel: str, value: float):
+        """
+        Handle a volume slider change.
+        
+        Args:
+            channel: Volume name under 'audio' (e.g. 'master_volume')
+            value: New slider value (0.0 - 1.0)
+        """
+        self._pending_settings['audio.' + channel] = value
     
-    def _on_music_volume_change(self, value: float):
-        """Handle music volume slider change."""
+    def _flush_pending_settings(self):
+        """Write slider values buffered since the last flush to the settings."""
+        self._last_flush_t = time.monotonic()
+        pending = self._pending_settings
+        if not pending:
+            return
         if self.app and self.app.settings:
-            self.app.settings.set('audio.music_volume', value)
+            for path, value in pending.items():
+                self.app.settings.set(path, value)
+        pending.clear()
+    
+    def _flush_pending_settings_if_due(self):
+        """Trailing flush of slider drags, capped to about one write per frame."""
+        if (self._pending_settings
+                and time.monotonic() - self._last_flush_t > _SETTINGS_FLUSH_INTERVAL):
+            self._flush_pending_settings()
     
     def _on_apply(self):
         """Handle Apply button click."""
         print("\n[SettingsMenu] Applying settings...")
+        self._flush_pending_settings()
         if self.app:
             if self.app.renderer:
                 self.app.renderer.apply_settings()
             
-            # Force UI font reload
-            if hasattr(self, '_ui_font'):
-                delattr(self, '_ui_font')
-            
             self.app.settings.save()
             print("[SettingsMenu] Settings applied and saved!")
     
@@ -335,23 +339,61 @@ class SettingsMenuScene(Scene):
         if self.app and self.app.settings:
             self.app.settings.reset_to_defaults('graphics')
             self.app.settings.reset_to_defaults('audio')
+            self._refresh_from_settings()
             print("[SettingsMenu] Settings reset!")
     
+    def _refresh_from_settings(self):
+        """
+        Push current setting values into the existing widgets (no rebuild).
+        Widget callbacks are not fired - the settings already hold the values.
+        """
+        if not self._initialized or not (self.app and self.app.settings):
+            return
+        
+        self._pending_settings.clear()
+        self._last_shadow_size = None
+        
+        for kind, attr, _, _, setting in _WIDGETS:
+            if setting is not None:
+                _WIDGET_SETTERS[kind](getattr(self, attr), self._setting_value(setting))
+        
+        # Only the widget values changed - redraw the UI cache once
+        self.ui_manager.dirty = True
+    
     def _on_back(self):
         """Handle Back button click."""
         print("[SettingsMenu] Returning to game...")
         if self.app and self.return_scene:
             self.app.renderer.set_scene(self.return_scene)
+        self._release_ui_font()
+    
+    def _release_ui_font(self):
+        """Hand the UI font back to FontLoader; render_ui loads it again if needed."""
+        if self._ui_font is None:
+            return
+        if self.app and self.app.text_renderer and self.app.text_renderer.font is self._ui_font:
+            self.app.text_renderer.font = None
+        FontLoader.release(self._ui_font)
+        self._ui_font = None
     
     # === Scene Methods ===
     
     def update(self, delta_time: float):
         """Update the scene."""
-        super().update(delta_time)
+        self._flush_pending_settings_if_due()
         
+        # Only marks the UI dirty when an element changed visibly
         if self.ui_manager:
             self.ui_manager.update(delta_time)
     
+    def on_enter(self):
+        """Build the UI when the menu is opened instead of on its first frame."""
+        if not self._initialized and self.app:
+            # Current window size, so the first layout is already the final one
+            width = getattr(self.app, 'width', 1280)
+            height = getattr(self.app, 'height', 720)
+            self.initialize_ui(width, height)
+    
     def on_mouse_move(self, x: float, y: float):
         """Handle mouse movement."""
         if self.ui_manager:
@@ -366,6 +408,43 @@ class SettingsMenuScene(Scene):
         """Handle mouse release."""
         if self.ui_manager:
             self.ui_manager.on_mouse_release(x, y, button)
+        
+        # Commit the final value of a slider drag right away
+        self._flush_pending_settings()
+    
+    def on_resize(self, width: int, height: int):
+        """
+        Handle window resize events by re-laying out the existing widgets.
+        
+        Args:
+            width: New window width
+            height: New window height
+        """
+        if self._initialized:
+            self._layout(width, height)
+    
+    def _rebuild_draw_list(self):
+        """
+        Collect all on-screen elements (including children) and sort them by layer.
+        Elements whose cached bounding box lies entirely outside the window
+        are left out, so the render loop never visits them.
+        """
+        draw_list = self._draw_list
+        draw_list.clear()
+        clip_right, clip_bottom = self._window_size
+        
+        # Depth-first walk with an explicit stack (pre-order, children in order)
+        stack = list(reversed(self.ui_manager.elements))
+        while stack:
+            elem = stack.pop()
+            left, top, right, bottom = elem.update_cached_bbox()
+            if right >= 0 and bottom >= 0 and left <= clip_right and top <= clip_bottom:
+                draw_list.append(elem)
+            stack.extend(reversed(elem.children))
+        
+        # Sort by layer (lower layers first, higher layers on top)
+        draw_list.sort(key=lambda e: e.layer)
+        self._draw_list_dirty = False
     
     def render_ui(self, text_renderer):
         """
@@ -374,56 +453,76 @@ class SettingsMenuScene(Scene):
         Args:
             text_renderer: TextRenderer instance
         """
-        if not self._initialized and self.app:
-            width = self.app.width if hasattr(self.app, 'width') else 1280
-            height = self.app.height if hasattr(self.app, 'height') else 720
-            self.initialize_ui(width, height)
+        # Normally built by on_enter(); covers scenes rendered without it
+        if not self._initialized:
+            self.on_enter()
+        
+        # Scenes are not ticked by the app loop, so render_ui doubles as the
+        # per-frame hook for committing buffered slider values
+        self._flush_pending_settings_if_due()
         
         if self.ui_manager and self.app and self.app.ui_renderer:
             # Load font for text labels
-            if not hasattr(self, '_ui_font'):
-                from engine.src import FontLoader
+            if self._ui_font is None:
                 self._ui_font = FontLoader.load("C:/Windows/Fonts/arial.ttf", 24)
                 print(f"[SettingsMenu] UI font loaded")
             
-            # Prepare OpenGL state for 2D UI rendering (handled by UIManager)
-            self.ui_manager.prepare_for_rendering()
-            
-            # Attach font to text_renderer for labels
-            text_renderer.font = self._ui_font
-            
-            # Render all UI elements in layer order
-            # Collect all renderable elements (including children recursively)
-            all_elements = []
+            # Rebuild the layer-sorted draw list only when the layout changed
+            if self._draw_list_dirty:
+                self._rebuild_draw_list()
+                self.ui_manager.dirty = True
             
-            def collect_elements(elem):
-                """Recursively collect all elements for layer-based rendering."""
-                all_elements.append(elem)
-                if hasattr(elem, 'children'):
-                    for child in elem.children:
-                        collect_elements(child)
+            ui_renderer = self.app.ui_renderer
+            renderer = self.app.renderer
             
-            # Collect all elements from panels
-            for element in self.ui_manager.elements:
-                collect_elements(element)
+            # 2D state block; depth/culling come from the renderer's tracked
+            # state (the render pipeline has already disabled culling)
+            with ui_renderer.scoped_2d_state(renderer.gl_state if renderer else None):
+                # Widgets are drawn into the UI cache only when something
+                # changed; every frame composites the cached texture
+                if self.ui_manager.dirty or not ui_renderer.has_cache():
+                    text_renderer.font = self._ui_font
+                    ui_renderer.begin_cache()
+                    self._draw_elements(ui_renderer, text_renderer)
+                    ui_renderer.end_cache()
+                    text_renderer.clear_font()
+                    self.ui_manager.dirty = False
+                ui_renderer.draw_cache()
+    
+    def _draw_elements(self, ui_renderer, text_renderer):
+        """
+        Draw the UI in a single layer-ordered pass, then open dropdowns.
+        Rects and label text are batched per pass (rects flushed first, text
+        on top) and flushed before the overlays so an open dropdown still
+        covers what lies beneath it.
+        
+        Args:
+            ui_renderer: UIRenderer instance
+            text_renderer: TextRenderer instance
+        """
+        deferred = self._deferred_render
+        
+        ui_renderer.begin_batch()
+        text_renderer.begin_batch()
+        for element in self._draw_list:
+            if not element.visible or element in deferred:
+                continue
             
-            # Sort by layer (lower layers first, higher layers on top)
-            sorted_elements = sorted(all_elements, key=lambda e: e.layer if hasattr(e, 'layer') else 0)
+            # Don't render if parent is invisible
+            parent = element.parent
+            if parent and not parent.visible:
+                continue
             
-            # Render in layer order (each element rendered independently)
-            for element in sorted_elements:
+            element.render(ui_renderer, text_renderer)
+        ui_renderer.end_batch()
+        text_renderer.end_batch()
+        
+        if deferred:
+            ui_renderer.begin_batch()
+            text_renderer.begin_batch()
+            for element in deferred:
                 if element.visible:
-                    # Don't render if parent is invisible
-                    parent = element.parent if hasattr(element, 'parent') else None
-                    if parent and not parent.visible:
-                        continue
-                    
-                    element.render(self.app.ui_renderer, text_renderer)
-            
-            # Clean up font
-            if hasattr(text_renderer, 'font'):
-                delattr(text_renderer, 'font')
-            
-            # Restore OpenGL state (handled by UIManager)
-            self.ui_manager.restore_after_rendering()
+                    element.render(ui_renderer, text_renderer)
+            ui_renderer.end_batch()
+            text_renderer.end_batch()
 
@@ -3,7 +3,7 @@ Particle Demo Scene
 Demonstrates the particle system with various effects.
 """
 
-from engine.src import Scene, Camera, ParticleSystem, ParticlePresets
+from engine.src import Scene, Camera, ParticleSystem, ParticlePresets, Text2D
 import numpy as np
 
 
@@ -45,7 +45,6 @@ class ParticleDemoScene(Scene):
         self._create_effect("fire")
         
         # Add text instructions
-        from engine.src import Text2D
         instructions = Text2D(
             label="instructions",
             text="Press SPACE to cycle particle effects",
@@ -86,9 +85,7 @@ class ParticleDemoScene(Scene):
         elif effect_name == "explosion":
             emitter = ParticlePresets.create_explosion(position)
             # Trigger one-time burst
-            emitter.is_emitting = True
-            for _ in range(50):
-                emitter._spawn_particle()
+            emitter.spawn_burst(50)
             emitter.is_emitting = False
         else:
             emitter = ParticlePresets.create_fire(position)
@@ -110,8 +107,7 @@ class ParticleDemoScene(Scene):
         # Handle effect switching
         self.switch_cooldown = max(0, self.switch_cooldown - delta_time)
         
-        # Space key to switch effects (using GLFW directly for now)
-        import glfw
+        # Space key to switch effects
         # We'd need input handling here, but for demo purposes
         # the user can implement key binding
     
@@ -3,14 +3,74 @@ Settings Menu Scene
 Game-specific settings menu using OpenGL UI components.
 """
 
-from engine.src import Scene, SettingsManager, SettingsPresets
+import logging
+from bisect import bisect_right
+from functools import partial
+from operator import attrgetter
+import numpy as np
+from engine.src import Scene, SettingsManager, SettingsPresets, FontLoader
 from engine.src.ui import (
     UIManager, UIPanel, UIButton, UILabel, UISlider,
-    UICheckbox, UIDropdown, Anchor, DefaultTheme,
-    FlexContainer, px, vw, vh, percent, calc, add, sub, mul, div
+    UICheckbox, UIDropdown, UIElement, Anchor, DefaultTheme,
+    FlexContainer, px, vw, vh, percent
 )
 
 
+# Layout/resize diagnostics go through logging (silent by default) so
+# drag-resizing doesn't block on stdout
+log = logging.getLogger(__name__)
+
+# Shadow map resolutions selectable by the shadow quality slider (0.0 - 1.0)
+_SHADOW_SIZES = (512, 1024, 2048, 4096)
+
+# Slider values where the selection steps up to the next resolution
+# (midpoints between the slider positions below)
+_SHADOW_THRESHOLDS = (0.165, 0.495, 0.83)
+
+# Slider position for each shadow map resolution
+_SHADOW_SLIDER_VALUES = {512: 0.0, 1024: 0.33, 2048: 0.66, 4096: 1.0}
+
+# Graphics preset button labels (lower-cased for SettingsPresets)
+_PRESET_OPTIONS = ("Low", "Medium", "High", "Ultra")
+
+# MSAA dropdown options and their sample counts, index for index
+_MSAA_OPTIONS = ("Off", "2x", "4x", "8x")
+_MSAA_SAMPLES = (0, 2, 4, 8)
+
+# MSAA dropdown option index for each sample count
+_MSAA_INDEX = {samples: index for index, samples in enumerate(_MSAA_SAMPLES)}
+
+# Theme metrics at the 1280x720 reference size, scaled by the UI scale factor
+_THEME_SCALED = (
+    ('button', 'text_size', 1.0),
+    ('button', 'padding', 15.0),
+    ('button', 'border_width', 2.0),
+    ('button', 'border_radius', 5.0),
+    ('label', 'text_size', 1.0),
+    ('label', 'padding', 0.0),  # Labels don't use padding
+    ('slider', 'text_size', 1.0),
+    ('slider', 'track_height', 8.0),
+    ('slider', 'handle_radius', 12.0),
+    ('slider', 'border_width', 2.0),
+    ('slider', 'label_spacing', 10.0),
+    ('dropdown', 'text_size', 1.0),
+    ('dropdown', 'padding', 10.0),
+    ('dropdown', 'border_width', 2.0),
+    ('dropdown', 'border_radius', 3.0),
+    ('dropdown', 'item_height', 30.0),
+    ('checkbox', 'text_size', 1.0),
+    ('checkbox', 'box_size', 20.0),
+    ('checkbox', 'border_width', 2.0),
+    ('checkbox', 'border_radius', 3.0),
+    ('checkbox', 'check_padding', 4.0),
+    ('panel', 'padding', 20.0),
+    ('panel', 'border_width', 2.0),
+    ('panel', 'border_radius', 10.0),
+)
+_THEME_FIELDS = tuple((style_name, field) for style_name, field, _ in _THEME_SCALED)
+_THEME_BASE = np.array([base for _, _, base in _THEME_SCALED], dtype=np.float64)
+
+
 class SettingsMenuScene(Scene):
     """
     Settings menu with OpenGL-based UI components.
@@ -43,6 +103,35 @@ class SettingsMenuScene(Scene):
         self._initialized = False
         self._debug_buttons_once = False
         self._ui_scale_factor = 1.0  # Dynamic scale based on window size
+        
+        # CSS-like sizes are compiled to pixels only when the viewport changes
+        self._needs_recompile = True
+        
+        # Flattened, layer-sorted element list; re-sorted when a dropdown
+        # opens or closes (its layer changes)
+        self._draw_order: list = []
+        self._draw_order_dirty = True
+        self._draw_order_version = -1  # UIElement.visibility_version when built
+        
+        # Font for widget text, loaded on first render
+        self._ui_font = None
+        
+        # Last shadow map size written by the slider (skips repeated writes
+        # while dragging within one step); None forces the next write
+        self._last_shadow_size = None
+        
+        # Slider values written to settings once per drag (on mouse release)
+        # instead of on every intermediate value
+        self._pending_settings: dict = {}
+        
+        # Widgets whose size depends on the scaled theme (set by _build_ui)
+        self._main_panel: UIPanel = None
+        self._shadow_slider: UISlider = None
+        self._msaa_dropdown: UIDropdown = None
+        self._vsync_checkbox: UICheckbox = None
+        self._fullscreen_checkbox: UICheckbox = None
+        self._master_vol_slider: UISlider = None
+        self._music_vol_slider: UISlider = None
     
     def initialize_ui(self, window_width: int, window_height: int):
         """
@@ -55,60 +144,72 @@ class SettingsMenuScene(Scene):
         if self._initialized:
             return
         
-        print("[SettingsMenu] Initializing modern UI with CSS-like sizing...")
+        log.debug("[SettingsMenu] Initializing modern UI with CSS-like sizing...")
         
-        # Calculate UI scale factor based on window size (reference: 1280x720)
-        self._ui_scale_factor = min(window_width / 1280.0, window_height / 720.0)
-        print(f"[SettingsMenu] UI scale factor: {self._ui_scale_factor:.2f}")
-        
-        # Create scaled theme for this resolution
-        scaled_theme = DefaultTheme()
-        
-        # Scale button theme (ALL properties)
-        scaled_theme.button.text_size = 1.0 * self._ui_scale_factor
-        scaled_theme.button.padding = 15.0 * self._ui_scale_factor
-        scaled_theme.button.border_width = 2.0 * self._ui_scale_factor
-        scaled_theme.button.border_radius = 5.0 * self._ui_scale_factor
-        
-        # Scale label theme (ALL properties)
-        scaled_theme.label.text_size = 1.0 * self._ui_scale_factor
-        scaled_theme.label.padding = 0.0  # Labels don't use padding
-        
-        # Scale slider theme (ALL properties)
-        scaled_theme.slider.text_size = 1.0 * self._ui_scale_factor
-        scaled_theme.slider.track_height = 8.0 * self._ui_scale_factor
-        scaled_theme.slider.handle_radius = 12.0 * self._ui_scale_factor
-        scaled_theme.slider.border_width = 2.0 * self._ui_scale_factor
-        scaled_theme.slider.label_spacing = 10.0 * self._ui_scale_factor
-        
-        # Scale dropdown theme (ALL properties)
-        scaled_theme.dropdown.text_size = 1.0 * self._ui_scale_factor
-        scaled_theme.dropdown.padding = 10.0 * self._ui_scale_factor
-        scaled_theme.dropdown.border_width = 2.0 * self._ui_scale_factor
-        scaled_theme.dropdown.border_radius = 3.0 * self._ui_scale_factor
-        scaled_theme.dropdown.item_height = 30.0 * self._ui_scale_factor
-        
-        # Scale checkbox theme (ALL properties)
-        scaled_theme.checkbox.text_size = 1.0 * self._ui_scale_factor
-        scaled_theme.checkbox.box_size = 20.0 * self._ui_scale_factor
-        scaled_theme.checkbox.border_width = 2.0 * self._ui_scale_factor
-        scaled_theme.checkbox.border_radius = 3.0 * self._ui_scale_factor
-        scaled_theme.checkbox.check_padding = 4.0 * self._ui_scale_factor
-        
-        # Scale panel theme (ALL properties)
-        scaled_theme.panel.padding = 20.0 * self._ui_scale_factor
-        scaled_theme.panel.border_width = 2.0 * self._ui_scale_factor
-        scaled_theme.panel.border_radius = 10.0 * self._ui_scale_factor
-        
-        self.theme = scaled_theme
+        # Scaled theme for this resolution, rescaled in place on resize
+        self.theme = DefaultTheme()
+        self._apply_scale(window_width, window_height)
         
         self.ui_manager = UIManager(window_width, window_height)
+        self._build_ui()
+        self._needs_recompile = True
+        self._draw_order_dirty = True
+        
+        self._load_ui_font()
         
+        self._initialized = True
+        log.debug("[SettingsMenu] Modern UI initialized with CSS-like sizing")
+    
+    def _load_ui_font(self):
+        """Load the widget font and attach it to the shared text renderer."""
+        if self._ui_font is None:
+            self._ui_font = FontLoader.load("C:/Windows/Fonts/arial.ttf", 24)
+            log.debug("[SettingsMenu] UI font loaded")
+        
+        if self.app and self.app.text_renderer:
+            self.app.text_renderer.font = self._ui_font
+    
+    def _apply_scale(self, window_width: int, window_height: int):
+        """
+        Scale theme metrics for the window size (reference: 1280x720).
+        The theme's style objects are shared by every widget, so they are
+        updated in place and the widget tree never has to be rebuilt.
+        
+        Args:
+            window_width: Window width
+            window_height: Window height
+        """
+        self._ui_scale_factor = min(window_width / 1280.0, window_height / 720.0)
+        log.debug("[SettingsMenu] UI scale factor: %.2f", self._ui_scale_factor)
+        
+        scaled_theme = self.theme
+        scale = self._ui_scale_factor
+        
+        # Scale every theme metric with one broadcast multiply
+        scaled = (_THEME_BASE * scale).tolist()
+        for (style_name, field), value in zip(_THEME_FIELDS, scaled):
+            setattr(getattr(scaled_theme, style_name), field, value)
+        
+        # Widgets copy a few style metrics at construction - refresh those
+        if self._main_panel:
+            padding = scaled_theme.panel.padding
+            panel = self._main_panel
+            panel.padding_left = panel.padding_right = padding
+            panel.padding_top = panel.padding_bottom = padding
+        
+        box_size = scaled_theme.checkbox.box_size
+        for checkbox in (self._vsync_checkbox, self._fullscreen_checkbox):
+            if checkbox:
+                checkbox.width = box_size + 10 + len(checkbox.label) * 12
+                checkbox.height = box_size
+    
+    def _build_ui(self):
+        """Construct the widget tree once (CSS units keep it responsive)."""
         # Main panel (responsive, centered, constrained)
-        # Uses vw/vh for responsiveness, calc for centering, min/max for constraints
+        # Uses vw/vh for responsiveness, precomputed offsets for centering, min/max for constraints
         main_panel = UIPanel(
-            x=calc(vw(50), vw(-27.5)),  # Center: 50% - half of 55% = 50% - 27.5%
-            y=calc(vh(50), vh(-42.5)),  # Center: 50% - half of 85% = 50% - 42.5%
+            x=vw(22.5),  # Center: 50% - half of 55% = 22.5%
+            y=vh(7.5),   # Center: 50% - half of 85% = 7.5%
             width=vw(55),      # 55% of viewport width
             height=vh(85),     # 85% of viewport height
             min_width=px(600),  # Minimum size
@@ -116,6 +217,7 @@ class SettingsMenuScene(Scene):
             style=self.theme.panel
         )
         self.ui_manager.add_element(main_panel)
+        self._main_panel = main_panel
         
         # Title (responsive positioning, fixed size multiplier)
         title = UILabel(
@@ -141,29 +243,29 @@ class SettingsMenuScene(Scene):
         main_panel.add_child(graphics_header)
         
         # Graphics preset buttons (safe sizing to prevent overflow)
-        presets = ["Low", "Medium", "High", "Ultra"]
-        button_width = percent(20)     # Safe width
-        button_spacing = percent(2)    # Spacing
-        start_x = percent(3)           # Left padding
-        
-        for i, preset in enumerate(presets):
-            # Calculate position: start + (width + spacing) * index
+        # Same-unit arithmetic is folded here rather than built as calc()
+        # trees - calc/add/mul are only needed when units mix (e.g. vw + px)
+        button_width = 20.0     # Safe width (%)
+        button_spacing = 2.0    # Spacing (%)
+        start_x = 3.0           # Left padding (%)
+        
+        for i, preset in enumerate(_PRESET_OPTIONS):
+            # Position: start + (width + spacing) * index
             # Total: 3% + 4×(20% + 2%) - 2% = 89% (leaves 11% right margin)
-            btn_x = calc(start_x, mul(add(button_width, button_spacing), px(i)))
             btn = UIButton(
-                x=btn_x,
+                x=percent(start_x + (button_width + button_spacing) * i),
                 y=percent(13),      # More space from GRAPHICS header
-                width=button_width,
+                width=percent(button_width),
                 height=percent(7.4), # ~45px
                 text=preset,
-                on_click=lambda p=preset.lower(): self._on_preset_click(p),
+                on_click=partial(self._on_preset_click, preset.lower()),
                 style=self.theme.button
             )
             main_panel.add_child(btn)
         
         # Shadow Quality Slider (responsive width)
         shadow_current = self.app.settings.get('graphics.shadow_map_size') if self.app else 2048
-        shadow_value = {512: 0.0, 1024: 0.33, 2048: 0.66, 4096: 1.0}.get(shadow_current, 0.66)
+        shadow_value = _SHADOW_SLIDER_VALUES.get(shadow_current, 0.66)
         
         shadow_slider = UISlider(
             x=percent(3),       # Left padding
@@ -178,36 +280,37 @@ class SettingsMenuScene(Scene):
             style=self.theme.slider
         )
         main_panel.add_child(shadow_slider)
+        self._shadow_slider = shadow_slider
         
         # MSAA Dropdown (with label, using FlexContainer)
         # MSAA (simple positioning - FlexContainer has bugs)
         msaa_current = self.app.settings.get('graphics.msaa_samples') if self.app else 4
-        msaa_options = ["Off", "2x", "4x", "8x"]
-        msaa_map = {0: 0, 2: 1, 4: 2, 8: 3}
-        msaa_index = msaa_map.get(msaa_current, 2)
+        msaa_index = _MSAA_INDEX.get(msaa_current, 2)
         
         # MSAA dropdown and label (vertically centered)
-        msaa_y_pos = percent(32)    # Spacing from shadow slider
-        msaa_height = percent(5.7)  # ~35px - dropdown height
+        msaa_y_pos = 32.0    # Spacing from shadow slider (%)
+        msaa_height = 5.7    # ~35px - dropdown height (%)
         
         msaa_dropdown = UIDropdown(
             x=percent(18.75),   # ~120px
-            y=msaa_y_pos,       # Dropdown position
+            y=percent(msaa_y_pos),  # Dropdown position
             width=percent(23.44), # ~150px
-            height=msaa_height,
-            options=msaa_options,
+            height=percent(msaa_height),
+            options=_MSAA_OPTIONS,
             selected_index=msaa_index,
             on_select=self._on_msaa_change,
+            on_open_change=self._on_dropdown_open_change,
             style=self.theme.dropdown
         )
         main_panel.add_child(msaa_dropdown)
+        self._msaa_dropdown = msaa_dropdown
         
         # Label vertically centered with dropdown text
         # Dropdown text is centered at: dropdown.y + dropdown.height/2
         # We need to offset label to match that vertical center
         msaa_label = UILabel(
             x=percent(3),       # ~20px
-            y=calc(msaa_y_pos, mul(msaa_height, px(0.3))),  # Offset to center with dropdown text
+            y=percent(msaa_y_pos + msaa_height * 0.3),  # Offset to center with dropdown text
             text="MSAA:",
             size=1.0,           # Standard size for inline labels
             style=self.theme.label
@@ -222,10 +325,11 @@ class SettingsMenuScene(Scene):
             y=percent(40),      # Spacing from MSAA
             label="VSync",
             checked=vsync_current,
-            on_toggle=self._on_vsync_toggle,
+            on_toggle=self.app.settings.get_setter('window.vsync') if self.app else None,
             style=self.theme.checkbox
         )
         main_panel.add_child(vsync_checkbox)
+        self._vsync_checkbox = vsync_checkbox
         
         # Fullscreen Checkbox
         fullscreen_current = self.app.settings.get('window.fullscreen') if self.app else False
@@ -234,10 +338,11 @@ class SettingsMenuScene(Scene):
             y=percent(40),      # Same Y as VSync
             label="Fullscreen",
             checked=fullscreen_current,
-            on_toggle=self._on_fullscreen_toggle,
+            on_toggle=self.app.settings.get_setter('window.fullscreen') if self.app else None,
             style=self.theme.checkbox
         )
         main_panel.add_child(fullscreen_checkbox)
+        self._fullscreen_checkbox = fullscreen_checkbox
         
         # === AUDIO SECTION ===
         
@@ -262,11 +367,12 @@ class SettingsMenuScene(Scene):
             min_value=0.0,
             max_value=1.0,
             current_value=master_vol_current,
-            on_value_change=self._on_master_volume_change,
+            on_value_change=partial(self._on_volume_change, 'master_volume'),
             label="Master Volume",
             style=self.theme.slider
         )
         main_panel.add_child(master_vol_slider)
+        self._master_vol_slider = master_vol_slider
         
         # Music Volume Slider
         music_vol_current = self.app.settings.get('audio.music_volume') if self.app else 0.6
@@ -279,11 +385,12 @@ class SettingsMenuScene(Scene):
             min_value=0.0,
             max_value=1.0,
             current_value=music_vol_current,
-            on_value_change=self._on_music_volume_change,
+            on_value_change=partial(self._on_volume_change, 'music_volume'),
             label="Music Volume",
             style=self.theme.slider
         )
         main_panel.add_child(music_vol_slider)
+        self._music_vol_slider = music_vol_slider
         
         # === ACTION BUTTONS ===
         
@@ -328,73 +435,68 @@ class SettingsMenuScene(Scene):
             style=self.theme.button
         )
         main_panel.add_child(back_btn)
-        
-        self._initialized = True
-        print("[SettingsMenu] Modern UI initialized with CSS-like sizing")
     
     # === Callbacks ===
     
+    def _on_dropdown_open_change(self, dropdown, is_open: bool):
+        """Dropdown layer changed - re-sort the draw order on next render."""
+        self._draw_order_dirty = True
+    
     def _on_preset_click(self, preset: str):
         """Handle graphics preset click."""
         print(f"[SettingsMenu] Applying {preset} preset...")
         if self.app and self.app.settings:
             SettingsPresets.apply_graphics_preset(self.app.settings, preset)
+            self._last_shadow_size = None
     
     def _on_shadow_quality_change(self, value: float):
         """Handle shadow quality slider change."""
-        resolutions = {
-            0.0: 512,
-            0.33: 1024,
-            0.66: 2048,
-            1.0: 4096
-        }
-        
-        # Find closest resolution
-        closest_value = min(resolutions.keys(), key=lambda k: abs(k - value))
-        shadow_size = resolutions[closest_value]
+        # Quantize slider value to the nearest resolution step
+        shadow_size = _SHADOW_SIZES[bisect_right(_SHADOW_THRESHOLDS, value)]
+        if shadow_size == self._last_shadow_size:
+            return
+        self._last_shadow_size = shadow_size
         
-        if self.app and self.app.settings:
-            self.app.settings.set('graphics.shadow_map_size', shadow_size)
+        self._pending_settings['graphics.shadow_map_size'] = shadow_size
     
     def _on_msaa_change(self, index: int, text: str):
         """Handle MSAA dropdown change."""
-        msaa_map = {"Off": 0, "2x": 2, "4x": 4, "8x": 8}
-        msaa_value = msaa_map.get(text, 4)
+        msaa_value = _MSAA_SAMPLES[index] if 0 <= index < len(_MSAA_SAMPLES) else 4
         
         if self.app and self.app.settings:
             self.app.settings.set('graphics.msaa_samples', msaa_value)
     
-    def _on_vsync_toggle(self, value: bool):
-        """Handle VSync checkbox toggle."""
-        if self.app and self.app.settings:
-            self.app.settings.set('window.vsync', value)
-    
-    def _on_fullscreen_toggle(self, value: bool):
-        """Handle fullscreen checkbox toggle."""
-        if self.app and self.app.settings:
-            self.app.settings.set('window.fullscreen', value)
-    
-    def _on_master_volume_change(self, value: float):
-        """Handle master volume slider change."""
-        if self.app and self.app.settings:
-            self.app.settings.set('audio.master_volume', value)
+    def _on_volume_change(self, channel: str, value: float):
+        """
+        Handle a volume slider change.
+        
+        Args:
+            channel: Volume name under 'audio' (e.g. 'master_volume')
+            value: New slider value (0.0 - 1.0)
+        """
+        # Live preview through the audio manager; persisted on release
+        if self.app and self.app.audio_manager:
+            getattr(self.app.audio_manager, 'set_' + channel)(value)
+        self._pending_settings['audio.' + channel] = value
     
-    def _on_music_volume_change(self, value: float):
-        """Handle music volume slider change."""
+    def _flush_pending_settings(self):
+        """Write slider values buffered during a drag to the settings."""
+        pending = self._pending_settings
+        if not pending:
+            return
         if self.app and self.app.settings:
-            self.app.settings.set('audio.music_volume', value)
+            for path, value in pending.items():
+                self.app.settings.set(path, value)
+        pending.clear()
     
     def _on_apply(self):
         """Handle Apply button click."""
         print("\n[SettingsMenu] Applying settings...")
+        self._flush_pending_settings()
         if self.app:
             if self.app.renderer:
                 self.app.renderer.apply_settings()
             
-            # Force UI font reload
-            if hasattr(self, '_ui_font'):
-                delattr(self, '_ui_font')
-            
             self.app.settings.save()
             print("[SettingsMenu] Settings applied and saved!")
     
@@ -404,13 +506,47 @@ class SettingsMenuScene(Scene):
         if self.app and self.app.settings:
             self.app.settings.reset_to_defaults('graphics')
             self.app.settings.reset_to_defaults('audio')
+            self._refresh_from_settings()
             print("[SettingsMenu] Settings reset!")
     
+    def _refresh_from_settings(self):
+        """
+        Push current setting values into the existing widgets (no rebuild).
+        Widget callbacks are not fired - the settings already hold the values.
+        """
+        if not self._initialized or not (self.app and self.app.settings):
+            return
+        
+        settings = self.app.settings
+        self._pending_settings.clear()
+        self._last_shadow_size = None
+        
+        shadow_size = settings.get('graphics.shadow_map_size')
+        self._shadow_slider.set_value(_SHADOW_SLIDER_VALUES.get(shadow_size, 0.66))
+        self._msaa_dropdown.set_selected(_MSAA_INDEX.get(settings.get('graphics.msaa_samples'), 2))
+        self._vsync_checkbox.set_checked(settings.get('window.vsync'))
+        self._fullscreen_checkbox.set_checked(settings.get('window.fullscreen'))
+        self._master_vol_slider.set_value(settings.get('audio.master_volume'))
+        self._music_vol_slider.set_value(settings.get('audio.music_volume'))
+        
+        # Only the widget values changed - redraw the UI cache once
+        self.ui_manager.dirty = True
+    
     def _on_back(self):
         """Handle Back button click."""
         print("[SettingsMenu] Returning to game...")
         if self.app and self.return_scene:
             self.app.renderer.set_scene(self.return_scene)
+        self._release_ui_font()
+    
+    def _release_ui_font(self):
+        """Hand the UI font back to FontLoader; render_ui loads it again if needed."""
+        if self._ui_font is None:
+            return
+        if self.app and self.app.text_renderer and self.app.text_renderer.font is self._ui_font:
+            self.app.text_renderer.font = None
+        FontLoader.release(self._ui_font)
+        self._ui_font = None
     
     # === Scene Methods ===
     
@@ -418,9 +554,18 @@ class SettingsMenuScene(Scene):
         """Update the scene."""
         super().update(delta_time)
         
+        # Only marks the UI dirty when an element changed visibly
         if self.ui_manager:
             self.ui_manager.update(delta_time)
     
+    def on_enter(self):
+        """Build the UI when the menu is opened instead of on its first frame."""
+        if not self._initialized and self.app:
+            # Current window size, so the first layout is already the final one
+            width = getattr(self.app, 'width', 1280)
+            height = getattr(self.app, 'height', 720)
+            self.initialize_ui(width, height)
+    
     def on_mouse_move(self, x: float, y: float):
         """Handle mouse movement."""
         if self.ui_manager:
@@ -435,25 +580,45 @@ class SettingsMenuScene(Scene):
         """Handle mouse release."""
         if self.ui_manager:
             self.ui_manager.on_mouse_release(x, y, button)
+        
+        # A slider drag ends here - persist its final value once
+        self._flush_pending_settings()
     
     def on_resize(self, width: int, height: int):
         """
         Handle window resize events.
-        Updates UI manager viewport for CSS-like sizing (vw/vh units).
-        Also recalculates UI scale factor and reinitializes UI.
+        Updates UI manager viewport for CSS-like sizing (vw/vh units)
+        and rescales the theme; the widget tree itself is kept.
         
         Args:
             width: New window width
             height: New window height
         """
         if self.ui_manager:
-            # Clear old UI elements before reinitializing
-            self.ui_manager.clear()
-            self._initialized = False
-            
-            # Reinitialize with new dimensions and scale factor
-            self.initialize_ui(width, height)
-            print(f"[SettingsMenu] UI reinitialized for {width}x{height}")
+            self.ui_manager.set_window_size(width, height)
+            self._apply_scale(width, height)
+            self._needs_recompile = True
+            log.debug("[SettingsMenu] UI rescaled for %dx%d", width, height)
+    
+    def _rebuild_draw_order(self):
+        """Collect all visible elements (including children) and sort them by layer."""
+        draw_order = self._draw_order
+        draw_order.clear()
+        
+        # Depth-first walk with an explicit stack (pre-order, children in
+        # order), skipping hidden subtrees
+        stack = list(reversed(self.ui_manager.elements))
+        while stack:
+            elem = stack.pop()
+            if not elem.visible:
+                continue
+            draw_order.append(elem)
+            stack.extend(reversed(elem.children))
+        
+        # Sort by layer (lower layers first, higher layers on top)
+        draw_order.sort(key=attrgetter('layer'))
+        self._draw_order_dirty = False
+        self._draw_order_version = UIElement.visibility_version
     
     def render_ui(self, text_renderer):
         """
@@ -462,60 +627,71 @@ class SettingsMenuScene(Scene):
         Args:
             text_renderer: TextRenderer instance
         """
-        if not self._initialized and self.app:
-            width = self.app.width if hasattr(self.app, 'width') else 1280
-            height = self.app.height if hasattr(self.app, 'height') else 720
-            self.initialize_ui(width, height)
+        # Normally built by on_enter(); covers scenes rendered without it
+        if not self._initialized:
+            self.on_enter()
         
         if self.ui_manager and self.app and self.app.ui_renderer:
-            # Load font for text labels
-            if not hasattr(self, '_ui_font'):
-                from engine.src import FontLoader
-                self._ui_font = FontLoader.load("C:/Windows/Fonts/arial.ttf", 24)
-                print(f"[SettingsMenu] UI font loaded")
-            
-            # Prepare OpenGL state for 2D UI rendering (handled by UIManager)
-            self.ui_manager.prepare_for_rendering()
-            
-            # Attach font to text_renderer for labels
-            text_renderer.font = self._ui_font
+            # The font is loaded in initialize_ui (and again after Back
+            # released it); the shared font slot is only written when another
+            # scene attached a different font
+            if self._ui_font is None:
+                self._load_ui_font()
+            if text_renderer.font is not self._ui_font:
+                text_renderer.font = self._ui_font
             
             # COMPILE CSS-LIKE SIZES FIRST! (Critical for CSS units to work!)
-            for element in self.ui_manager.elements:
-                self.ui_manager._compile_element_recursive(element)
+            # The compiled pixels stay on the elements until the viewport changes
+            if self._needs_recompile:
+                for element in self.ui_manager.elements:
+                    self.ui_manager._compile_element_recursive(element)
+                self._needs_recompile = False
             
             # Render all UI elements in layer order
-            # Collect all renderable elements (including children recursively)
-            all_elements = []
-            
-            def collect_elements(elem):
-                """Recursively collect all elements for layer-based rendering."""
-                all_elements.append(elem)
-                if hasattr(elem, 'children'):
-                    for child in elem.children:
-                        collect_elements(child)
-            
-            # Collect all elements from panels
-            for element in self.ui_manager.elements:
-                collect_elements(element)
+            if self._draw_order_dirty or self._draw_order_version != UIElement.visibility_version:
+                self._rebuild_draw_order()
+                self.ui_manager.dirty = True
             
-            # Sort by layer (lower layers first, higher layers on top)
-            sorted_elements = sorted(all_elements, key=lambda e: e.layer if hasattr(e, 'layer') else 0)
+            ui_renderer = self.app.ui_renderer
+            renderer = self.app.renderer
             
-            # Render in layer order (each element rendered independently)
-            for element in sorted_elements:
-                if element.visible:
-                    # Don't render if parent is invisible
-                    parent = element.parent if hasattr(element, 'parent') else None
-                    if parent and not parent.visible:
-                        continue
-                    
-                    element.render(self.app.ui_renderer, text_renderer)
-            
-            # Clean up font
-            if hasattr(text_renderer, 'font'):
-                delattr(text_renderer, 'font')
+            # 2D state block; depth/culling come from the renderer's tracked
+            # state instead of glIsEnabled queries
+            with ui_renderer.scoped_2d_state(renderer.gl_state if renderer else None):
+                # Redraw into the UI cache only when something changed;
+                # idle frames just composite last frame's UI
+                if self.ui_manager.dirty or not ui_renderer.has_cache():
+                    ui_renderer.begin_cache()
+                    self._draw_elements(ui_renderer, text_renderer)
+                    ui_renderer.end_cache()
+                    self.ui_manager.dirty = False
+                ui_renderer.draw_cache()
+    
+    def _draw_elements(self, ui_renderer, text_renderer):
+        """
+        Draw the UI in layer order. Rects and text are batched per layer and
+        flushed (rects first, text on top) whenever the layer changes, so
+        higher layers such as an open dropdown still cover lower ones.
+        
+        Args:
+            ui_renderer: UIRenderer instance
+            text_renderer: TextRenderer instance
+        """
+        # Hidden subtrees were already pruned by _rebuild_draw_order()
+        current_layer = None
+        for element in self._draw_order:
+            if element.layer != current_layer:
+                if current_layer is not None:
+                    ui_renderer.end_batch()
+                    text_renderer.end_batch()
+                ui_renderer.begin_batch()
+                text_renderer.begin_batch()
+                current_layer = element.layer
             
-            # Restore OpenGL state (handled by UIManager)
-            self.ui_manager.restore_after_rendering()
+            element.render(ui_renderer, text_renderer)
+        
+        if current_layer is not None:
+            ui_renderer.end_batch()
+            text_renderer.end_batch()
+
 
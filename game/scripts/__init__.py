@@ -5,7 +5,9 @@ Game-specific script implementations.
 
 from .example_scripts import (
     RotateScript,
+    RotateSystem,
     OscillateScript,
+    OscillatorSystem,
     FPSCounterScript,
     CameraOrbitScript
 )
@@ -15,7 +17,9 @@ from .splash_transition_script import SplashTransitionScript
 
 __all__ = [
     'RotateScript',
+    'RotateSystem',
     'OscillateScript',
+    'OscillatorSystem',
     'FPSCounterScript',
     'CameraOrbitScript',
     'CameraMovementScript',
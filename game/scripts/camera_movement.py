@@ -5,6 +5,30 @@ Handles camera movement and rotation based on input.
 
 from engine.src import GameScript
 import glfw
+import numpy as np
+
+
+# Movement keys and the camera method each one drives
+_MOVE_KEYS = (
+    (glfw.KEY_W, 'move_forward'),
+    (glfw.KEY_S, 'move_backward'),
+    (glfw.KEY_A, 'move_left'),
+    (glfw.KEY_D, 'move_right'),
+    (glfw.KEY_Q, 'move_down'),
+    (glfw.KEY_E, 'move_up'),
+)
+
+# Arrow keys and their (yaw, pitch) directions, row for row
+_ROTATE_KEYS = (glfw.KEY_LEFT, glfw.KEY_RIGHT, glfw.KEY_UP, glfw.KEY_DOWN)
+_ROTATE_DIRS = np.array([
+    [-1.0, 0.0],
+    [1.0, 0.0],
+    [0.0, 1.0],
+    [0.0, -1.0],
+], dtype=np.float32)
+
+# Every key polled per frame, movement keys first
+_POLLED_KEYS = tuple(key for key, _ in _MOVE_KEYS) + _ROTATE_KEYS
 
 
 class CameraMovementScript(GameScript):
@@ -33,10 +57,19 @@ class CameraMovementScript(GameScript):
         
         # Reference to input system (will be set by scene)
         self.input = None
+        
+        # Camera methods, resolved once per camera: movement in _MOVE_KEYS
+        # order, rotate, and zoom (None if the camera cannot zoom)
+        self._move_fns = None
+        self._rotate = None
+        self._zoom = None
+        self._bound_camera = None
     
     def on_start(self):
         """Called when script starts."""
         if self.entity:
+            # Resolve camera methods up front rather than on the first frame
+            self._bind_camera(self.entity)
             print(f"[CameraMovementScript] Attached to camera '{self.entity.name}'")
     
     def on_update(self, delta_time: float):
@@ -47,54 +80,66 @@ class CameraMovementScript(GameScript):
         # Get the camera
         camera = self.entity
         
-        # Check if camera has required methods
-        if not all(hasattr(camera, m) for m in ['move_forward', 'move_backward', 'move_left', 
-                                                   'move_right', 'move_up', 'move_down', 'rotate']):
+        # Resolve the camera methods once (camera must support moving and
+        # rotating; zoom is optional)
+        if camera is not self._bound_camera:
+            self._bind_camera(camera)
+        if self._move_fns is None:
             return
         
-        velocity = self.move_speed * delta_time
+        # One poll for every movement and rotation key
+        keys_down = self.input.keyboard.get_keys_down(_POLLED_KEYS)
+        move_count = len(_MOVE_KEYS)
         
         # === KEYBOARD MOVEMENT ===
-        if self.input.keyboard.is_key_pressed(glfw.KEY_W):
-            camera.move_forward(velocity)
-        if self.input.keyboard.is_key_pressed(glfw.KEY_S):
-            camera.move_backward(velocity)
-        if self.input.keyboard.is_key_pressed(glfw.KEY_A):
-            camera.move_left(velocity)
-        if self.input.keyboard.is_key_pressed(glfw.KEY_D):
-            camera.move_right(velocity)
-        if self.input.keyboard.is_key_pressed(glfw.KEY_Q):
-            camera.move_down(velocity)
-        if self.input.keyboard.is_key_pressed(glfw.KEY_E):
-            camera.move_up(velocity)
+        velocity = self.move_speed * delta_time
+        for pressed, move in zip(keys_down[:move_count].tolist(), self._move_fns):
+            if pressed:
+                move(velocity)
         
         # === KEYBOARD ROTATION (Arrow Keys) ===
-        rotation_delta = self.rotate_speed * delta_time
-        yaw_change = 0.0
-        pitch_change = 0.0
+        # Held arrow keys select rows of the direction table; their sum is
+        # the (yaw, pitch) direction
+        rotate_mask = keys_down[move_count:]
+        if rotate_mask.any():
+            rotation_delta = self.rotate_speed * delta_time
+            yaw_change, pitch_change = (rotate_mask @ _ROTATE_DIRS * rotation_delta).tolist()
+            if yaw_change != 0.0 or pitch_change != 0.0:
+                self._rotate(yaw_change, pitch_change)
         
-        if self.input.keyboard.is_key_pressed(glfw.KEY_LEFT):
-            yaw_change -= rotation_delta
-        if self.input.keyboard.is_key_pressed(glfw.KEY_RIGHT):
-            yaw_change += rotation_delta
-        if self.input.keyboard.is_key_pressed(glfw.KEY_UP):
-            pitch_change += rotation_delta
-        if self.input.keyboard.is_key_pressed(glfw.KEY_DOWN):
-            pitch_change -= rotation_delta
-        
-        if yaw_change != 0.0 or pitch_change != 0.0:
-            camera.rotate(yaw_change, pitch_change)
+        mouse = self.input.mouse
         
         # === MOUSE ROTATION (when captured) ===
-        if self.input.mouse.captured:
-            mouse_offset = self.input.mouse.get_offset()
-            if mouse_offset[0] != 0.0 or mouse_offset[1] != 0.0:
+        if mouse.captured:
+            # Plain attributes kept current by the input system (no tuple)
+            offset_x = mouse.offset_x
+            offset_y = mouse.offset_y
+            if offset_x != 0.0 or offset_y != 0.0:
                 # Apply mouse sensitivity
-                yaw = mouse_offset[0] * self.mouse_sensitivity
-                pitch = mouse_offset[1] * self.mouse_sensitivity
-                camera.rotate(yaw, pitch)
+                yaw = offset_x * self.mouse_sensitivity
+                pitch = offset_y * self.mouse_sensitivity
+                self._rotate(yaw, pitch)
         
         # === MOUSE SCROLL ZOOM ===
-        if self.input.scroll_offset != 0.0 and hasattr(camera, 'zoom'):
-            camera.zoom(self.input.scroll_offset)
+        zoom = self._zoom
+        scroll_offset = self.input.scroll_offset
+        if zoom is not None and scroll_offset != 0.0:
+            zoom(scroll_offset)
+    
+    def _bind_camera(self, camera):
+        """
+        Look up the camera's movement, rotate and zoom methods.
+        
+        Args:
+            camera: Camera entity being controlled
+        """
+        self._bound_camera = camera
+        if all(hasattr(camera, name) for _, name in _MOVE_KEYS) and hasattr(camera, 'rotate'):
+            self._move_fns = [getattr(camera, name) for _, name in _MOVE_KEYS]
+            self._rotate = camera.rotate
+            self._zoom = getattr(camera, 'zoom', None)
+        else:
+            self._move_fns = None
+            self._rotate = None
+            self._zoom = None
 
@@ -4,29 +4,46 @@ Demonstrates how to create and use GameScripts.
 """
 
 from engine.src import GameScript
+import math
 import numpy as np
 
 
 class RotateScript(GameScript):
     """Rotates a GameObject continuously."""
     
-    def __init__(self, entity=None, rotation_speed=(0.0, 50.0, 0.0)):
+    def __init__(self, entity=None, rotation_speed=(0.0, 50.0, 0.0), system=None):
         """
         Initialize rotation script.
         
         Args:
             entity: Entity to attach to
             rotation_speed: Rotation speed in degrees per second (pitch, yaw, roll)
+            system: Optional RotateSystem that rotates this entity together
+                    with all others (on_update then does nothing)
         """
         super().__init__(entity)
         self.rotation_speed = np.array(rotation_speed, dtype=np.float32)
+        self.system = system
+        self._batched = False
     
     def on_start(self):
         """Called when script starts."""
+        # The system writes transform rotations directly
+        if self.system is not None and hasattr(self.entity, 'transform'):
+            self.system.register(self)
+            self._batched = True
         print(f"[RotateScript] Attached to '{self.entity.name}' - rotation started")
     
+    def on_detach(self):
+        """Stop being driven by the shared system."""
+        if self._batched:
+            self.system.unregister(self)
+            self._batched = False
+    
     def on_update(self, delta_time: float):
         """Rotate the game object each frame."""
+        if self._batched:
+            return
         if self.entity and hasattr(self.entity, 'rotate'):
             # Calculate rotation for this frame
             rotation = self.rotation_speed * delta_time
@@ -37,10 +54,77 @@ class RotateScript(GameScript):
             )
 
 
+class RotateSystem(GameScript):
+    """
+    Global script that rotates every registered RotateScript's entity in
+    one pass: all per-frame rotation steps come from a single (N, 3)
+    multiply instead of one per script. Add it to the scene and pass it
+    to each RotateScript.
+    """
+    
+    def __init__(self, entity=None):
+        """
+        Initialize an empty rotate system.
+        
+        Args:
+            entity: Should be None (global script)
+        """
+        super().__init__(entity)
+        self._scripts = []
+        self._speeds = np.zeros((0, 3), dtype=np.float32)
+    
+    def register(self, script: 'RotateScript'):
+        """
+        Start rotating a script's entity at its current rotation_speed
+        (later changes to rotation_speed need unregister/register).
+        
+        Args:
+            script: RotateScript whose entity has a transform
+        """
+        if script in self._scripts:
+            return
+        self._scripts.append(script)
+        self._speeds = np.vstack((self._speeds, script.rotation_speed))
+    
+    def unregister(self, script: 'RotateScript'):
+        """
+        Stop rotating a script's entity.
+        
+        Args:
+            script: Previously registered RotateScript
+        """
+        if script not in self._scripts:
+            return
+        index = self._scripts.index(script)
+        del self._scripts[index]
+        self._speeds = np.delete(self._speeds, index, axis=0)
+    
+    def on_update(self, delta_time: float):
+        """Rotate all registered entities by this frame's step."""
+        scripts = self._scripts
+        if not scripts:
+            return
+        
+        steps = self._speeds * np.float32(delta_time)
+        
+        # Entities of one scene share a TransformArray: one scatter-add
+        transforms = [script.entity.transform for script in scripts]
+        store = getattr(transforms[0], 'store', None)
+        indices = store.indices_of(transforms) if store is not None else None
+        if indices is not None:
+            enabled = np.array([script.enabled for script in scripts], dtype=bool)
+            np.add.at(store.rotations, indices[enabled], steps[enabled])
+            return
+        
+        for script, step in zip(scripts, steps):
+            if script.enabled:
+                script.entity.transform.rotation += step
+
+
 class OscillateScript(GameScript):
     """Moves a GameObject up and down in a sine wave."""
     
-    def __init__(self, entity=None, speed=1.0, amplitude=0.5):
+    def __init__(self, entity=None, speed=1.0, amplitude=0.5, system=None):
         """
         Initialize oscillate script.
         
@@ -48,27 +132,109 @@ class OscillateScript(GameScript):
             entity: Entity to attach to
             speed: Oscillation speed
             amplitude: Movement amplitude
+            system: Optional OscillatorSystem that updates this oscillator
+                    together with all others (on_update then does nothing)
         """
         super().__init__(entity)
         self.speed = speed
         self.amplitude = amplitude
         self.time = 0.0
         self.initial_y = 0.0
+        self.system = system
     
     def on_start(self):
         """Store initial position."""
         if self.entity and hasattr(self.entity, 'transform'):
             self.initial_y = self.entity.transform.position[1]
+            if self.system is not None:
+                self.system.register(self)
             print(f"[OscillateScript] Attached to '{self.entity.name}' - oscillation started")
     
+    def on_detach(self):
+        """Stop being driven by the shared system."""
+        if self.system is not None:
+            self.system.unregister(self)
+    
     def on_update(self, delta_time: float):
         """Move the object up and down."""
+        if self.system is not None:
+            return
         if self.entity and hasattr(self.entity, 'transform'):
             self.time += delta_time
             offset = np.sin(self.time * self.speed) * self.amplitude
             self.entity.transform.position[1] = self.initial_y + offset
 
 
+class OscillatorSystem(GameScript):
+    """
+    Global script that updates every registered OscillateScript in one
+    vectorized pass (one np.sin over all oscillators instead of one per
+    script). Add it to the scene and pass it to each OscillateScript.
+    """
+    
+    def __init__(self, entity=None):
+        """
+        Initialize an empty oscillator system.
+        
+        Args:
+            entity: Should be None (global script)
+        """
+        super().__init__(entity)
+        self._scripts = []
+        self._times = np.zeros(0, dtype=np.float64)
+        self._speeds = np.zeros(0, dtype=np.float64)
+        self._amplitudes = np.zeros(0, dtype=np.float64)
+        self._initial_ys = np.zeros(0, dtype=np.float64)
+    
+    def register(self, script: OscillateScript):
+        """
+        Start driving an oscillator (uses its current time, speed,
+        amplitude and initial height).
+        
+        Args:
+            script: OscillateScript whose entity has a transform
+        """
+        if script in self._scripts:
+            return
+        self._scripts.append(script)
+        self._times = np.append(self._times, script.time)
+        self._speeds = np.append(self._speeds, script.speed)
+        self._amplitudes = np.append(self._amplitudes, script.amplitude)
+        self._initial_ys = np.append(self._initial_ys, script.initial_y)
+    
+    def unregister(self, script: OscillateScript):
+        """
+        Stop driving an oscillator, handing its elapsed time back to it.
+        
+        Args:
+            script: Previously registered OscillateScript
+        """
+        if script not in self._scripts:
+            return
+        index = self._scripts.index(script)
+        script.time = float(self._times[index])
+        del self._scripts[index]
+        self._times = np.delete(self._times, index)
+        self._speeds = np.delete(self._speeds, index)
+        self._amplitudes = np.delete(self._amplitudes, index)
+        self._initial_ys = np.delete(self._initial_ys, index)
+    
+    def on_update(self, delta_time: float):
+        """Advance all oscillators and write their heights."""
+        scripts = self._scripts
+        if not scripts:
+            return
+        
+        # Disabled oscillators keep their phase, like an unticked script
+        enabled = np.fromiter((s.enabled for s in scripts), dtype=bool, count=len(scripts))
+        self._times += delta_time * enabled
+        heights = self._initial_ys + np.sin(self._times * self._speeds) * self._amplitudes
+        
+        for script, on, y in zip(scripts, enabled.tolist(), heights.tolist()):
+            if on:
+                script.entity.transform.position[1] = y
+
+
 class FPSCounterScript(GameScript):
     """Global script that prints FPS periodically."""
     
@@ -117,6 +283,9 @@ class CameraOrbitScript(GameScript):
         self.orbit_speed = orbit_speed
         self.radius = radius
         self.angle = 0.0
+        
+        # Orbit position, rewritten in place every frame
+        self._pos = np.zeros(3, dtype=np.float32)
     
     def on_start(self):
         """Called when script starts."""
@@ -128,10 +297,13 @@ class CameraOrbitScript(GameScript):
         if self.entity and hasattr(self.entity, 'position'):
             self.angle += self.orbit_speed * delta_time
             
-            # Calculate new position in orbit
-            angle_rad = np.radians(self.angle)
-            x = np.cos(angle_rad) * self.radius
-            z = np.sin(angle_rad) * self.radius
+            # Calculate new position in orbit (scalar math, no temporaries)
+            angle_rad = math.radians(self.angle)
+            pos = self._pos
+            pos[0] = math.cos(angle_rad) * self.radius
+            pos[1] = 0.0
+            pos[2] = math.sin(angle_rad) * self.radius
             
-            self.entity.position = np.array([x, 0.0, z], dtype=np.float32)
+            if self.entity.position is not pos:
+                self.entity.position = pos
 
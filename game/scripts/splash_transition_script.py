@@ -25,7 +25,8 @@ class SplashTransitionScript(GameScript):
         self.duration = duration
         self.main_scene = main_scene
         self.app = app
-        self.start_time = None
+        # time.monotonic_ns() at which to switch scenes (set by on_start)
+        self._deadline_ns = None
         self.transitioned = False
     
     def on_attach(self, entity_or_scene):
@@ -35,17 +36,15 @@ class SplashTransitionScript(GameScript):
     
     def on_start(self):
         """Called before first frame."""
-        self.start_time = time.time()
-        print(f"[SplashTransitionScript] Splash started at {self.start_time}")
+        self._deadline_ns = time.monotonic_ns() + int(self.duration * 1e9)
+        print(f"[SplashTransitionScript] Splash started, transition in {self.duration} seconds")
     
     def on_update(self, delta_time: float):
         """Called every frame - check if it's time to transition."""
-        if self.transitioned or not self.start_time:
+        if self.transitioned or self._deadline_ns is None:
             return
         
-        elapsed = time.time() - self.start_time
-        
-        if elapsed >= self.duration:
+        if time.monotonic_ns() >= self._deadline_ns:
             print(f"\n[SplashTransitionScript] Transitioning to main scene...")
             print(f"[SplashTransition] Main scene has particle_system: {hasattr(self.main_scene, 'particle_system')}")
             if self.app and self.main_scene:
@@ -7,6 +7,20 @@ from engine.src import GameScript, FontLoader
 import os
 
 
+# System font used when no font path is given: the first of these that
+# exists, looked up once at import rather than on every script start
+_DEFAULT_FONT_CANDIDATES = (
+    "C:/Windows/Fonts/arial.ttf",
+    "C:/Windows/Fonts/calibri.ttf",
+    "C:/Windows/Fonts/segoeui.ttf",
+    "C:/Windows/Fonts/tahoma.ttf",
+)
+_DEFAULT_FONT = next(
+    (path for path in _DEFAULT_FONT_CANDIDATES if os.path.exists(path)),
+    _DEFAULT_FONT_CANDIDATES[0]  # FontLoader falls back from here
+)
+
+
 class TextUIScript(GameScript):
     """
     Renders UI text overlays on screen.
@@ -38,15 +52,7 @@ class TextUIScript(GameScript):
         """Called before first frame."""
         # Determine font path
         if self.font_path is None:
-            # Use Windows default font
-            self.font_path = "C:/Windows/Fonts/arial.ttf"
-            if not os.path.exists(self.font_path):
-                # Try alternative fonts
-                for font_name in ["calibri.ttf", "segoeui.ttf", "tahoma.ttf"]:
-                    alt_path = f"C:/Windows/Fonts/{font_name}"
-                    if os.path.exists(alt_path):
-                        self.font_path = alt_path
-                        break
+            self.font_path = _DEFAULT_FONT
         
         # Load font
         print(f"[TextUIScript] Loading font: {self.font_path} (size {self.font_size})")
@@ -76,6 +82,9 @@ class TextUIScript(GameScript):
     def on_detach(self):
         """Called when script is detached."""
         if self.font:
-            FontLoader.cleanup_font(self.font)
+            # Other scripts and scenes may share the font; it is only freed
+            # when the last of them lets go
+            FontLoader.release(self.font)
+            self.font = None
         print(f"[TextUIScript] Detached")
 
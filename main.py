@@ -4,14 +4,12 @@ Entry point for the OpenGL application.
 """
 
 import sys
-import time
 from engine.src import (
-    Application, Scene, SplashScene, GameObject, Model, Camera, GameScript, 
-    ModelLoader, Texture, FontLoader, DirectionalLight, PointLight, SpotLight, Material,
-    Text3D, AudioClip, Audio2D, Audio3D
+    Application, Scene, SplashScene, GameObject, Model, Camera,
+    DirectionalLight, PointLight, SpotLight, Material, Text3D
 )
 # Import particle system
-from engine.src.effects import ParticleSystem, ParticlePresets
+from engine.src.effects import ParticleSystem
 from game.scripts import RotateScript, FPSCounterScript, CameraMovementScript, TextUIScript, SplashTransitionScript
 
 
@@ -203,6 +201,7 @@ def create_main_scene():
     scene.add_script(fps_script)
     
     # === CREATE AUDIO SOURCES (EXAMPLES - COMMENTED OUT) ===
+    # (needs: from engine.src import AudioClip, Audio2D, Audio3D)
     
     # EXAMPLE: Background music (2D audio - plays everywhere)
     # music_clip = AudioClip("assets/audio/background_music.mp3")
@@ -365,6 +364,9 @@ def main():
     # Create main scene first (so it's ready for transition)
     main_scene, main_text_script = create_main_scene()
     
+    # Decode its textures in the background while the window and renderer start up
+    app.preload_textures(main_scene)
+    
     # Create splash scene with reference to main scene for transition
     splash_scene, splash_font_script = create_splash_scene(app, main_scene)
     
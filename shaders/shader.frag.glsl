@@ -286,9 +286,9 @@ void main() {
     // Get normal (potentially from normal map)
     vec3 norm;
     if (useNormalMap == 1) {
-        // Sample normal from normal map and transform to [-1, 1] range
-        norm = texture(normalMap, fragTexCoord).rgb;
-        norm = normalize(norm * 2.0 - 1.0);
+        // Normal maps are uploaded as RG: rebuild Z from the unit-length X/Y
+        vec2 normXY = texture(normalMap, fragTexCoord).rg * 2.0 - 1.0;
+        norm = vec3(normXY, sqrt(max(1.0 - dot(normXY, normXY), 0.0)));
         // Transform from tangent space to world space using TBN matrix
         norm = normalize(TBN * norm);
     } else {
@@ -0,0 +1,128 @@
+"""
+Test: Camera Movement Script
+Tests CameraMovementScript driving the camera from one batched key poll.
+"""
+
+import sys
+import glfw
+import numpy as np
+from types import SimpleNamespace
+from game.scripts.camera_movement import CameraMovementScript, _POLLED_KEYS
+
+
+class _FakeKeyboard:
+    """Keyboard stand-in with a fixed set of held keys."""
+    
+    def __init__(self, held):
+        self.held = set(held)
+        self.polls = 0
+    
+    def get_keys_down(self, keys):
+        self.polls += 1
+        return np.array([key in self.held for key in keys], dtype=np.uint8)
+
+
+class _FakeCamera:
+    """Camera stand-in that records movement and rotation calls."""
+    
+    name = "camera"
+    
+    def __init__(self):
+        self.calls = []
+        for name in ('move_forward', 'move_backward', 'move_left',
+                     'move_right', 'move_up', 'move_down'):
+            setattr(self, name, lambda amount, name=name: self.calls.append((name, amount)))
+    
+    def rotate(self, yaw, pitch):
+        self.calls.append(('rotate', yaw, pitch))
+
+
+def _make_script(held):
+    """Create a script bound to a fake camera and keyboard."""
+    camera = _FakeCamera()
+    script = CameraMovementScript(camera, move_speed=2.0, rotate_speed=10.0)
+    keyboard = _FakeKeyboard(held)
+    script.input = SimpleNamespace(
+        keyboard=keyboard,
+        mouse=SimpleNamespace(captured=False),
+        scroll_offset=0.0
+    )
+    return script, camera, keyboard
+
+
+def test_keys_move_and_rotate():
+    """Test held keys map to the right camera calls with one poll per frame."""
+    print("\n=== TEST 1: Keys Move and Rotate ===")
+    
+    script, camera, keyboard = _make_script([glfw.KEY_W, glfw.KEY_E, glfw.KEY_LEFT, glfw.KEY_UP])
+    script.on_update(0.5)
+    
+    print(f"Camera calls: {camera.calls}")
+    assert keyboard.polls == 1
+    assert camera.calls == [
+        ('move_forward', 1.0),
+        ('move_up', 1.0),
+        ('rotate', -5.0, 5.0),
+    ]
+    
+    print("✅ Keys drive the camera!")
+
+
+def test_idle_frame_no_calls():
+    """Test nothing is called on the camera when no key is held."""
+    print("\n=== TEST 2: Idle Frame ===")
+    
+    script, camera, keyboard = _make_script([])
+    script.on_update(0.5)
+    
+    assert camera.calls == []
+    assert len(_POLLED_KEYS) == 10
+    
+    print("✅ Idle frame leaves the camera alone!")
+
+
+def test_captured_mouse_rotates():
+    """Test a captured mouse's offset attributes drive camera rotation."""
+    print("\n=== TEST 3: Captured Mouse ===")
+    
+    script, camera, keyboard = _make_script([])
+    script.input.mouse = SimpleNamespace(captured=True, offset_x=4.0, offset_y=-2.0)
+    script.on_update(0.5)
+    
+    print(f"Camera calls: {camera.calls}")
+    assert camera.calls == [('rotate', 0.4, -0.2)]
+    
+    print("✅ Mouse offset rotates the camera!")
+
+
+def main():
+    """Run all tests."""
+    print("╔═══════════════════════════════════════════════════╗")
+    print("║  CAMERA MOVEMENT TESTS                            ║")
+    print("╚═══════════════════════════════════════════════════╝")
+    
+    try:
+        test_keys_move_and_rotate()
+        test_idle_frame_no_calls()
+        test_captured_mouse_rotates()
+        
+        print("\n" + "="*60)
+        print("✨ ALL TESTS PASSED! ✨")
+        print("="*60)
+        
+        return 0
+    
+    except AssertionError as e:
+        print(f"\n❌ TEST FAILED: {e}")
+        import traceback
+        traceback.print_exc()
+        return 1
+    except Exception as e:
+        print(f"\n❌ ERROR: {e}")
+        import traceback
+        traceback.print_exc()
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
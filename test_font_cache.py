@@ -0,0 +1,125 @@
+"""
+Test: Font Cache
+Tests FontLoader reusing loaded fonts, releasing shared fonts, and falling
+back to available font files.
+"""
+
+import os
+import sys
+from engine.src.ui import FontLoader, Font
+
+
+def test_cached_font_reused():
+    """Test loading the same font twice returns the cached instance."""
+    print("\n=== TEST 1: Cached Font Reused ===")
+    
+    loads = []
+    original = FontLoader._load_uncached
+    FontLoader._load_uncached = staticmethod(
+        lambda path, size, charset: loads.append((path, size)) or Font(path, size)
+    )
+    FontLoader._cache.clear()
+    try:
+        first = FontLoader.load("missing.ttf", 24)
+        second = FontLoader.load("missing.ttf", 24)
+        other_size = FontLoader.load("missing.ttf", 32)
+    finally:
+        FontLoader._load_uncached = original
+    
+    print(f"Loads from disk: {loads}")
+    assert first is second
+    assert other_size is not first
+    assert loads == [("missing.ttf", 24), ("missing.ttf", 32)]
+    
+    FontLoader.cleanup_font(first)
+    assert ("missing.ttf", 24, None) not in FontLoader._cache
+    FontLoader._cache.clear()
+    
+    print("✅ Font loaded once per path and size!")
+
+
+def test_missing_font_falls_back():
+    """Test a missing font file resolves to the first existing fallback."""
+    print("\n=== TEST 2: Missing Font Falls Back ===")
+    
+    original = FontLoader.FALLBACK_PATHS
+    FontLoader.FALLBACK_PATHS = ("also_missing.ttf", __file__)
+    try:
+        resolved = FontLoader.resolve_path("missing.ttf")
+        existing = FontLoader.resolve_path(__file__)
+        FontLoader.FALLBACK_PATHS = ("also_missing.ttf",)
+        unresolved = FontLoader.resolve_path("missing.ttf")
+    finally:
+        FontLoader.FALLBACK_PATHS = original
+    
+    print(f"Resolved: {os.path.basename(resolved)}")
+    assert resolved == __file__
+    assert existing == __file__
+    assert unresolved is None
+    
+    print("✅ Fallback font used when the requested one is missing!")
+
+
+def test_release_frees_last_reference():
+    """Test a shared font is only cleaned up when its last user releases it."""
+    print("\n=== TEST 3: Release Frees Last Reference ===")
+    
+    original = FontLoader._load_uncached
+    FontLoader._load_uncached = staticmethod(lambda path, size, charset: Font(path, size))
+    FontLoader._cache.clear()
+    FontLoader._ref_counts.clear()
+    try:
+        first = FontLoader.load("missing.ttf", 24)
+        second = FontLoader.load("missing.ttf", 24)
+        assert first is second
+        
+        FontLoader.release(first)
+        assert FontLoader._cache[("missing.ttf", 24, None)] is first, "Font still in use should stay cached"
+        print("Released once: still cached")
+        
+        FontLoader.release(second)
+        assert ("missing.ttf", 24, None) not in FontLoader._cache
+        assert ("missing.ttf", 24, None) not in FontLoader._ref_counts
+        print("Released twice: cleaned up")
+        
+        reloaded = FontLoader.load("missing.ttf", 24)
+        assert reloaded is not first, "Loading after the last release should create a new font"
+    finally:
+        FontLoader._load_uncached = original
+        FontLoader._cache.clear()
+        FontLoader._ref_counts.clear()
+    
+    print("✅ Shared font freed only by its last user!")
+
+
+def main():
+    """Run all tests."""
+    print("╔═══════════════════════════════════════════════════╗")
+    print("║  FONT CACHE TESTS                                 ║")
+    print("╚═══════════════════════════════════════════════════╝")
+    
+    try:
+        test_cached_font_reused()
+        test_missing_font_falls_back()
+        test_release_frees_last_reference()
+        
+        print("\n" + "="*60)
+        print("✨ ALL TESTS PASSED! ✨")
+        print("="*60)
+        
+        return 0
+    
+    except AssertionError as e:
+        print(f"\n❌ TEST FAILED: {e}")
+        import traceback
+        traceback.print_exc()
+        return 1
+    except Exception as e:
+        print(f"\n❌ ERROR: {e}")
+        import traceback
+        traceback.print_exc()
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
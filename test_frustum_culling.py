@@ -0,0 +1,191 @@
+"""
+Test: Frustum Culling
+Tests batched sphere culling, plane extraction from the view-projection
+matrix, and world-space bounds of translated objects.
+"""
+
+import sys
+import numpy as np
+from engine.src.scene.camera import Camera
+from engine.src.scene.gameobject import Transform
+from engine.src.rendering.frustum import Frustum, FrustumResult
+from engine.src.graphics.bounding_volume import BoundingBox, BoundingSphere, transform_spheres
+
+
+def _make_camera():
+    """Create a camera at (0, 2, 10) looking at the origin."""
+    return Camera(position=(0.0, 2.0, 10.0), target=(0.0, 0.0, 0.0), near=0.1, far=50.0)
+
+
+def _frustum_from_camera(camera):
+    """Build a frustum with the renderer's camera-vector method."""
+    frustum = Frustum()
+    frustum.update_from_camera(
+        camera.position, camera.front, camera.right, camera.up,
+        camera.fov, camera.aspect_ratio, camera.near, camera.far
+    )
+    return frustum
+
+
+def _random_spheres(count=500, seed=7):
+    """Random spheres spread around and behind the camera."""
+    rng = np.random.default_rng(seed)
+    centers = rng.uniform(-40.0, 40.0, size=(count, 3)).astype(np.float32)
+    radii = rng.uniform(0.1, 3.0, size=count).astype(np.float32)
+    return centers, radii
+
+
+def test_cull_spheres_matches_test_sphere():
+    """Test the batched test agrees with the per-sphere test."""
+    print("\n=== TEST 1: Batched Matches Per-Sphere ===")
+    
+    frustum = _frustum_from_camera(_make_camera())
+    centers, radii = _random_spheres()
+    
+    visible = frustum.cull_spheres(centers, radii)
+    expected = np.array([
+        frustum.test_sphere(c, float(r)) != FrustumResult.OUTSIDE
+        for c, r in zip(centers, radii)
+    ])
+    
+    assert np.array_equal(visible, expected), "cull_spheres disagrees with test_sphere"
+    assert visible.any() and not visible.all(), "Test data should mix visible and culled"
+    print(f"  ✅ {visible.sum()} of {len(visible)} spheres visible in both paths")
+    
+    assert Frustum().cull_spheres(centers, radii).all(), "Uninitialized frustum should keep everything"
+    print("  ✅ Uninitialized frustum keeps everything")
+
+
+def test_update_from_matrix_matches_camera():
+    """Test planes extracted from view @ projection classify points like the camera planes."""
+    print("\n=== TEST 2: Matrix Extraction ===")
+    
+    camera = _make_camera()
+    from_camera = _frustum_from_camera(camera)
+    from_matrix = Frustum()
+    from_matrix.update_from_matrix(camera.get_view_matrix() @ camera.get_projection_matrix())
+    
+    assert from_matrix.is_initialized(), "Frustum should be initialized"
+    
+    centers, _ = _random_spheres(count=2000, seed=3)
+    points = np.zeros(len(centers), dtype=np.float32)
+    a = from_camera.cull_spheres(centers, points)
+    b = from_matrix.cull_spheres(centers, points)
+    
+    # Points sitting on a plane may round either way
+    mismatches = int((a != b).sum())
+    assert mismatches <= 2, f"{mismatches} points classified differently"
+    print(f"  ✅ Both frustums agree ({mismatches} boundary mismatches)")
+
+
+def test_translated_object_bounds():
+    """Test world bounds follow the object's translation."""
+    print("\n=== TEST 3: Translated Bounds ===")
+    
+    frustum = _frustum_from_camera(_make_camera())
+    local = BoundingSphere(np.zeros(3, dtype=np.float32), 1.0)
+    
+    in_view = Transform(position=(0.0, 0.0, 0.0), scale=(2.0, 1.0, 1.0)).get_model_matrix()
+    behind = Transform(position=(0.0, 0.0, 30.0)).get_model_matrix()
+    matrices = np.stack([in_view, behind])
+    
+    centers, radii = transform_spheres(
+        matrices,
+        np.stack([local.center, local.center]),
+        np.array([local.radius, local.radius], dtype=np.float32)
+    )
+    
+    assert np.allclose(centers[1], [0.0, 0.0, 30.0]), f"Center should follow translation, got {centers[1]}"
+    assert np.isclose(radii[0], 2.0), f"Radius should use the largest scale, got {radii[0]}"
+    assert list(frustum.cull_spheres(centers, radii)) == [True, False], "Object behind camera should be culled"
+    print("  ✅ Spheres follow translation and scale")
+    
+    sphere = local.transform(behind)
+    assert np.allclose(sphere.center, [0.0, 0.0, 30.0]), "BoundingSphere.transform should translate"
+    box = BoundingBox(np.array([-1.0, -1.0, -1.0]), np.array([1.0, 1.0, 1.0])).transform(behind)
+    assert np.allclose(box.min_point, [-1.0, -1.0, 29.0]), "BoundingBox.transform should translate"
+    assert frustum.test_aabb(box.min_point, box.max_point) == FrustumResult.OUTSIDE
+    print("  ✅ BoundingBox/BoundingSphere.transform apply translation")
+
+
+def test_rotated_scaled_sphere_radius():
+    """Test world radii enclose objects under rotation plus non-uniform scale."""
+    print("\n=== TEST 4: Rotated Non-Uniform Scale ===")
+    
+    matrix = Transform(rotation=(0.0, 0.0, 45.0), scale=(4.0, 1.0, 1.0)).get_model_matrix()
+    _, radii = transform_spheres(
+        matrix[np.newaxis],
+        np.zeros((1, 3), dtype=np.float32),
+        np.ones(1, dtype=np.float32)
+    )
+    
+    # Farthest a point of the unit sphere ends up from the center
+    rng = np.random.default_rng(7)
+    points = rng.normal(size=(2000, 3))
+    points /= np.linalg.norm(points, axis=1, keepdims=True)
+    extent = np.linalg.norm(points @ matrix[:3, :3], axis=1).max()
+    
+    assert np.isclose(radii[0], 4.0, atol=1e-4), f"Radius should be the largest scale, got {radii[0]}"
+    assert radii[0] >= extent - 1e-4, f"Radius {radii[0]} should enclose extent {extent}"
+    print("  ✅ Radius encloses the rotated, stretched sphere")
+
+
+def test_camera_matrix_cache():
+    """Test cached camera matrices are reused and follow in-place moves."""
+    print("\n=== TEST 5: Camera Matrix Cache ===")
+    
+    camera = _make_camera()
+    view = camera.get_view_matrix()
+    vp = camera.get_view_projection_matrix()
+    
+    assert camera.get_view_matrix() is view, "Unchanged camera should reuse the view matrix"
+    assert camera.get_view_projection_matrix() is vp, "Unchanged camera should reuse the VP matrix"
+    assert np.allclose(vp, view @ camera.get_projection_matrix()), "VP should be view @ projection"
+    print("  ✅ Matrices reused while the camera is still")
+    
+    camera.move_forward(1.0)
+    moved = camera.get_view_matrix()
+    assert moved is not view, "In-place position change should rebuild the view matrix"
+    assert np.allclose(moved, Camera._look_at(camera.position, camera.position + camera.front, camera.up))
+    
+    camera.set_aspect_ratio(1920, 1080)
+    assert np.allclose(
+        camera.get_view_projection_matrix(),
+        moved @ Camera._perspective(camera.fov, camera.aspect_ratio, camera.near, camera.far)
+    ), "Aspect change should rebuild the VP matrix"
+    print("  ✅ Moves and aspect changes rebuild the cache")
+
+
+def main():
+    """Run all tests."""
+    print("╔═══════════════════════════════════════════════════╗")
+    print("║  FRUSTUM CULLING TESTS                            ║")
+    print("╚═══════════════════════════════════════════════════╝")
+    
+    try:
+        test_cull_spheres_matches_test_sphere()
+        test_update_from_matrix_matches_camera()
+        test_translated_object_bounds()
+        test_rotated_scaled_sphere_radius()
+        test_camera_matrix_cache()
+        
+        print("\n" + "="*60)
+        print("✨ ALL TESTS PASSED! ✨")
+        print("="*60)
+        
+        return 0
+    
+    except AssertionError as e:
+        print(f"\n❌ TEST FAILED: {e}")
+        import traceback
+        traceback.print_exc()
+        return 1
+    except Exception as e:
+        print(f"\n❌ ERROR: {e}")
+        import traceback
+        traceback.print_exc()
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,214 @@
+"""
+Test: Input Coalescing
+Tests that the window delivers one mouse-move and one summed scroll
+callback per poll_events(), however many events GLFW reported, and that
+Input turns them into per-frame mouse and scroll offsets and key edges.
+Also covers waiting for events while the window is minimized.
+"""
+
+import sys
+import glfw
+from engine.src.core import window as window_module
+from engine.src.core.window import Window
+from engine.src.core.input import Input
+
+
+class _FakeGlfw:
+    """Stands in for the glfw calls Window makes while polling."""
+    
+    def __init__(self, window_obj, events):
+        self.window_obj = window_obj
+        self.events = events
+        self.real = window_module.glfw
+        self.cursor = (0.0, 0.0)
+    
+    def get_window_user_pointer(self, handle):
+        return self.window_obj
+    
+    def get_cursor_pos(self, handle):
+        return self.cursor
+    
+    def wait_events_timeout(self, timeout):
+        self.timeout = timeout
+        self.poll_events()
+    
+    def poll_events(self):
+        for callback, args in self.events:
+            if callback is Window._mouse_callback_internal:
+                self.cursor = args
+            callback(None, *args)
+
+
+def _poll(window, events, wait=None):
+    """Run poll_events() (or wait_events(wait)) with GLFW reporting the given raw events."""
+    fake = _FakeGlfw(window, events)
+    window_module.glfw = fake
+    try:
+        if wait is None:
+            window.poll_events()
+        else:
+            window.wait_events(wait)
+    finally:
+        window_module.glfw = fake.real
+    return fake
+
+
+def test_coalesced_moves_and_scroll():
+    """Test many raw events turn into one callback each."""
+    print("\n=== TEST 1: Coalesced Mouse Events ===")
+    
+    window = Window()
+    moves, scrolls = [], []
+    window.set_mouse_callback(lambda x, y: moves.append((x, y)))
+    window.set_scroll_callback(lambda x, y: scrolls.append((x, y)))
+    
+    events = [(Window._mouse_callback_internal, (float(i), float(2 * i))) for i in range(1000)]
+    events += [(Window._scroll_callback_internal, (0.0, 1.0))] * 3
+    _poll(window, events)
+    
+    assert moves == [(999.0, 1998.0)], f"Expected only the latest position, got {len(moves)} calls"
+    assert scrolls == [(0.0, 3.0)], f"Scroll ticks should be summed, got {scrolls}"
+    print("  ✅ 1000 moves -> 1 callback; 3 scroll ticks summed")
+    
+    _poll(window, [])
+    assert len(moves) == 1 and len(scrolls) == 1, "A quiet poll should deliver nothing"
+    print("  ✅ No events -> no callbacks")
+
+
+def test_click_sees_prior_move():
+    """Test a button press is delivered after the move that preceded it."""
+    print("\n=== TEST 2: Event Order Around Clicks ===")
+    
+    window = Window()
+    log = []
+    window.set_mouse_callback(lambda x, y: log.append(("move", x, y)))
+    window.set_mouse_button_callback(lambda b, a, m, x, y: log.append(("button", x, y)))
+    
+    _poll(window, [
+        (Window._mouse_callback_internal, (10.0, 20.0)),
+        (Window._mouse_button_callback_internal, (0, 1, 0)),
+        (Window._mouse_callback_internal, (30.0, 40.0)),
+    ])
+    
+    assert log == [("move", 10.0, 20.0), ("button", 10.0, 20.0), ("move", 30.0, 40.0)], log
+    print("  ✅ Move before the click is flushed first; later move follows")
+
+
+def test_input_frame_offsets():
+    """Test Input offsets cover one frame and clear when the mouse stops."""
+    print("\n=== TEST 3: Per-Frame Input Offsets ===")
+    
+    window = Window()
+    input_manager = Input(None)
+    window.set_mouse_callback(input_manager.update_mouse_position)
+    window.set_scroll_callback(input_manager.update_scroll)
+    sensitivity = input_manager.mouse.sensitivity
+    
+    input_manager.reset_per_frame()
+    _poll(window, [(Window._mouse_callback_internal, (100.0, 100.0))])
+    
+    input_manager.reset_per_frame()
+    _poll(window, [(Window._mouse_callback_internal, (100.0 + i, 100.0)) for i in range(1, 11)])
+    assert abs(input_manager.mouse.offset_x - 10.0 * sensitivity) < 1e-9, "Offset should span the whole frame"
+    print("  ✅ Mouse offset is the frame's full motion, not the last event's")
+    
+    input_manager.reset_per_frame()
+    _poll(window, [])
+    assert input_manager.mouse.get_offset() == (0.0, 0.0), "No motion should leave no offset"
+    print("  ✅ Offset clears on a frame without motion")
+    
+    input_manager.update_scroll(0.0, 1.0)
+    input_manager.update_scroll(0.0, 2.0)
+    assert input_manager.scroll_offset == 3.0, "Scroll within a frame should add up"
+    input_manager.reset_per_frame()
+    assert input_manager.scroll_offset == 0.0
+    print("  ✅ Scroll adds up within a frame and resets after")
+
+
+def test_key_edges():
+    """Test key events fill the key array and yield one press edge per press."""
+    print("\n=== TEST 4: Key State and Press Edges ===")
+    
+    window = Window()
+    input_manager = Input(None)
+    window.set_key_callback(input_manager.update_key)
+    keyboard = input_manager.keyboard
+    
+    def frame(*events):
+        _poll(window, [(Window._key_callback_internal, (key, 0, action, 0)) for key, action in events])
+        keyboard.update_edges()
+    
+    frame((glfw.KEY_TAB, glfw.PRESS), (glfw.KEY_W, glfw.PRESS))
+    assert keyboard.was_key_pressed(glfw.KEY_TAB) and keyboard.is_key_pressed(glfw.KEY_W)
+    assert keyboard.pressed.sum() == 2, "Only the two pressed keys should have edges"
+    print("  ✅ Key down -> pressed edge on that frame")
+    
+    frame((glfw.KEY_TAB, glfw.REPEAT))
+    assert not keyboard.was_key_pressed(glfw.KEY_TAB), "Holding a key is not a new press"
+    assert keyboard.get_keys_down((glfw.KEY_W, glfw.KEY_S, glfw.KEY_TAB)).tolist() == [1, 0, 1]
+    print("  ✅ Held keys stay down without new edges")
+    
+    frame((glfw.KEY_TAB, glfw.RELEASE), (glfw.KEY_C, glfw.PRESS), (glfw.KEY_C, glfw.RELEASE))
+    assert keyboard.is_key_released(glfw.KEY_TAB) and not keyboard.was_key_pressed(glfw.KEY_TAB)
+    assert keyboard.was_key_pressed(glfw.KEY_C) and not keyboard.is_key_pressed(glfw.KEY_C)
+    print("  ✅ A tap within one poll still counts as a press")
+    
+    frame((glfw.KEY_UNKNOWN, glfw.PRESS))
+    assert not keyboard.pressed.any(), "Unknown keys are ignored"
+    print("  ✅ Unknown keys ignored")
+
+
+def test_iconified_wait():
+    """Test the iconify callback tracks minimizing and wait_events delivers input."""
+    print("\n=== TEST 5: Minimized Window ===")
+    
+    window = Window()
+    moves = []
+    window.set_mouse_callback(lambda x, y: moves.append((x, y)))
+    
+    _poll(window, [(Window._iconify_callback_internal, (1,))])
+    assert window.is_iconified, "Minimizing should set is_iconified"
+    print("  ✅ Minimize tracked")
+    
+    fake = _poll(window, [
+        (Window._iconify_callback_internal, (0,)),
+        (Window._mouse_callback_internal, (5.0, 6.0)),
+    ], wait=0.1)
+    assert fake.timeout == 0.1 and not window.is_iconified
+    assert moves == [(5.0, 6.0)], "Input arriving during the wait should be delivered"
+    print("  ✅ Restore wakes the wait and input is delivered")
+
+
+def main():
+    """Run all tests."""
+    print("╔═══════════════════════════════════════════════════╗")
+    print("║  INPUT COALESCING TESTS                           ║")
+    print("╚═══════════════════════════════════════════════════╝")
+    
+    try:
+        test_coalesced_moves_and_scroll()
+        test_click_sees_prior_move()
+        test_input_frame_offsets()
+        test_key_edges()
+        test_iconified_wait()
+        
+        print("\n" + "="*60)
+        print("✨ ALL TESTS PASSED! ✨")
+        print("="*60)
+        
+        return 0
+    
+    except AssertionError as e:
+        print(f"\n❌ TEST FAILED: {e}")
+        import traceback
+        traceback.print_exc()
+        return 1
+    except Exception as e:
+        print(f"\n❌ ERROR: {e}")
+        import traceback
+        traceback.print_exc()
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
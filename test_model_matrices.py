@@ -0,0 +1,138 @@
+"""
+Test: Batched Model Matrices
+Tests build_model_matrices/get_model_matrices against Transform.get_model_matrix,
+and the scene's structure-of-arrays TransformArray storage.
+"""
+
+import sys
+import numpy as np
+from types import SimpleNamespace
+from engine.src.scene.scene import Scene
+from engine.src.scene.gameobject import (
+    GameObject, Transform, TransformArray, build_model_matrices, get_model_matrices
+)
+
+
+def _random_transforms(count=200, seed=11):
+    """Random transforms with arbitrary rotation and non-uniform scale."""
+    rng = np.random.default_rng(seed)
+    return [
+        Transform(
+            position=tuple(rng.uniform(-10.0, 10.0, 3)),
+            rotation=tuple(rng.uniform(-180.0, 180.0, 3)),
+            scale=tuple(rng.uniform(0.25, 3.0, 3))
+        )
+        for _ in range(count)
+    ]
+
+
+def test_matches_transform():
+    """Test the batched matrices equal the per-transform ones."""
+    print("\n=== TEST 1: Matches Transform.get_model_matrix ===")
+    
+    transforms = _random_transforms()
+    expected = np.stack([t.get_model_matrix() for t in transforms])
+    objects = [SimpleNamespace(transform=t) for t in transforms]
+    
+    matrices = get_model_matrices(objects)
+    assert matrices.shape == (len(transforms), 4, 4) and matrices.dtype == np.float32
+    assert np.allclose(matrices, expected, atol=1e-5), f"Max error {np.abs(matrices - expected).max()}"
+    print(f"  ✅ {len(transforms)} matrices match")
+    
+    # Single-axis rotations exercise each factor of Rz @ Ry @ Rx on its own
+    for axis in range(3):
+        rotation = np.zeros((1, 3), dtype=np.float32)
+        rotation[0, axis] = 90.0
+        transform = Transform(position=(1.0, 2.0, 3.0), rotation=tuple(rotation[0]))
+        matrix = build_model_matrices(
+            np.array([[1.0, 2.0, 3.0]], dtype=np.float32),
+            rotation,
+            np.ones((1, 3), dtype=np.float32)
+        )[0]
+        assert np.allclose(matrix, transform.get_model_matrix(), atol=1e-6), f"Axis {axis} mismatch"
+    print("  ✅ Single-axis rotations match")
+
+
+def test_empty():
+    """Test an empty object list gives an empty stack."""
+    print("\n=== TEST 2: Empty Input ===")
+    
+    assert get_model_matrices([]).shape == (0, 4, 4)
+    print("  ✅ No objects -> (0, 4, 4)")
+
+
+def test_transform_array():
+    """Test scene transforms live in one array and stay editable per object."""
+    print("\n=== TEST 3: TransformArray ===")
+    
+    scene = Scene()
+    scene.transforms = TransformArray(capacity=2)
+    objects = [GameObject(f"Obj{i}", position=(float(i), 0.0, 0.0)) for i in range(5)]
+    for obj in objects:
+        scene.add_game_object(obj)
+    
+    assert len(scene.transforms) == 5, "Adding should attach every transform"
+    assert np.allclose(scene.transforms.positions[:, 0], [0, 1, 2, 3, 4]), "Rows should survive growth"
+    print("  ✅ Added objects attached; data kept through growth")
+    
+    objects[1].translate(0.0, 2.0, 0.0)
+    objects[2].set_rotation(0.0, 45.0, 0.0)
+    objects[3].transform.scale *= 2.0
+    assert scene.transforms.positions[1, 1] == 2.0
+    assert scene.transforms.rotations[2, 1] == 45.0
+    assert np.allclose(scene.transforms.scales[3], [2.0, 2.0, 2.0])
+    scene.transforms.rotations[4, 0] = 30.0
+    assert objects[4].transform.rotation[0] == 30.0, "Array writes should show on the object"
+    print("  ✅ Object edits and array writes see the same data")
+    
+    expected = np.stack([obj.get_model_matrix() for obj in objects])
+    assert np.allclose(get_model_matrices(objects), expected, atol=1e-5)
+    print("  ✅ Model matrices gathered from the array match")
+    
+    removed = objects[1]
+    scene.remove_game_object(removed)
+    assert removed.transform.store is None and len(scene.transforms) == 4
+    scene.transforms.positions[1] = 99.0
+    assert removed.transform.position[1] == 2.0, "Removed object should own its data again"
+    
+    newcomer = GameObject("New", position=(7.0, 7.0, 7.0))
+    scene.add_game_object(newcomer)
+    assert scene.transforms.indices_of([newcomer.transform])[0] == 1, "Freed row should be reused"
+    assert scene.transforms.indices_of([removed.transform]) is None
+    
+    mixed = objects[:1] + [removed]
+    assert np.allclose(get_model_matrices(mixed), np.stack([o.get_model_matrix() for o in mixed]), atol=1e-5)
+    print("  ✅ Removal frees the row; mixed objects fall back to gathering")
+
+
+def main():
+    """Run all tests."""
+    print("╔═══════════════════════════════════════════════════╗")
+    print("║  MODEL MATRIX TESTS                               ║")
+    print("╚═══════════════════════════════════════════════════╝")
+    
+    try:
+        test_matches_transform()
+        test_empty()
+        test_transform_array()
+        
+        print("\n" + "="*60)
+        print("✨ ALL TESTS PASSED! ✨")
+        print("="*60)
+        
+        return 0
+    
+    except AssertionError as e:
+        print(f"\n❌ TEST FAILED: {e}")
+        import traceback
+        traceback.print_exc()
+        return 1
+    except Exception as e:
+        print(f"\n❌ ERROR: {e}")
+        import traceback
+        traceback.print_exc()
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,150 @@
+"""
+Test: Particle System
+Tests particle emitter spawning and simulation (no OpenGL required).
+"""
+
+import sys
+import numpy as np
+from engine.src.effects import ParticleEmitter, ParticlePresets
+
+
+def test_spawn_burst_count():
+    """Test burst spawning is clamped to max_particles."""
+    print("\n=== TEST 1: Spawn Burst Count ===")
+    
+    emitter = ParticleEmitter(max_particles=30)
+    
+    spawned = emitter.spawn_burst(50)
+    
+    print(f"Requested: 50, max_particles: 30, spawned: {spawned}")
+    print(f"Expected: 30")
+    
+    assert spawned == 30
+    assert emitter.get_particle_count() == 30
+    assert emitter.spawn_burst(5) == 0
+    
+    print("✅ Burst spawning respects max_particles!")
+
+
+def test_spawn_burst_cone_speed():
+    """Test cone emitters keep the configured emission speed."""
+    print("\n=== TEST 2: Cone Emission Speed ===")
+    
+    emitter = ParticlePresets.create_fire((0.0, 1.0, 0.0))
+    emitter.spawn_burst(100)
+    
+    speeds = [np.linalg.norm(p.velocity) for p in emitter.get_active_particles()]
+    
+    print(f"Speed range: {min(speeds):.3f} - {max(speeds):.3f}")
+    print(f"Expected: 2.0 (fire emit velocity)")
+    
+    assert np.allclose(speeds, 2.0, atol=1e-4)
+    
+    print("✅ Cone emission speed is correct!")
+
+
+def test_spawn_burst_box_bounds():
+    """Test box emitters spawn inside the box."""
+    print("\n=== TEST 3: Box Emitter Bounds ===")
+    
+    emitter = ParticleEmitter(position=(1.0, 2.0, 3.0), emitter_type="box")
+    emitter.box_size = (2.0, 4.0, 6.0)
+    emitter.spawn_burst(200)
+    
+    positions = np.array([p.position for p in emitter.get_active_particles()])
+    offsets = np.abs(positions - np.array([1.0, 2.0, 3.0]))
+    
+    print(f"Max offsets: {offsets.max(axis=0)}")
+    print(f"Expected: <= [1, 2, 3]")
+    
+    assert np.all(offsets <= np.array([1.0, 2.0, 3.0]) + 1e-5)
+    
+    print("✅ Box emitter spawns inside bounds!")
+
+
+def test_update_integrates_and_expires():
+    """Test vectorized update moves particles and removes expired ones."""
+    print("\n=== TEST 4: Update Integrates and Expires ===")
+    
+    emitter = ParticleEmitter(
+        particle_lifetime=1.0,
+        emit_velocity=(0.0, 1.0, 0.0),
+        velocity_randomness=0.0,
+        gravity=None
+    )
+    emitter.is_emitting = False
+    emitter.spawn_burst(10)
+    
+    emitter.update(0.5)
+    
+    print(f"After 0.5s: count={emitter.count}, y={emitter.positions[0, 1]:.3f}")
+    print(f"Expected: count=10, y=0.5")
+    
+    assert emitter.count == 10
+    assert np.allclose(emitter.positions[:emitter.count, 1], 0.5, atol=1e-3)
+    
+    emitter.update(0.6)
+    
+    print(f"After 1.1s: count={emitter.count}")
+    print(f"Expected: 0")
+    
+    assert emitter.count == 0
+    
+    print("✅ Particle arrays integrate and compact!")
+
+
+def test_instance_data_layout():
+    """Test instance data matches the renderer's 9-float layout."""
+    print("\n=== TEST 5: Instance Data Layout ===")
+    
+    emitter = ParticlePresets.create_smoke((0.0, 0.0, 0.0))
+    emitter.is_emitting = False
+    emitter.spawn_burst(5)
+    emitter.update(0.1)
+    
+    data = emitter.get_instance_data()
+    
+    print(f"Instance data shape: {data.shape}, dtype: {data.dtype}")
+    print(f"Expected: (5, 9), float32")
+    
+    assert data.shape == (5, 9)
+    assert data.dtype == np.float32
+    assert np.array_equal(data[:, 0:3], emitter.positions[:5])
+    assert np.array_equal(data[:, 7], emitter.sizes[:5])
+    
+    print("✅ Instance data layout is correct!")
+
+
+def main():
+    """Run all tests."""
+    print("╔═══════════════════════════════════════════════════╗")
+    print("║  PARTICLE SYSTEM TESTS                            ║")
+    print("╚═══════════════════════════════════════════════════╝")
+    
+    try:
+        test_spawn_burst_count()
+        test_spawn_burst_cone_speed()
+        test_spawn_burst_box_bounds()
+        test_update_integrates_and_expires()
+        test_instance_data_layout()
+        
+        print("\n" + "="*60)
+        print("✨ ALL TESTS PASSED! ✨")
+        print("="*60)
+        
+        return 0
+    
+    except AssertionError as e:
+        print(f"\n❌ TEST FAILED: {e}")
+        import traceback
+        traceback.print_exc()
+        return 1
+    except Exception as e:
+        print(f"\n❌ ERROR: {e}")
+        import traceback
+        traceback.print_exc()
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,224 @@
+"""
+Test: Script Systems
+Tests OscillatorSystem and RotateSystem updating many scripts in one pass.
+"""
+
+import sys
+import numpy as np
+from types import SimpleNamespace
+from engine.src.scene import Scene, GameObject, GameScript
+from game.scripts import OscillateScript, OscillatorSystem, RotateScript, RotateSystem
+
+
+def _make_entity(y=0.0):
+    """Create an entity stand-in with a transform at the given height."""
+    transform = SimpleNamespace(
+        position=np.array([0.0, y, 0.0], dtype=np.float32),
+        rotation=np.zeros(3, dtype=np.float32)
+    )
+    
+    def rotate(pitch=0.0, yaw=0.0, roll=0.0):
+        transform.rotation += np.array([pitch, yaw, roll], dtype=np.float32)
+    
+    return SimpleNamespace(name="prop", transform=transform, rotate=rotate)
+
+
+def test_matches_per_script_update():
+    """Test batched oscillation gives the same heights as individual scripts."""
+    print("\n=== TEST 1: Batched Matches Individual ===")
+    
+    system = OscillatorSystem()
+    params = [(1.0, 0.5, 0.0), (2.5, 0.2, 1.0), (0.3, 1.5, -2.0)]
+    
+    batched, single = [], []
+    for speed, amplitude, y in params:
+        script = OscillateScript(_make_entity(y), speed, amplitude, system=system)
+        script.on_start()
+        batched.append(script)
+        
+        script = OscillateScript(_make_entity(y), speed, amplitude)
+        script.on_start()
+        single.append(script)
+    
+    for delta_time in (0.016, 0.033, 0.5, 0.016):
+        system.on_update(delta_time)
+        for script in batched + single:
+            script.on_update(delta_time)
+    
+    batched_y = [s.entity.transform.position[1] for s in batched]
+    single_y = [s.entity.transform.position[1] for s in single]
+    print(f"Batched: {batched_y}")
+    print(f"Single:  {single_y}")
+    assert np.allclose(batched_y, single_y, atol=1e-6)
+    
+    print("✅ Batched oscillation matches per-script updates!")
+
+
+def test_disabled_and_unregistered():
+    """Test disabled oscillators hold still and detaching returns the phase."""
+    print("\n=== TEST 2: Disable and Detach ===")
+    
+    system = OscillatorSystem()
+    script = OscillateScript(_make_entity(0.0), speed=1.0, amplitude=1.0, system=system)
+    script.on_start()
+    
+    system.on_update(0.25)
+    script.enabled = False
+    height = script.entity.transform.position[1]
+    system.on_update(0.25)
+    assert script.entity.transform.position[1] == height
+    
+    script.on_detach()
+    print(f"Time handed back: {script.time}")
+    assert script.time == 0.25
+    assert system._scripts == []
+    
+    print("✅ Disabled and detached oscillators handled!")
+
+
+def test_rotate_system_matches_per_script():
+    """Test batched rotation gives the same angles as individual scripts."""
+    print("\n=== TEST 3: Batched Rotation ===")
+    
+    system = RotateSystem()
+    speeds = [(0, 30, 0), (10, 0, -5), (1, 2, 3)]
+    
+    batched, single = [], []
+    for speed in speeds:
+        script = RotateScript(_make_entity(), speed, system=system)
+        script.on_start()
+        batched.append(script)
+        
+        script = RotateScript(_make_entity(), speed)
+        script.on_start()
+        single.append(script)
+    
+    for delta_time in (0.016, 0.033, 0.5):
+        system.on_update(delta_time)
+        for script in batched + single:
+            script.on_update(delta_time)
+    
+    batched_rot = [s.entity.transform.rotation for s in batched]
+    single_rot = [s.entity.transform.rotation for s in single]
+    print(f"Batched: {batched_rot}")
+    assert np.allclose(batched_rot, single_rot, atol=1e-5)
+    
+    batched[0].on_detach()
+    assert len(system._scripts) == 2
+    assert system._speeds.shape == (2, 3)
+    
+    print("✅ Batched rotation matches per-script updates!")
+
+
+class _RecordingScript(GameScript):
+    """Script that logs its starts and updates into a shared list."""
+    
+    def __init__(self, tag, log):
+        super().__init__()
+        self.tag = tag
+        self.log = log
+        self.input = None
+    
+    def on_start(self):
+        self.log.append(("start", self.tag))
+    
+    def on_update(self, delta_time):
+        self.log.append(("update", self.tag))
+
+
+def test_scene_script_schedule():
+    """Test the flat script schedule keeps order, flags and late additions."""
+    print("\n=== TEST 4: Scene Script Schedule ===")
+    
+    log = []
+    scene = Scene("Schedule")
+    first = GameObject(name="First")
+    second = GameObject(name="Second")
+    scene.add_game_object(first)
+    scene.add_game_object(second)
+    
+    scene.add_script(_RecordingScript("global", log))
+    first.add_script(_RecordingScript("a", log))
+    second.add_script(_RecordingScript("b", log))
+    second.active = False
+    
+    marker = object()
+    scene.set_script_input(marker)
+    scene.update_scripts(0.016)
+    assert log == [("start", "global"), ("start", "a"), ("update", "global"), ("update", "a")], log
+    assert all(script.input is marker for script in scene.scripts + first.scripts + second.scripts)
+    print("✅ Global scripts first, inactive entities skipped, input assigned")
+    
+    # Activating an entity starts its scripts once; late scripts start on add
+    log.clear()
+    second.active = True
+    late = _RecordingScript("late", log)
+    first.add_script(late)
+    scene.update_scripts(0.016)
+    assert log == [
+        ("start", "late"), ("start", "b"),
+        ("update", "global"), ("update", "a"), ("update", "late"), ("update", "b")
+    ], log
+    assert late.input is marker, "Scripts added later receive the input on rebuild"
+    print("✅ Schedule rebuilt after add; each script started once")
+    
+    log.clear()
+    late.enabled = False
+    first.remove_script(first.scripts[0])
+    scene.update_scripts(0.016)
+    assert log == [("update", "global"), ("update", "b")], log
+    print("✅ Disabled and removed scripts no longer update")
+    
+    entities = scene.get_all_entities()
+    assert entities == (first, second) and scene.get_all_entities() is entities
+    scene.remove_game_object(first)
+    assert scene.get_all_entities() == (second,), "Removal should refresh the entity tuple"
+    print("✅ Entity tuple reused until entities change")
+    
+    # A script spawning an object every frame must not cut the pass short
+    log.clear()
+    
+    class _SpawnerScript(GameScript):
+        def on_update(self, delta_time):
+            scene.add_game_object(GameObject(name="Spawned"))
+    
+    scene.add_script(_SpawnerScript())
+    for _ in range(10):
+        scene.update_scripts(0.016)
+    assert log.count(("update", "b")) == 10, log
+    assert log.count(("update", "global")) == 10, log
+    print("✅ Spawning scripts don't stop later scripts from updating")
+
+
+def main():
+    """Run all tests."""
+    print("╔═══════════════════════════════════════════════════╗")
+    print("║  SCRIPT SYSTEM TESTS                              ║")
+    print("╚═══════════════════════════════════════════════════╝")
+    
+    try:
+        test_matches_per_script_update()
+        test_disabled_and_unregistered()
+        test_rotate_system_matches_per_script()
+        test_scene_script_schedule()
+        
+        print("\n" + "="*60)
+        print("✨ ALL TESTS PASSED! ✨")
+        print("="*60)
+        
+        return 0
+    
+    except AssertionError as e:
+        print(f"\n❌ TEST FAILED: {e}")
+        import traceback
+        traceback.print_exc()
+        return 1
+    except Exception as e:
+        print(f"\n❌ ERROR: {e}")
+        import traceback
+        traceback.print_exc()
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,192 @@
+"""
+Test: Settings Slider Writes
+Tests the settings scene writing slider values once per drag.
+"""
+
+import sys
+import tempfile
+from types import SimpleNamespace
+
+
+class _RecordingSettings:
+    """Settings stand-in that records every write."""
+    
+    def __init__(self):
+        self.writes = []
+    
+    def set(self, path, value, save=False):
+        self.writes.append((path, value))
+
+
+def _make_scene():
+    """Create a settings scene wired to a recording settings object."""
+    from game.scenes.settings_menu import SettingsMenuScene
+    
+    settings = _RecordingSettings()
+    scene = SettingsMenuScene()
+    scene.app = SimpleNamespace(settings=settings, audio_manager=None)
+    return scene, settings
+
+
+def test_drag_writes_once_on_release():
+    """Test intermediate slider values are only persisted on mouse release."""
+    print("\n=== TEST 1: Drag Writes Once ===")
+    
+    scene, settings = _make_scene()
+    
+    for value in (0.1, 0.2, 0.3, 0.4):
+        scene._on_volume_change('master_volume', value)
+    
+    print(f"Writes during drag: {settings.writes}")
+    assert settings.writes == []
+    
+    scene.on_mouse_release(0, 0, 0)
+    
+    print(f"Writes after release: {settings.writes}")
+    assert settings.writes == [('audio.master_volume', 0.4)]
+    assert scene._pending_settings == {}
+    
+    print("✅ Slider value persisted once per drag!")
+
+
+def test_shadow_steps_quantized():
+    """Test the shadow slider only records a size when the step changes."""
+    print("\n=== TEST 2: Shadow Steps Quantized ===")
+    
+    scene, settings = _make_scene()
+    
+    sizes = []
+    for value in (0.0, 0.1, 0.2, 0.45, 0.5, 0.8, 0.9, 1.0):
+        scene._on_shadow_quality_change(value)
+        sizes.append(scene._last_shadow_size)
+    
+    print(f"Sizes: {sizes}")
+    assert sizes == [512, 512, 1024, 1024, 2048, 2048, 4096, 4096]
+    
+    scene.on_mouse_release(0, 0, 0)
+    assert settings.writes == [('graphics.shadow_map_size', 4096)]
+    
+    print("✅ Shadow slider quantized to resolution steps!")
+
+
+def test_settings_setter():
+    """Test a bound settings setter writes, fires callbacks and survives resets."""
+    print("\n=== TEST 3: Bound Settings Setter ===")
+    
+    from engine.src.systems.settings_manager import SettingsManager
+    
+    with tempfile.TemporaryDirectory() as config_dir:
+        settings = SettingsManager(config_dir=config_dir, app_name="test_setter")
+        changes = []
+        settings.register_callback('window.vsync', lambda new, old: changes.append(new))
+        
+        set_vsync = settings.get_setter('window.vsync')
+        start = settings.get('window.vsync')
+        set_vsync(not start)
+        set_vsync(not start)
+        
+        print(f"Callback values: {changes}")
+        assert settings.get('window.vsync') == (not start)
+        assert changes == [not start]  # Unchanged value fires nothing
+        
+        settings.reset_to_defaults('window')
+        set_vsync(not settings.get('window.vsync'))
+        assert settings.get('window.vsync') == (not settings.defaults['window']['vsync'])
+    
+    print("✅ Bound setter matches set()!")
+
+
+def test_reset_refreshes_widgets():
+    """Test Reset pushes default values into the existing widgets."""
+    print("\n=== TEST 4: Reset Refreshes Widgets ===")
+    
+    from engine.src.systems.settings_manager import SettingsManager
+    from game.scenes.settings_menu import SettingsMenuScene
+    
+    with tempfile.TemporaryDirectory() as config_dir:
+        settings = SettingsManager(config_dir=config_dir, app_name="test_reset")
+        scene = SettingsMenuScene()
+        scene.app = SimpleNamespace(settings=settings, audio_manager=None, text_renderer=None)
+        scene.initialize_ui(1280, 720)
+        slider = scene._master_vol_slider
+        dropdown = scene._msaa_dropdown
+        
+        settings.set('audio.master_volume', 0.1)
+        settings.set('graphics.msaa_samples', 8)
+        scene._on_reset()
+        
+        default_volume = settings.defaults['audio']['master_volume']
+        print(f"Master volume slider: {slider.value} (default {default_volume})")
+        assert scene._master_vol_slider is slider
+        assert slider.value == default_volume
+        assert dropdown.get_selected_text() == {0: "Off", 2: "2x", 4: "4x", 8: "8x"}[
+            settings.defaults['graphics']['msaa_samples']]
+        assert scene.ui_manager.dirty
+    
+    print("✅ Reset refreshed widgets in place!")
+
+
+def test_modern_scene_flushes_per_frame():
+    """Test the modern scene commits slider drags at most once per frame."""
+    print("\n=== TEST 5: Modern Scene Frame Flush ===")
+    
+    import time
+    from game.scenes.modern_settings_menu import SettingsMenuScene
+    
+    settings = _RecordingSettings()
+    scene = SettingsMenuScene()
+    scene.app = SimpleNamespace(settings=settings)
+    
+    scene._last_flush_t = time.monotonic()
+    for value in (0.1, 0.2, 0.3):
+        scene._on_volume_change('master_volume', value)
+    scene.update(0.001)
+    print(f"Writes within one frame: {settings.writes}")
+    assert settings.writes == []
+    
+    scene._last_flush_t -= 1.0
+    scene.update(0.016)
+    print(f"Writes after the frame interval: {settings.writes}")
+    assert settings.writes == [('audio.master_volume', 0.3)]
+    assert scene._pending_settings == {}
+    
+    scene._on_volume_change('music_volume', 0.5)
+    scene.on_mouse_release(0, 0, 0)
+    assert settings.writes[-1] == ('audio.music_volume', 0.5)
+    
+    print("✅ Slider drags coalesced to frame rate!")
+
+
+def main():
+    """Run all tests."""
+    print("╔═══════════════════════════════════════════════════╗")
+    print("║  SETTINGS SLIDER WRITE TESTS                      ║")
+    print("╚═══════════════════════════════════════════════════╝")
+    
+    try:
+        test_drag_writes_once_on_release()
+        test_shadow_steps_quantized()
+        test_settings_setter()
+        test_reset_refreshes_widgets()
+        test_modern_scene_flushes_per_frame()
+        
+        print("\n" + "="*60)
+        print("✨ ALL TESTS PASSED! ✨")
+        print("="*60)
+        
+        return 0
+    
+    except AssertionError as e:
+        print(f"\n❌ TEST FAILED: {e}")
+        import traceback
+        traceback.print_exc()
+        return 1
+    except Exception as e:
+        print(f"\n❌ ERROR: {e}")
+        import traceback
+        traceback.print_exc()
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,94 @@
+"""
+Test: Shared Quads
+Tests that textured quads share one mesh geometry and that instancing
+batches them by geometry, texture and material.
+"""
+
+import sys
+from types import SimpleNamespace
+from engine.src.graphics.model import Model
+from engine.src.rendering.instanced_renderer import InstancedRenderer
+
+
+def test_quads_share_geometry():
+    """Test every textured quad reuses the same vertex data."""
+    print("\n=== TEST 1: Shared Geometry ===")
+    
+    wood = SimpleNamespace(name="wood")
+    first = Model.create_textured_quad("A", texture=wood).meshes[0]
+    second = Model.create_textured_quad("B").meshes[0]
+    
+    assert first is not second, "Each quad should get its own mesh"
+    assert first.vertex_data is second.vertex_data, "Quads should share vertex data"
+    assert first.geometry_key == second.geometry_key
+    assert first.texture is wood and second.texture is None, "Textures stay per quad"
+    print("  ✅ Quads share geometry but keep their own texture")
+    
+    second.texture = wood
+    assert Model._textured_quad_template.texture is None, "Assigning a texture must not touch the template"
+    cube = Model.create_textured_cube("Cube").meshes[0]
+    assert cube.geometry_key != first.geometry_key
+    print("  ✅ Template untouched; other meshes keep their own geometry")
+
+
+def test_batches_by_geometry_and_texture():
+    """Test quads batch together per texture and material."""
+    print("\n=== TEST 2: Instance Batches ===")
+    
+    wood = SimpleNamespace(name="wood")
+    stone = SimpleNamespace(name="stone")
+    textures = [wood, wood, wood, stone, stone]
+    plain = SimpleNamespace(name="plain")
+    objects = [
+        SimpleNamespace(active=True, material=plain,
+                        model=Model.create_textured_quad(f"Quad{i}", texture=texture))
+        for i, texture in enumerate(textures)
+    ]
+    objects.append(SimpleNamespace(active=True, material=plain, model=Model.create_textured_cube("Cube")))
+    
+    renderer = InstancedRenderer()
+    renderer.prepare_batches(objects)
+    
+    sizes = sorted(len(batch.instances) for batch in renderer.get_batches().values())
+    assert sizes == [1, 2, 3], f"Expected wood/stone/cube batches, got {sizes}"
+    print("  ✅ 5 quads + 1 cube -> 3 batches (one per geometry and texture)")
+    
+    # Same texture, different material (e.g. its own normal map)
+    objects[0].material = SimpleNamespace(name="bumpy")
+    renderer.prepare_batches(objects)
+    
+    sizes = sorted(len(batch.instances) for batch in renderer.get_batches().values())
+    assert sizes == [1, 1, 2, 2], f"Material should split the wood batch, got {sizes}"
+    print("  ✅ Quads with different materials are drawn in separate batches")
+
+
+def main():
+    """Run all tests."""
+    print("╔═══════════════════════════════════════════════════╗")
+    print("║  SHARED QUAD TESTS                                ║")
+    print("╚═══════════════════════════════════════════════════╝")
+    
+    try:
+        test_quads_share_geometry()
+        test_batches_by_geometry_and_texture()
+        
+        print("\n" + "="*60)
+        print("✨ ALL TESTS PASSED! ✨")
+        print("="*60)
+        
+        return 0
+    
+    except AssertionError as e:
+        print(f"\n❌ TEST FAILED: {e}")
+        import traceback
+        traceback.print_exc()
+        return 1
+    except Exception as e:
+        print(f"\n❌ ERROR: {e}")
+        import traceback
+        traceback.print_exc()
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,135 @@
+"""
+Test: Text Batching
+Tests TextRenderer queuing glyph quads between begin_batch() and end_batch().
+"""
+
+import sys
+from engine.src.ui import TextRenderer, Font, Glyph
+
+
+def _make_renderer():
+    """Create a TextRenderer that queues text without a GL context."""
+    renderer = TextRenderer()
+    renderer.initialized = True
+    renderer.shader_program = 1
+    flushed = []
+    renderer._flush_batch = lambda: (
+        flushed.append(list(renderer._batch_keys)),
+        renderer._batch_quads.clear(),
+        renderer._batch_keys.clear()
+    )
+    return renderer, flushed
+
+
+def _make_font():
+    """Create a font with two glyphs and a space."""
+    font = Font("test.ttf", 24)
+    font.add_glyph("A", Glyph(texture_id=1, width=10, height=12, bearing_x=1, bearing_y=12, advance=11 << 6))
+    font.add_glyph("B", Glyph(texture_id=2, width=9, height=12, bearing_x=1, bearing_y=12, advance=10 << 6))
+    font.add_glyph(" ", Glyph(texture_id=0, width=0, height=0, bearing_x=0, bearing_y=0, advance=5 << 6))
+    return font
+
+
+def test_batch_defers_until_end():
+    """Test text inside a batch is only drawn by the outermost end_batch()."""
+    print("\n=== TEST 1: Batch Defers Drawing ===")
+    
+    renderer, flushed = _make_renderer()
+    font = _make_font()
+    
+    renderer.begin_batch()
+    renderer.render_text(font, "A B", 100, 50, color=(1.0, 0.0, 0.0))
+    renderer.begin_batch()
+    renderer.render_text(font, "AA", 100, 80)
+    renderer.end_batch()
+    
+    print(f"Flushes before outer end_batch: {len(flushed)}")
+    assert flushed == []
+    
+    renderer.end_batch()
+    
+    print(f"Glyphs in flushed batch: {len(flushed[0])}")
+    assert len(flushed) == 1
+    assert len(flushed[0]) == 4  # Space has no quad
+    
+    print("✅ Batched text drawn once!")
+
+
+def test_glyph_layout():
+    """Test queued quads use baseline alignment and glyph advances."""
+    print("\n=== TEST 2: Glyph Layout ===")
+    
+    renderer, flushed = _make_renderer()
+    font = _make_font()
+    
+    renderer.begin_batch()
+    renderer.render_text(font, "A B", 100, 50)
+    quads = list(renderer._batch_quads)
+    renderer.end_batch()
+    
+    print(f"Quads: {quads}")
+    
+    # A at 100 + bearing 1; B after A (11) and space (5) advances
+    assert quads[0] == (101, 38, 10, 12)
+    assert quads[1] == (117, 38, 9, 12)
+    
+    print("✅ Glyph quads laid out correctly!")
+
+
+def test_cached_layout_and_runs():
+    """Test unchanged text reuses its layout and batches into one draw per glyph and color."""
+    print("\n=== TEST 3: Cached Layout and Draw Runs ===")
+    
+    renderer, flushed = _make_renderer()
+    font = _make_font()
+    
+    renderer.render_text(font, "ABA", 100, 50)
+    layout = renderer._layout_cache[(font, "ABA", 100, 50, 1.0)]
+    renderer.render_text(font, "ABA", 100, 50, color=(0.0, 1.0, 0.0))
+    assert renderer._layout_cache[(font, "ABA", 100, 50, 1.0)] is layout
+    assert len(renderer._layout_cache) == 1, "Same text should reuse its layout"
+    assert flushed[1] == [((0.0, 1.0, 0.0), 1), ((0.0, 1.0, 0.0), 2), ((0.0, 1.0, 0.0), 1)]
+    print("  ✅ Layout reused across frames and colors")
+    
+    red, white = (1.0, 0.0, 0.0), (1.0, 1.0, 1.0)
+    quads = [(0, 0, 10, 12), (20, 0, 9, 12), (40, 0, 10, 12), (0, 30, 10, 12)]
+    keys = [(white, 1), (white, 2), (white, 1), (red, 1)]
+    vertices, runs = TextRenderer._build_batch(quads, keys)
+    
+    assert vertices.shape == (4, 6, 4)
+    assert runs == [(red, 1, 0, 6), (white, 1, 6, 12), (white, 2, 18, 6)], runs
+    assert vertices[1, :, 0].min() == 0 and vertices[2, :, 0].min() == 40, "Quads grouped by glyph and color"
+    print("  ✅ 4 glyphs -> 3 draw runs over one vertex buffer")
+
+
+def main():
+    """Run all tests."""
+    print("╔═══════════════════════════════════════════════════╗")
+    print("║  TEXT BATCHING TESTS                              ║")
+    print("╚═══════════════════════════════════════════════════╝")
+    
+    try:
+        test_batch_defers_until_end()
+        test_glyph_layout()
+        test_cached_layout_and_runs()
+        
+        print("\n" + "="*60)
+        print("✨ ALL TESTS PASSED! ✨")
+        print("="*60)
+        
+        return 0
+    
+    except AssertionError as e:
+        print(f"\n❌ TEST FAILED: {e}")
+        import traceback
+        traceback.print_exc()
+        return 1
+    except Exception as e:
+        print(f"\n❌ ERROR: {e}")
+        import traceback
+        traceback.print_exc()
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
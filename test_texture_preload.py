@@ -0,0 +1,242 @@
+"""
+Test: Texture Preload
+Tests decoding deferred textures on worker threads ahead of the GL upload,
+and LazyTexture's load-on-first-use, memory budget and per-frame upload
+budget.
+"""
+
+import os
+import sys
+import tempfile
+import time
+import numpy as np
+from types import SimpleNamespace
+from PIL import Image
+from engine.src.core.app import Application
+from engine.src.scene.gameobject import GameObject
+from engine.src.graphics import texture as texture_module
+from engine.src.graphics.texture import Texture, LazyTexture
+from engine.src.systems.threading_manager import ThreadingManager
+
+
+def _write_png(path, mode):
+    """Write a 2x3 image whose top row is red."""
+    channels = len(mode)
+    pixels = np.zeros((3, 2, channels), dtype=np.uint8)
+    pixels[0, :, 0] = 255
+    if channels == 4:
+        pixels[..., 3] = 128
+    Image.fromarray(pixels, mode).save(path)
+
+
+def test_decode():
+    """Test decode returns flipped pixel data without touching OpenGL."""
+    print("\n=== TEST 1: Decode ===")
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        rgb_path = os.path.join(tmp, "rgb.png")
+        rgba_path = os.path.join(tmp, "rgba.png")
+        _write_png(rgb_path, "RGB")
+        _write_png(rgba_path, "RGBA")
+        
+        pixels, width, height, channels = Texture.decode(rgb_path)
+        assert (width, height, channels) == (2, 3, 3), f"Unexpected size {width}x{height}x{channels}"
+        assert pixels.shape == (3, 2, 3) and pixels.dtype == np.uint8
+        assert pixels[-1, 0, 0] == 255 and pixels[0, 0, 0] == 0, "Rows should be flipped for OpenGL"
+        print("  ✅ RGB image decoded and flipped")
+        
+        pixels, _, _, channels = Texture.decode(rgba_path)
+        assert channels == 4 and pixels[0, 0, 3] == 128, "Alpha should be kept"
+        print("  ✅ RGBA image keeps its alpha channel")
+        
+        pixels, _, _, channels = Texture.decode(rgba_path, channels=2)
+        assert channels == 2 and pixels.shape == (3, 2, 2), "Normal maps should keep only RG"
+        assert pixels.flags['C_CONTIGUOUS'], "Sliced pixels must be contiguous for upload"
+        print("  ✅ channels=2 keeps RG for normal maps")
+        
+        gray_path = os.path.join(tmp, "gray.png")
+        Image.fromarray(np.full((3, 2), 77, dtype=np.uint8), "L").save(gray_path)
+        pixels, _, _, channels = Texture.decode(gray_path)
+        assert channels == 1 and pixels.shape == (3, 2, 1) and pixels[0, 0, 0] == 77
+        print("  ✅ Grayscale image decodes to one channel")
+        
+        wide_path = os.path.join(tmp, "wide.png")
+        Image.fromarray(np.full((3, 2), 0x8000, dtype=np.uint16)).save(wide_path)
+        assert Image.open(wide_path).mode.startswith("I")
+        pixels, _, _, channels = Texture.decode(wide_path)
+        assert channels == 1 and pixels[0, 0, 0] == 0x80, f"16-bit gray should scale to 8 bits, got {pixels[0, 0, 0]}"
+        print("  ✅ 16-bit grayscale scales to 8 bits instead of clipping")
+        
+        assert Texture.decode(os.path.join(tmp, "missing.png")) is None
+        print("  ✅ Missing file returns None")
+
+
+def test_preload_textures():
+    """Test preload_textures queues one background decode per deferred path."""
+    print("\n=== TEST 2: Background Preload ===")
+    
+    manager = ThreadingManager(num_workers=2)
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            diffuse = os.path.join(tmp, "diffuse.png")
+            normal = os.path.join(tmp, "normal.png")
+            _write_png(diffuse, "RGB")
+            _write_png(normal, "RGBA")
+            
+            obj = GameObject(name="Quad")
+            obj._texture_path = diffuse
+            obj._normal_map_path = normal
+            plain = GameObject(name="Plain")
+            scene = SimpleNamespace(game_objects=[obj, plain])
+            app = SimpleNamespace(threading_manager=manager)
+            
+            Application.preload_textures(app, scene)
+            
+            assert set(obj._pending_textures) == {'_texture_path', '_normal_map_path'}
+            assert plain._pending_textures is None, "Objects without paths get no futures"
+            
+            for attr, future in obj._pending_textures.items():
+                _, width, height, _ = future.result(timeout=5)
+                assert (width, height) == (2, 3), f"{attr} decoded to {width}x{height}"
+            print("  ✅ Each deferred path decoded on a worker thread")
+            
+            assert obj._pending_textures['_normal_map_path'].result()[3] == 2, "Normal map should decode to RG"
+            print("  ✅ Normal map decoded to two channels")
+    finally:
+        manager.shutdown()
+
+
+class _FakeUploadTexture(LazyTexture):
+    """LazyTexture that records uploads instead of calling OpenGL."""
+    
+    next_id = 1
+    
+    def upload(self, image):
+        _, self.width, self.height, self.channels = image
+        self.texture_id = _FakeUploadTexture.next_id
+        _FakeUploadTexture.next_id += 1
+        return True
+
+
+def test_lazy_texture_budget():
+    """Test lazy textures load on first use and evict least recently bound."""
+    print("\n=== TEST 3: Lazy Load and Budget ===")
+    
+    deleted = []
+    original_delete = texture_module.glDeleteTextures
+    original_budget = LazyTexture.budget_bytes
+    texture_module.glDeleteTextures = lambda count, ids: deleted.extend(ids)
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            paths = []
+            for name in ("a", "b", "c"):
+                path = os.path.join(tmp, f"{name}.png")
+                _write_png(path, "RGB")
+                paths.append(path)
+            
+            # Each 2x3 RGB texture is 24 bytes with mips; room for two
+            LazyTexture.budget_bytes = 50
+            a, b, c = (_FakeUploadTexture(path) for path in paths)
+            
+            assert a._texture_id is None, "Nothing should load before first use"
+            assert a.texture_id == 1 and b.texture_id == 2, "Reading texture_id should load"
+            print("  ✅ Textures load on first use")
+            
+            a.ensure_loaded()  # a is now the most recently bound
+            assert c.texture_id == 3
+            assert deleted == [2] and b._texture_id is None, f"b should be evicted, deleted={deleted}"
+            assert a._texture_id == 1 and LazyTexture._resident_bytes == 48
+            print("  ✅ Least recently used texture evicted over budget")
+            
+            assert b.texture_id == 4 and deleted == [2, 1], "Evicted texture reloads on next use"
+            print("  ✅ Evicted texture reloads when needed again")
+            
+            missing = _FakeUploadTexture(os.path.join(tmp, "missing.png"))
+            assert missing.texture_id is None and missing._failed
+            print("  ✅ Missing file leaves texture unbound")
+            
+            for texture in (a, b, c):
+                texture.cleanup()
+            assert not LazyTexture._resident and LazyTexture._resident_bytes == 0
+    finally:
+        texture_module.glDeleteTextures = original_delete
+        LazyTexture.budget_bytes = original_budget
+
+
+class _SlowUploadTexture(_FakeUploadTexture):
+    """Fake texture whose upload takes a few milliseconds."""
+    
+    def upload(self, image):
+        time.sleep(0.003)
+        return super().upload(image)
+
+
+def test_upload_budget():
+    """Test loads beyond the frame's upload budget wait for the next frame."""
+    print("\n=== TEST 4: Per-Frame Upload Budget ===")
+    
+    original_delete = texture_module.glDeleteTextures
+    original_budget = LazyTexture.upload_budget
+    texture_module.glDeleteTextures = lambda count, ids: None
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            textures = []
+            for name in ("a", "b", "c"):
+                path = os.path.join(tmp, f"{name}.png")
+                _write_png(path, "RGB")
+                textures.append(_SlowUploadTexture(path))
+            a, b, c = textures
+            
+            LazyTexture.upload_budget = 0.001
+            LazyTexture.begin_frame()
+            assert a.texture_id is not None, "First load of a frame always goes through"
+            assert b.texture_id is None and c.texture_id is None, "Spent budget should defer loads"
+            assert not b._failed, "Deferred texture is not a failure"
+            print("  ✅ Budget spent after one slow upload; others wait")
+            
+            LazyTexture.begin_frame()
+            assert b.texture_id is not None and c.texture_id is None
+            LazyTexture.begin_frame()
+            assert c.texture_id is not None
+            print("  ✅ Deferred textures load on following frames")
+            
+            for texture in textures:
+                texture.cleanup()
+    finally:
+        texture_module.glDeleteTextures = original_delete
+        LazyTexture.upload_budget = original_budget
+        LazyTexture._frame_budget_active = False
+
+
+def main():
+    """Run all tests."""
+    print("╔═══════════════════════════════════════════════════╗")
+    print("║  TEXTURE PRELOAD TESTS                            ║")
+    print("╚═══════════════════════════════════════════════════╝")
+    
+    try:
+        test_decode()
+        test_preload_textures()
+        test_lazy_texture_budget()
+        test_upload_budget()
+        
+        print("\n" + "="*60)
+        print("✨ ALL TESTS PASSED! ✨")
+        print("="*60)
+        
+        return 0
+    
+    except AssertionError as e:
+        print(f"\n❌ TEST FAILED: {e}")
+        import traceback
+        traceback.print_exc()
+        return 1
+    except Exception as e:
+        print(f"\n❌ ERROR: {e}")
+        import traceback
+        traceback.print_exc()
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,150 @@
+"""
+Test: UI Hit Testing
+Tests packed root-element hit testing in UIManager mouse-move routing.
+"""
+
+import sys
+import numpy as np
+from engine.src.ui import UIManager, UIPanel, UIButton
+from engine.src.ui.ui_manager import _hit_test
+
+
+def test_hit_test_topmost():
+    """Test the packed hit test returns the last (topmost) containing rect."""
+    print("\n=== TEST 1: Topmost Hit ===")
+    
+    rects = np.array([
+        [0, 0, 100, 100],
+        [50, 50, 150, 150],
+    ], dtype=np.float32)
+    
+    print(f"(75, 75) -> {_hit_test(rects, 75, 75)}, expected 1")
+    print(f"(10, 10) -> {_hit_test(rects, 10, 10)}, expected 0")
+    print(f"(500, 500) -> {_hit_test(rects, 500, 500)}, expected -1")
+    
+    assert _hit_test(rects, 75, 75) == 1
+    assert _hit_test(rects, 10, 10) == 0
+    assert _hit_test(rects, 500, 500) == -1
+    assert _hit_test(np.zeros((0, 4), dtype=np.float32), 0, 0) == -1
+    
+    print("✅ Hit test picks the topmost element!")
+
+
+def test_mouse_move_hover_enter_and_exit():
+    """Test hover still enters and exits when misses skip dispatch."""
+    print("\n=== TEST 2: Hover Enter/Exit ===")
+    
+    manager = UIManager(800, 600)
+    panel = UIPanel(x=100, y=100, width=200, height=200)
+    button = UIButton(x=10, y=10, width=50, height=30, text="OK")
+    panel.add_child(button)
+    manager.add_element(panel)
+    
+    bx, by = button.get_absolute_position()
+    manager.on_mouse_move(bx + 5, by + 5)
+    assert button.is_hovered
+    
+    manager.on_mouse_move(700, 500)   # Leaves everything - must clear hover
+    print(f"Hovered after leaving: {button.is_hovered}")
+    assert not button.is_hovered
+    assert not manager._pointer_active
+    
+    # Moving the panel invalidates the packed bounds
+    panel.x = panel.compiled_x = 600
+    manager.invalidate_layout()
+    manager.on_mouse_move(650, 150)
+    assert panel.is_hovered
+    
+    print("✅ Hover state tracks the cursor!")
+
+
+def test_dirty_only_on_visible_changes():
+    """Test idle mouse moves over empty space leave the UI clean."""
+    print("\n=== TEST 3: Dirty Flag ===")
+    
+    manager = UIManager(800, 600)
+    panel = UIPanel(x=100, y=100, width=200, height=200)
+    manager.add_element(panel)
+    assert manager.dirty
+    
+    manager.dirty = False
+    manager.on_mouse_move(700, 500)
+    print(f"Dirty after move over empty space: {manager.dirty}")
+    assert not manager.dirty
+    
+    manager.on_mouse_move(150, 150)
+    assert manager.dirty
+    
+    manager.dirty = False
+    manager.set_window_size(1024, 768)
+    assert manager.dirty
+    
+    manager.dirty = False
+    manager.on_mouse_click(700, 500, 0)
+    assert manager.dirty
+    
+    print("✅ UI marked dirty only when it may change!")
+
+
+def test_update_dirty_only_when_animating():
+    """Test update() runs element updates but only dirties on visible changes."""
+    print("\n=== TEST 4: Animated Update ===")
+    
+    class _Pulse(UIPanel):
+        def __init__(self):
+            super().__init__(x=0, y=0, width=10, height=10)
+            self.frames = 0
+        
+        def update(self, delta_time):
+            self.frames += 1
+            return self.frames == 2
+    
+    manager = UIManager(800, 600)
+    panel = UIPanel(x=100, y=100, width=200, height=200)
+    pulse = _Pulse()
+    panel.add_child(pulse)
+    manager.add_element(panel)
+    
+    manager.dirty = False
+    manager.update(0.016)
+    assert pulse.frames == 1, "Nested elements should be updated"
+    assert not manager.dirty, "Unchanged frame should keep the cached UI"
+    
+    manager.update(0.016)
+    assert manager.dirty, "A visible change should mark the UI dirty"
+    
+    print("✅ Animated elements update and redraw only when they change!")
+
+
+def main():
+    """Run all tests."""
+    print("╔═══════════════════════════════════════════════════╗")
+    print("║  UI HIT TEST TESTS                                ║")
+    print("╚═══════════════════════════════════════════════════╝")
+    
+    try:
+        test_hit_test_topmost()
+        test_mouse_move_hover_enter_and_exit()
+        test_dirty_only_on_visible_changes()
+        test_update_dirty_only_when_animating()
+        
+        print("\n" + "="*60)
+        print("✨ ALL TESTS PASSED! ✨")
+        print("="*60)
+        
+        return 0
+    
+    except AssertionError as e:
+        print(f"\n❌ TEST FAILED: {e}")
+        import traceback
+        traceback.print_exc()
+        return 1
+    except Exception as e:
+        print(f"\n❌ ERROR: {e}")
+        import traceback
+        traceback.print_exc()
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,132 @@
+"""
+Test: UI Rect Batching
+Tests UIRenderer queuing rectangles for a single instanced draw.
+"""
+
+import sys
+import numpy as np
+from engine.src.ui import UIRenderer
+from engine.src.ui.ui_renderer import unit_circle_fan
+
+
+def _make_renderer():
+    """Create a UIRenderer that queues rects without a GL context."""
+    renderer = UIRenderer()
+    renderer.initialized = True
+    renderer.shader_program = 1
+    renderer.vao = 1
+    flushed = []
+    renderer.flush = lambda: (
+        flushed.append(list(renderer._batch_rects)),
+        renderer._batch_rects.clear()
+    )
+    return renderer, flushed
+
+
+def test_rects_queued_until_end_batch():
+    """Test rects drawn inside a batch become one instance list."""
+    print("\n=== TEST 1: Rects Queued ===")
+    
+    renderer, flushed = _make_renderer()
+    
+    renderer.begin_batch()
+    renderer.draw_rect(10, 20, 100, 50, (0.1, 0.2, 0.3, 1.0))
+    renderer.draw_border_rect(0, 0, 40, 40, 2.0, (1.0, 1.0, 1.0, 1.0))
+    
+    print(f"Queued rects: {len(renderer._batch_rects)}")
+    assert flushed == []
+    assert renderer._batch_rects[0] == (10, 20, 100, 50, 0.1, 0.2, 0.3, 1.0, 0.0)
+    
+    renderer.end_batch()
+    
+    print(f"Instances in flushed batch: {len(flushed[0])}")
+    assert len(flushed) == 1
+    assert len(flushed[0]) == 5  # Rect + 4 border edges
+    
+    print("✅ Rects drawn as one batch!")
+
+
+def test_unbalanced_end_batch_ignored():
+    """Test end_batch without begin_batch does nothing."""
+    print("\n=== TEST 2: Unbalanced end_batch ===")
+    
+    renderer, flushed = _make_renderer()
+    renderer.end_batch()
+    
+    assert flushed == []
+    assert renderer._batch_depth == 0
+    
+    print("✅ Unbalanced end_batch ignored!")
+
+
+def test_unit_circle_fan():
+    """Test the baked circle fan is a closed unit ring around the center."""
+    print("\n=== TEST 3: Unit Circle Fan ===")
+    
+    fan = unit_circle_fan(32)
+    
+    print(f"Fan vertices: {len(fan)}")
+    assert fan.shape == (34, 2)
+    assert fan.dtype == np.float32
+    assert tuple(fan[0]) == (0.0, 0.0)
+    assert np.allclose(np.hypot(fan[1:, 0], fan[1:, 1]), 1.0)
+    assert np.allclose(fan[1], fan[-1], atol=1e-6)  # Rim is closed
+    
+    print("✅ Circle fan baked correctly!")
+
+
+def test_circles_join_rect_batch():
+    """Test circles drawn inside a batch queue in order with the rects."""
+    print("\n=== TEST 4: Circles Batched ===")
+    
+    renderer, flushed = _make_renderer()
+    
+    renderer.begin_batch()
+    renderer.draw_rect(0, 0, 200, 10, (0.2, 0.2, 0.2, 1.0))
+    renderer.draw_circle(50, 5, 8, (1.0, 1.0, 1.0, 1.0))
+    renderer.draw_rect(0, 40, 200, 10, (0.2, 0.2, 0.2, 1.0))
+    
+    assert flushed == []
+    assert renderer._batch_rects[1] == (42, -3, 16.0, 16.0, 1.0, 1.0, 1.0, 1.0, 1.0)
+    
+    renderer.end_batch()
+    
+    print(f"Instances in flushed batch: {len(flushed[0])}")
+    assert len(flushed) == 1
+    assert [inst[-1] for inst in flushed[0]] == [0.0, 1.0, 0.0]
+    
+    print("✅ Circles kept in the rect batch!")
+
+
+def main():
+    """Run all tests."""
+    print("╔═══════════════════════════════════════════════════╗")
+    print("║  UI RECT BATCHING TESTS                           ║")
+    print("╚═══════════════════════════════════════════════════╝")
+    
+    try:
+        test_rects_queued_until_end_batch()
+        test_unbalanced_end_batch_ignored()
+        test_unit_circle_fan()
+        test_circles_join_rect_batch()
+        
+        print("\n" + "="*60)
+        print("✨ ALL TESTS PASSED! ✨")
+        print("="*60)
+        
+        return 0
+    
+    except AssertionError as e:
+        print(f"\n❌ TEST FAILED: {e}")
+        import traceback
+        traceback.print_exc()
+        return 1
+    except Exception as e:
+        print(f"\n❌ ERROR: {e}")
+        import traceback
+        traceback.print_exc()
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,243 @@
+"""
+Test: UI Render Order
+Tests dropdown open/close notifications and cached layer-sorted draw lists.
+"""
+
+import sys
+from engine.src.ui import UIDropdown
+
+
+def test_dropdown_open_change_fires_on_transition():
+    """Test on_open_change fires only when the open state changes."""
+    print("\n=== TEST 1: Dropdown Open/Close Notification ===")
+    
+    events = []
+    dropdown = UIDropdown(
+        x=0, y=0, width=150, height=30,
+        options=["Off", "2x", "4x"],
+        on_open_change=lambda d, is_open: events.append(is_open)
+    )
+    
+    dropdown.set_open(True)
+    dropdown.set_open(True)   # No transition - no event
+    dropdown.set_open(False)
+    
+    print(f"Events: {events}")
+    print(f"Expected: [True, False]")
+    
+    assert events == [True, False]
+    assert dropdown.layer == 200
+    
+    print("✅ Dropdown notifies only on transitions!")
+
+
+def test_dropdown_click_outside_restores_layer():
+    """Test closing via click-outside returns dropdown to its normal layer."""
+    print("\n=== TEST 2: Click Outside Closes Dropdown ===")
+    
+    dropdown = UIDropdown(x=0, y=0, width=150, height=30, options=["A", "B"])
+    dropdown.handle_mouse_click(10, 10, 0)
+    assert dropdown.is_open and dropdown.layer == 300
+    
+    dropdown.handle_mouse_click(1000, 1000, 0)
+    
+    print(f"is_open: {dropdown.is_open}, layer: {dropdown.layer}")
+    print(f"Expected: False, 200")
+    
+    assert not dropdown.is_open
+    assert dropdown.layer == 200
+    
+    print("✅ Closing dropdown restores layer!")
+
+
+def test_scene_draw_list_cached():
+    """Test settings scene defers open dropdowns instead of re-sorting its draw list."""
+    print("\n=== TEST 3: Cached Draw List ===")
+    
+    from game.scenes.modern_settings_menu import SettingsMenuScene
+    
+    scene = SettingsMenuScene()
+    scene.initialize_ui(1280, 720)
+    scene._rebuild_draw_list()
+    
+    layers = [e.layer for e in scene._draw_list]
+    print(f"Draw list size: {len(layers)}")
+    assert layers == sorted(layers)
+    assert not scene._draw_list_dirty
+    
+    dropdown = next(e for e in scene._draw_list if isinstance(e, UIDropdown))
+    dropdown.set_open(True)
+    
+    print(f"Deferred after open: {len(scene._deferred_render)}")
+    assert scene._deferred_render == [dropdown]
+    assert not scene._draw_list_dirty
+    
+    dropdown.set_open(False)
+    assert scene._deferred_render == []
+    
+    print("✅ Open dropdowns deferred without re-sorting the draw list!")
+
+
+def test_scene_resize_reuses_widgets():
+    """Test resizing the settings scene re-lays out widgets instead of rebuilding them."""
+    print("\n=== TEST 4: Resize Reuses Widgets ===")
+    
+    from game.scenes.modern_settings_menu import SettingsMenuScene
+    
+    scene = SettingsMenuScene()
+    scene.initialize_ui(1280, 720)
+    panel = scene.main_panel
+    slider = scene.shadow_slider
+    
+    scene.on_resize(1920, 1080)
+    
+    print(f"Panel position: ({panel.compiled_x}, {panel.compiled_y})")
+    print(f"Expected: (660.0, 290.0)")
+    
+    assert scene.main_panel is panel
+    assert scene.shadow_slider is slider
+    assert scene.ui_manager.elements == [panel]
+    assert (panel.compiled_x, panel.compiled_y) == (660.0, 290.0)
+    
+    print("✅ Resize only moves existing widgets!")
+
+
+def test_scene_culls_offscreen_widgets():
+    """Test widgets entirely outside the window are left out of the draw list."""
+    print("\n=== TEST 5: Offscreen Culling ===")
+    
+    from game.scenes.modern_settings_menu import SettingsMenuScene
+    
+    scene = SettingsMenuScene()
+    scene.initialize_ui(1280, 720)
+    scene._rebuild_draw_list()
+    full_count = len(scene._draw_list)
+    
+    # Window shorter than the panel - bottom rows fall offscreen
+    scene.on_resize(1280, 200)
+    assert scene._draw_list_dirty
+    scene._rebuild_draw_list()
+    
+    print(f"Draw list: {full_count} -> {len(scene._draw_list)}")
+    
+    assert len(scene._draw_list) < full_count
+    assert scene.main_panel in scene._draw_list
+    for element in scene._draw_list:
+        assert element.cached_bbox[1] <= 200 and element.cached_bbox[3] >= 0
+    
+    print("✅ Offscreen widgets skipped!")
+
+
+def test_responsive_scene_resize_keeps_tree():
+    """Test the CSS-unit settings scene rescales on resize without rebuilding widgets."""
+    print("\n=== TEST 6: Responsive Scene Resize ===")
+    
+    from game.scenes.settings_menu import SettingsMenuScene
+    
+    scene = SettingsMenuScene()
+    scene.initialize_ui(1280, 720)
+    panel = scene._main_panel
+    button_style = scene.theme.button
+    
+    scene.on_resize(640, 360)
+    
+    print(f"Scale factor: {scene._ui_scale_factor}")
+    print(f"Button padding: {button_style.padding}")
+    
+    assert scene.ui_manager.elements == [panel]
+    assert scene.theme.button is button_style
+    assert scene._ui_scale_factor == 0.5
+    assert button_style.padding == 7.5
+    assert scene._vsync_checkbox.height == 10.0
+    
+    print("✅ Resize rescales the existing widget tree!")
+
+
+def test_responsive_scene_draw_order_cached():
+    """Test the CSS-unit settings scene keeps its sorted draw order between frames."""
+    print("\n=== TEST 7: Responsive Scene Draw Order ===")
+    
+    from game.scenes.settings_menu import SettingsMenuScene
+    
+    scene = SettingsMenuScene()
+    scene.initialize_ui(1280, 720)
+    scene._rebuild_draw_order()
+    
+    assert not scene._draw_order_dirty
+    assert scene._draw_order[0] is scene._main_panel
+    
+    scene._msaa_dropdown.set_open(True)
+    assert scene._draw_order_dirty
+    
+    scene._rebuild_draw_order()
+    print(f"Last element layer: {scene._draw_order[-1].layer}")
+    assert scene._draw_order[-1] is scene._msaa_dropdown
+    
+    print("✅ Draw order cached and re-sorted on dropdown toggle!")
+
+
+def test_responsive_scene_prunes_hidden_subtrees():
+    """Test hidden elements and their children are left out of the draw order."""
+    print("\n=== TEST 8: Hidden Subtrees Pruned ===")
+    
+    from engine.src.ui import UIElement
+    from game.scenes.settings_menu import SettingsMenuScene
+    
+    scene = SettingsMenuScene()
+    scene.initialize_ui(1280, 720)
+    scene._rebuild_draw_order()
+    full_count = len(scene._draw_order)
+    version = UIElement.visibility_version
+    
+    scene._main_panel.hide()
+    assert UIElement.visibility_version != version
+    
+    scene._rebuild_draw_order()
+    print(f"Elements drawn: {full_count} -> {len(scene._draw_order)}")
+    assert scene._draw_order == []
+    
+    scene._main_panel.show()
+    scene._vsync_checkbox.hide()
+    scene._rebuild_draw_order()
+    assert len(scene._draw_order) == full_count - 1
+    assert scene._vsync_checkbox not in scene._draw_order
+    
+    print("✅ Hidden subtrees skipped at collect time!")
+
+
+def main():
+    """Run all tests."""
+    print("╔═══════════════════════════════════════════════════╗")
+    print("║  UI RENDER ORDER TESTS                            ║")
+    print("╚═══════════════════════════════════════════════════╝")
+    
+    try:
+        test_dropdown_open_change_fires_on_transition()
+        test_dropdown_click_outside_restores_layer()
+        test_scene_draw_list_cached()
+        test_scene_resize_reuses_widgets()
+        test_scene_culls_offscreen_widgets()
+        test_responsive_scene_resize_keeps_tree()
+        test_responsive_scene_draw_order_cached()
+        test_responsive_scene_prunes_hidden_subtrees()
+        
+        print("\n" + "="*60)
+        print("✨ ALL TESTS PASSED! ✨")
+        print("="*60)
+        
+        return 0
+    
+    except AssertionError as e:
+        print(f"\n❌ TEST FAILED: {e}")
+        import traceback
+        traceback.print_exc()
+        return 1
+    except Exception as e:
+        print(f"\n❌ ERROR: {e}")
+        import traceback
+        traceback.print_exc()
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())